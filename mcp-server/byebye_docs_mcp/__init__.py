@@ -1,6 +1,16 @@
 """Byebye Docs MCP Server - MCP server for AI-first development design document templates."""
 
-from byebye_docs_mcp.server import main
-
-__version__ = "0.1.0"
+__version__ = "0.2.1"
 __all__ = ["main"]
+
+
+def main() -> None:
+    """Run the command line (the MCP server when no subcommand is given).
+
+    Submodules are imported only when called, so each command loads only what it uses.
+    """
+    import sys
+
+    from byebye_docs_mcp.cli import main as run_main
+
+    sys.exit(run_main())
@@ -0,0 +1 @@
+"""Benchmarks and performance checks for byebye-docs."""
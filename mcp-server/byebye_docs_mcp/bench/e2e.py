@@ -0,0 +1,363 @@
+"""End-to-end latency benchmark for diff, sync and extract.
+
+Generates a synthetic repository (see ``bench.synthetic``) plus
+``.agent/schemas`` docs that either match the code or drift from it, then
+runs ``DiffEngine.diff``, ``SyncManager.sync`` (preview and apply) and the
+``extract_from_code`` tool against it. Each run happens in a fresh process
+and reports wall time, exclusive time per stage (walk, parse, yaml_load,
+compare, serialize, write) and peak RSS. The report is JSON so it can be
+kept and compared across releases.
+
+Usage:
+    python -m byebye_docs_mcp.bench.e2e [--files 1000 10000] [--drift 0 0.1] [--runs 3]
+    python -m byebye_docs_mcp.bench.e2e --files 5000 --output bench-e2e.json
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from .synthetic import generate_repo
+
+SCENARIOS = ("diff", "sync_preview", "sync_apply", "extract")
+
+STAGES = ("walk", "parse", "yaml_load", "compare", "serialize", "write")
+
+# Corpus generated for each language
+CORPUS_BY_LANGUAGE = {"python": "python", "typescript": "typescript"}
+
+
+class StageTimer:
+    """Exclusive wall time per stage, collected by wrapping methods.
+
+    Time spent in a nested stage is charged to that stage only, so the
+    stage totals add up to at most the overall wall time.
+    """
+
+    def __init__(self):
+        """Initialize with no stages recorded."""
+        self.totals: dict[str, float] = defaultdict(float)
+        self._stack: list[list[Any]] = []
+        self._patched: list[tuple[type, str, Any]] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Charge the time spent in the block to a stage."""
+        self._stack.append([name, time.perf_counter(), 0.0])
+        try:
+            yield
+        finally:
+            name, start, nested = self._stack.pop()
+            elapsed = time.perf_counter() - start
+            self.totals[name] += elapsed - nested
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def wrap(self, owner: type, attr: str, name: str, materialize: bool = False) -> None:
+        """Time every call of ``owner.attr`` as stage ``name``.
+
+        Args:
+            owner: Class defining the method.
+            attr: Method name.
+            name: Stage to charge.
+            materialize: Consume a returned iterator inside the stage (for
+                lazy generators such as the file walk).
+        """
+        original = owner.__dict__[attr]
+
+        @functools.wraps(original)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.stage(name):
+                result = original(*args, **kwargs)
+                if materialize:
+                    result = iter(list(result))
+            return result
+
+        setattr(owner, attr, timed)
+        self._patched.append((owner, attr, original))
+
+    def restore(self) -> None:
+        """Undo all wrapping."""
+        for owner, attr, original in reversed(self._patched):
+            setattr(owner, attr, original)
+        self._patched.clear()
+
+
+def instrument(timer: StageTimer) -> None:
+    """Wrap the methods that make up each stage of a diff or sync."""
+    from ..core.diff_engine import DiffEngine
+    from ..core.sync_manager import SyncManager
+    from ..extractors.api_extractor import ApiExtractor
+    from ..extractors.entity_extractor import EntityExtractor
+    from ..parsers.base import CodeParser
+    from ..parsers.python_parser import PythonParser
+    from ..parsers.typescript_parser import TypeScriptParser
+
+    timer.wrap(CodeParser, "iter_source_files", "walk", materialize=True)
+    timer.wrap(PythonParser, "parse_file", "parse")
+    timer.wrap(TypeScriptParser, "parse_file", "parse")
+    timer.wrap(ApiExtractor, "load_existing_spec", "yaml_load")
+    timer.wrap(EntityExtractor, "load_existing_entities", "yaml_load")
+    timer.wrap(DiffEngine, "_compare", "compare")
+    timer.wrap(SyncManager, "_sync_api", "compare")
+    timer.wrap(SyncManager, "_sync_entities", "compare")
+    timer.wrap(ApiExtractor, "extract_to_openapi", "compare")
+    timer.wrap(EntityExtractor, "extract_to_entities_yaml", "compare")
+    timer.wrap(SyncManager, "_generate_diff_text", "serialize")
+    timer.wrap(ApiExtractor, "to_yaml", "serialize")
+    timer.wrap(EntityExtractor, "to_yaml", "serialize")
+    timer.wrap(SyncManager, "_apply_yaml_changes", "write")
+
+
+def peak_rss_mb() -> float | None:
+    """Get this process's peak resident set size in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_scenario(
+    project_root: str, code_path: str, scenario: str, language: str, parse_cache: bool
+) -> dict:
+    """Run one scenario in this process and return its timings.
+
+    Meant to be called in a fresh worker process so peak RSS and import
+    state belong to this run only.
+    """
+    os.environ["BYEBYE_DOCS_PARSE_CACHE"] = "1" if parse_cache else "0"
+    os.environ["BYEBYE_DOCS_PROJECT_PATH"] = project_root
+    # Import outside the timed region; startup cost is covered by bench.startup
+    from ..core import DiffEngine, SyncManager
+    from ..server import call_tool
+
+    root = Path(project_root)
+    timer = StageTimer()
+    instrument(timer)
+
+    start = time.perf_counter()
+    if scenario == "diff":
+        result = DiffEngine(root).diff(code_path, "all", language)
+        with timer.stage("serialize"):
+            text = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+    elif scenario in ("sync_preview", "sync_apply"):
+        mode = "apply" if scenario == "sync_apply" else "preview"
+        result = SyncManager(root).sync(code_path, None, mode, language)
+        with timer.stage("serialize"):
+            text = json.dumps(result.to_dict(), indent=2, ensure_ascii=False)
+    elif scenario == "extract":
+        # The tool serializes its own JSON response, so part of it lands in "other"
+        contents = asyncio.run(
+            call_tool("extract_from_code", {"code_path": code_path, "output_format": "yaml"})
+        )
+        text = contents[0].text
+    else:
+        raise ValueError(f"Unknown scenario: {scenario}")
+    wall = time.perf_counter() - start
+    timer.restore()
+
+    stages = {name: round(timer.totals.get(name, 0.0), 4) for name in STAGES}
+    stages["other"] = round(max(wall - sum(timer.totals.values()), 0.0), 4)
+    return {
+        "wall_seconds": round(wall, 4),
+        "stages": stages,
+        "output_bytes": len(text.encode("utf-8")),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def build_docs(project_root: Path, code_path: str, language: str) -> dict[str, Any]:
+    """Build api.yaml and entities.yaml specs that match the code exactly."""
+    from ..core import DiffEngine
+    from ..extractors import ApiExtractor, EntityExtractor
+
+    code_elements, errors = DiffEngine(project_root, persist_cache=False).get_code_elements(
+        code_path, language
+    )
+    if errors or code_elements is None:
+        raise RuntimeError(f"Failed to parse generated repo: {errors}")
+
+    return {
+        "api": ApiExtractor(project_root).extract_to_openapi(code_elements, None, False),
+        "entities": EntityExtractor(project_root).extract_to_entities_yaml(
+            code_elements, None, False
+        ),
+    }
+
+
+def drift_docs(specs: dict[str, Any], drift: float, seed: int) -> dict[str, Any]:
+    """Make docs drift from the code.
+
+    A ``drift`` share of documented paths and entities is dropped (added in
+    code), as many stale ones are added (removed from code) and the first
+    field type of as many surviving entities is changed (modified).
+    """
+    rng = random.Random(f"{seed}:drift")
+    api = dict(specs["api"])
+    entities_spec = dict(specs["entities"])
+
+    paths = dict(api.get("paths", {}))
+    dropped = rng.sample(sorted(paths), int(len(paths) * drift))
+    for path in dropped:
+        del paths[path]
+    for i in range(len(dropped)):
+        paths[f"/stale{i}"] = {"get": {"operationId": f"stale_{i}", "responses": {}}}
+    api["paths"] = paths
+
+    entities = [dict(e) for e in entities_spec.get("entities", [])]
+    count = int(len(entities) * drift)
+    rng.shuffle(entities)
+    entities = entities[count:]
+    for entity in entities[:count]:
+        fields = [dict(f) for f in entity.get("fields", [])]
+        if fields:
+            fields[0]["type"] = "binary"
+            entity["fields"] = fields
+    for i in range(count):
+        entities.append({"schema": f"Stale{i}", "fields": [{"name": "id", "type": "integer"}]})
+    entities_spec["entities"] = entities
+
+    return {"api": api, "entities": entities_spec}
+
+
+def write_docs(project_root: Path, texts: dict[str, str]) -> None:
+    """Write api.yaml and entities.yaml (resetting anything a previous apply changed)."""
+    schemas_dir = project_root / ".agent" / "schemas"
+    schemas_dir.mkdir(parents=True, exist_ok=True)
+    for name, text in texts.items():
+        (schemas_dir / f"{name}.yaml").write_text(text, encoding="utf-8")
+
+
+def summarize(samples: list[dict]) -> dict:
+    """Reduce repeated runs to min/median wall time and the median run's stages."""
+    ordered = sorted(samples, key=lambda s: s["wall_seconds"])
+    median_run = ordered[(len(ordered) - 1) // 2]
+    return {
+        "min_seconds": ordered[0]["wall_seconds"],
+        "median_seconds": round(statistics.median(s["wall_seconds"] for s in samples), 4),
+        "stages": median_run["stages"],
+        "peak_rss_mb": max((s["peak_rss_mb"] or 0.0) for s in samples) or None,
+        "output_bytes": median_run["output_bytes"],
+    }
+
+
+def run(
+    sizes: list[int],
+    drifts: list[float],
+    scenarios: list[str],
+    language: str,
+    runs: int,
+    seed: int,
+    parse_cache: bool = False,
+) -> dict:
+    """Run every scenario against each repo size and drift level.
+
+    Without the parse cache every run parses all files (cold); with it, a
+    discarded warm-up run fills the cache first.
+    """
+    from .. import __version__
+
+    results: list[dict] = []
+    context = multiprocessing.get_context("spawn")
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            corpus = CORPUS_BY_LANGUAGE[language]
+            generate_repo(root / "src", size, seed, [corpus])
+            code_path = f"src/{corpus}"
+            matching = build_docs(root, code_path, language)
+
+            for drift in drifts:
+                specs = drift_docs(matching, drift, seed) if drift else matching
+                texts = {
+                    name: yaml.dump(spec, allow_unicode=True, sort_keys=False)
+                    for name, spec in specs.items()
+                }
+
+                for scenario in scenarios:
+                    args = (tmp, code_path, scenario, language, parse_cache)
+                    samples = []
+                    for i in range(runs + parse_cache):
+                        write_docs(root, texts)
+                        with context.Pool(1) as pool:
+                            sample = pool.apply(run_scenario, args)
+                        if i >= parse_cache:
+                            samples.append(sample)
+                    results.append(
+                        {
+                            "scenario": scenario,
+                            "files": size,
+                            "drift": drift,
+                            "doc_bytes": sum(len(t.encode("utf-8")) for t in texts.values()),
+                            **summarize(samples),
+                        }
+                    )
+
+    return {
+        "benchmark": "e2e",
+        "version": __version__,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "language": language,
+        "runs": runs,
+        "seed": seed,
+        "parse_cache": parse_cache,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the end-to-end benchmark and print (or write) a JSON report."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000])
+    arg_parser.add_argument(
+        "--drift", type=float, nargs="+", default=[0.0, 0.1], help="share of docs out of sync"
+    )
+    arg_parser.add_argument("--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    arg_parser.add_argument("--language", choices=list(CORPUS_BY_LANGUAGE), default="python")
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--parse-cache", action="store_true", help="measure warm runs")
+    arg_parser.add_argument("--output", type=Path, help="write the JSON report to this file")
+    args = arg_parser.parse_args(argv)
+
+    report = run(
+        args.files,
+        args.drift,
+        args.scenario,
+        args.language,
+        args.runs,
+        args.seed,
+        args.parse_cache,
+    )
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n", encoding="utf-8")
+    print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""Benchmark history store and regression check.
+
+Stores benchmark reports (the JSON printed by ``bench.e2e``,
+``bench.synthetic``, ``bench.startup``, ``bench.interface_fields`` and
+``bench.parse_fuzz``) with the machine fingerprint and git commit they ran
+on, and compares a new report against a stored baseline. ``compare`` exits with status 1 when any
+metric regressed by more than its threshold, so it can gate upgrades.
+
+Metrics whose name ends in ``_seconds``/``_ms``/``_mb`` (or that are stage
+timings) are lower-is-better, names ending in ``_per_sec`` higher-is-better;
+counts and sizes are stored but not compared.
+
+Usage:
+    python -m byebye_docs_mcp.bench.history record bench-e2e.json
+    python -m byebye_docs_mcp.bench.history compare bench-e2e.json --threshold 0.1
+    python -m byebye_docs_mcp.bench.history compare new.json --metric "diff*=0.2" --record
+    python -m byebye_docs_mcp.bench.history list
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+HISTORY_VERSION = 1
+
+DEFAULT_HISTORY_PATH = Path(".agent") / ".cache" / "bench_history.json"
+
+# Result fields that identify a measurement rather than being one
+ID_FIELDS = ("scenario", "corpus", "parser", "size", "files", "drift", "fields")
+
+
+def machine_fingerprint() -> dict[str, Any]:
+    """Describe this machine; runs are only compared with runs from the same fingerprint."""
+    info = {
+        "node": platform.node(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+    digest = hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()
+    return {"fingerprint": digest[:12], **info, "python": platform.python_version()}
+
+
+def current_commit() -> str | None:
+    """Get the git commit of the working directory, if any."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def flatten_metrics(report: dict[str, Any]) -> dict[str, float]:
+    """Turn a benchmark report into a flat {metric name: value} map.
+
+    Each entry of ``results`` is labelled by its identifying fields, e.g.
+    ``diff[files=1000,drift=0.1].median_seconds``; nested dicts such as
+    ``stages`` become ``...stages.parse``.
+    """
+    metrics: dict[str, float] = {}
+
+    def add(prefix: str, data: dict[str, Any]) -> None:
+        for key, value in data.items():
+            name = f"{prefix}{key}"
+            if isinstance(value, bool):
+                continue
+            if isinstance(value, (int, float)):
+                metrics[name] = float(value)
+            elif isinstance(value, dict):
+                add(f"{name}.", value)
+
+    top_level = {k: v for k, v in report.items() if k not in ("results", "seed", "runs")}
+    add("", top_level)
+
+    for result in report.get("results", []):
+        if not isinstance(result, dict):
+            continue
+        label_key = next((k for k in ("scenario", "corpus") if k in result), None)
+        label = str(result[label_key]) if label_key else "result"
+        ids = [f"{k}={result[k]}" for k in ID_FIELDS if k in result and k != label_key]
+        label = f"{label}[{','.join(ids)}]" if ids else label
+        add(f"{label}.", {k: v for k, v in result.items() if k not in ID_FIELDS})
+
+    return metrics
+
+
+def metric_direction(name: str) -> int:
+    """Get +1 if higher is better, -1 if lower is better, 0 if not compared."""
+    leaf = name.rsplit(".", 1)[-1]
+    if leaf.endswith("_per_sec"):
+        return 1
+    if leaf.endswith(("_seconds", "_ms", "_mb")) or leaf == "seconds" or ".stages." in name:
+        return -1
+    return 0
+
+
+class BenchmarkHistory:
+    """JSON file of recorded benchmark runs."""
+
+    def __init__(self, path: Path):
+        """Initialize history stored at a path."""
+        self.path = path
+        self.runs: list[dict[str, Any]] = []
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == HISTORY_VERSION:
+            self.runs = data.get("runs", [])
+
+    def record(self, report: dict[str, Any], commit: str | None = None) -> dict[str, Any]:
+        """Add a run for a report and save the history."""
+        run = {
+            "id": len(self.runs) + 1,
+            "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            "benchmark": report_name(report),
+            "commit": commit,
+            "version": report.get("version"),
+            "machine": machine_fingerprint(),
+            "metrics": flatten_metrics(report),
+        }
+        self.runs.append(run)
+        self.save()
+        return run
+
+    def save(self) -> None:
+        """Write the history atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": HISTORY_VERSION, "runs": self.runs}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def find(
+        self, benchmark: str, baseline: str = "latest", fingerprint: str | None = None
+    ) -> dict[str, Any] | None:
+        """Find a baseline run by id, or the latest run of a benchmark.
+
+        Args:
+            benchmark: Benchmark name the run must have.
+            baseline: Run id or "latest".
+            fingerprint: Only consider runs from this machine (None: any machine).
+        """
+        if baseline != "latest":
+            return next((r for r in self.runs if str(r["id"]) == baseline), None)
+
+        for run in reversed(self.runs):
+            if run["benchmark"] != benchmark:
+                continue
+            if fingerprint and run["machine"]["fingerprint"] != fingerprint:
+                continue
+            return run
+        return None
+
+
+def report_name(report: dict[str, Any]) -> str:
+    """Get the name of the benchmark that produced a report."""
+    return str(report.get("benchmark", "unknown"))
+
+
+def compare(
+    baseline: dict[str, float],
+    candidate: dict[str, float],
+    threshold: float,
+    metric_thresholds: dict[str, float] | None = None,
+    min_seconds: float = 0.0,
+) -> dict[str, Any]:
+    """Compare candidate metrics with baseline metrics.
+
+    Args:
+        baseline: Baseline metrics.
+        candidate: Candidate metrics.
+        threshold: Allowed relative change in the bad direction (0.1 = 10%).
+        metric_thresholds: Per-metric thresholds keyed by glob pattern; the
+            first matching pattern wins.
+        min_seconds: Ignore time regressions smaller than this many seconds.
+
+    Returns:
+        Dict with per-metric comparisons and the list of regressions.
+    """
+    comparisons = []
+    for name in sorted(baseline.keys() & candidate.keys()):
+        direction = metric_direction(name)
+        if direction == 0:
+            continue
+
+        allowed = threshold
+        for pattern, value in (metric_thresholds or {}).items():
+            if fnmatch.fnmatchcase(name, pattern):
+                allowed = value
+                break
+
+        old, new = baseline[name], candidate[name]
+        change = (new - old) / old if old else 0.0
+        regressed = -direction * change > allowed
+        if regressed and direction < 0 and min_seconds:
+            delta = new - old
+            if name.endswith("_ms"):
+                delta /= 1000
+            if not name.endswith("_mb") and delta < min_seconds:
+                regressed = False
+
+        comparisons.append(
+            {
+                "metric": name,
+                "baseline": old,
+                "candidate": new,
+                "change": round(change, 4),
+                "threshold": allowed,
+                "regressed": regressed,
+            }
+        )
+
+    return {
+        "compared": len(comparisons),
+        "regressions": [c for c in comparisons if c["regressed"]],
+        "comparisons": comparisons,
+    }
+
+
+def parse_metric_thresholds(values: list[str]) -> dict[str, float]:
+    """Parse ``PATTERN=THRESHOLD`` arguments."""
+    thresholds = {}
+    for value in values:
+        pattern, sep, number = value.rpartition("=")
+        if not sep or not pattern:
+            raise argparse.ArgumentTypeError(f"expected PATTERN=THRESHOLD, got {value!r}")
+        thresholds[pattern] = float(number)
+    return thresholds
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """Read a benchmark report from a JSON file ("-" for stdin)."""
+    text = sys.stdin.read() if str(path) == "-" else path.read_text(encoding="utf-8")
+    return json.loads(text)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Record, compare or list benchmark runs."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH)
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    record_parser = commands.add_parser("record", help="store a benchmark report")
+    record_parser.add_argument("report", type=Path, help="report JSON file, or - for stdin")
+    record_parser.add_argument("--commit", help="commit to record (defaults to git HEAD)")
+
+    compare_parser = commands.add_parser("compare", help="compare a report with a baseline")
+    compare_parser.add_argument("report", type=Path, help="report JSON file, or - for stdin")
+    compare_parser.add_argument("--baseline", default="latest", help="run id or 'latest'")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument(
+        "--metric", action="append", default=[], help="per-metric PATTERN=THRESHOLD override"
+    )
+    compare_parser.add_argument("--min-seconds", type=float, default=0.005)
+    compare_parser.add_argument(
+        "--any-machine", action="store_true", help="allow a baseline from another machine"
+    )
+    compare_parser.add_argument("--record", action="store_true", help="record the report too")
+    compare_parser.add_argument("--commit", help="commit to record (defaults to git HEAD)")
+
+    commands.add_parser("list", help="list recorded runs")
+    args = arg_parser.parse_args(argv)
+
+    history = BenchmarkHistory(args.history)
+
+    if args.command == "list":
+        for run in history.runs:
+            print(
+                f"{run['id']:>4}  {run['recorded_at']}  {run['benchmark']:<16} "
+                f"{(run['commit'] or '-')[:10]:<10}  {run['machine']['fingerprint']}  "
+                f"{len(run['metrics'])} metrics"
+            )
+        return 0
+
+    report = load_report(args.report)
+
+    if args.command == "record":
+        run = history.record(report, args.commit or current_commit())
+        print(json.dumps({"recorded": run["id"], "metrics": len(run["metrics"])}))
+        return 0
+
+    fingerprint = None if args.any_machine else machine_fingerprint()["fingerprint"]
+    baseline = history.find(report_name(report), args.baseline, fingerprint)
+    if baseline is None:
+        result: dict[str, Any] = {"error": "No baseline run found"}
+        if args.record:
+            # The first recorded run becomes the baseline for the next one
+            result["recorded"] = history.record(report, args.commit or current_commit())["id"]
+        print(json.dumps({**result, "benchmark": report_name(report)}))
+        return 0 if args.record else 2
+
+    result = compare(
+        baseline["metrics"],
+        flatten_metrics(report),
+        args.threshold,
+        parse_metric_thresholds(args.metric),
+        args.min_seconds,
+    )
+    result["baseline"] = {k: baseline[k] for k in ("id", "commit", "recorded_at")}
+    if args.record:
+        result["recorded"] = history.record(report, args.commit or current_commit())["id"]
+
+    print(json.dumps(result, indent=2))
+    return 1 if result["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Benchmark TypeScript interface field extraction on large DTO interfaces.
+
+Builds interfaces with hundreds to thousands of fields (including names that
+are prefixes of each other), checks that optionality is detected per field
+and reports how parse time scales with the field count.
+
+Usage:
+    python -m byebye_docs_mcp.bench.interface_fields [--fields 100 500 2000] [--bound 1.0]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ..parsers import TypeScriptParser
+
+FIELD_TYPES = ["string", "number", "boolean", "Date", "string[]", "string | null"]
+
+
+def build_interface(name: str, field_count: int) -> tuple[str, set[str]]:
+    """Build an interface source and the set of fields expected to be nullable.
+
+    Every third field is optional (``name?: type``); field ``f{i}`` is a prefix
+    of ``f{i}0`` and friends, which the old split-based check got wrong.
+    """
+    lines = [f"export interface {name} {{"]
+    nullable: set[str] = set()
+    for i in range(field_count):
+        field_name = f"f{i}"
+        field_type = FIELD_TYPES[i % len(FIELD_TYPES)]
+        optional = i % 3 == 0
+        if optional or "null" in field_type:
+            nullable.add(field_name)
+        lines.append(f"  {field_name}{'?' if optional else ''}: {field_type};")
+    lines.append("}")
+    return "\n".join(lines) + "\n", nullable
+
+
+def run(field_counts: list[int], bound: float) -> dict:
+    """Parse one interface per field count and report timings and mismatches."""
+    results: list[dict] = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        parser = TypeScriptParser(root, parse_time_budget=0)
+
+        for count in field_counts:
+            source, expected = build_interface(f"Dto{count}", count)
+            file_path = root / f"dto_{count}.ts"
+            file_path.write_text(source, encoding="utf-8")
+
+            start = time.perf_counter()
+            elements = parser.parse_file(file_path)
+            elapsed = time.perf_counter() - start
+
+            fields = elements.entities[0].fields if elements.entities else []
+            actual = {f.name for f in fields if f.nullable}
+            results.append(
+                {
+                    "fields": count,
+                    "parsed_fields": len(fields),
+                    "seconds": round(elapsed, 4),
+                    "us_per_field": round(elapsed / max(count, 1) * 1e6, 2),
+                    "nullable_mismatches": len(actual ^ expected),
+                }
+            )
+
+    return {
+        "benchmark": "interface_fields",
+        "bound_seconds": bound,
+        "results": results,
+        "over_bound": [r for r in results if r["seconds"] > bound],
+        "incorrect": [
+            r for r in results if r["nullable_mismatches"] or r["parsed_fields"] != r["fields"]
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark and exit non-zero on slow or incorrect results."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument(
+        "--fields", type=int, nargs="+", default=[100, 300, 1000, 3000, 10000]
+    )
+    arg_parser.add_argument("--bound", type=float, default=1.0, help="max seconds per file")
+    args = arg_parser.parse_args(argv)
+
+    report = run(args.fields, args.bound)
+    print(json.dumps(report, indent=2))
+    return 1 if report["over_bound"] or report["incorrect"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""In-process MCP load test with concurrent simulated clients.
+
+Drives the server over in-memory streams with N concurrent clients, each
+issuing a seeded random mix of ``diff_code_docs``, ``get_section``,
+``validate_document`` and resource reads against a synthetic project. By
+default all clients share one session, like the bursts of tool calls from a
+single agent; ``--per-client-sessions`` gives every client its own session.
+
+Reports p50/p95/p99 latency and throughput per operation, plus event-loop
+lag: a probe task that wakes up every few milliseconds records how late it
+runs, which shows how long handlers block the loop.
+
+Usage:
+    python -m byebye_docs_mcp.bench.load [--clients 8] [--requests 50] [--files 200]
+    python -m byebye_docs_mcp.bench.load --mix diff_code_docs=1 get_section=10
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any
+
+import anyio
+import yaml
+
+from .e2e import build_docs, write_docs
+from .synthetic import generate_repo
+
+DEFAULT_MIX = {
+    "diff_code_docs": 1,
+    "get_section": 4,
+    "validate_document": 3,
+    "read_resource": 4,
+}
+
+# How often the event-loop lag probe wakes up (seconds)
+LAG_PROBE_INTERVAL = 0.005
+
+
+def prepare_project(root: Path, files: int, sections: int, seed: int) -> dict[str, Any]:
+    """Write a synthetic project and return the arguments the clients use."""
+    generate_repo(root / "src", files, seed, ["python"])
+    code_path = "src/python"
+    specs = build_docs(root, code_path, "python")
+    write_docs(root, {name: yaml.dump(spec, sort_keys=False) for name, spec in specs.items()})
+
+    design = ["# Design", ""]
+    for i in range(sections):
+        design += [f"## Section {i}", "", f"Notes for part {i} of the system. " * 20, ""]
+    design_path = root / ".agent" / "design.md"
+    design_path.write_text("\n".join(design), encoding="utf-8")
+
+    architecture = {
+        "version": "1.0",
+        "system": {"name": "synthetic", "style": "modular monolith"},
+        "components": {f"component_{i}": {"responsibility": f"part {i}"} for i in range(sections)},
+    }
+    (root / ".agent" / "architecture.yaml").write_text(
+        yaml.dump(architecture, sort_keys=False), encoding="utf-8"
+    )
+
+    first_path = next(iter(specs["api"].get("paths", {})), "/")
+    first_method = next(iter(specs["api"].get("paths", {}).get(first_path, {"get": None})))
+    entities = specs["entities"].get("entities", [])
+    resources = ["docs://list", "project://current", "template://structure"]
+    resources.append(f"docs://api/{first_method.upper()}{first_path}")
+    if entities:
+        resources.append(f"docs://entities/{entities[0]['schema']}")
+
+    return {
+        "code_path": code_path,
+        "design_path": ".agent/design.md",
+        "sections": [f"Section {i}" for i in range(sections)],
+        "validate_paths": [".agent/architecture.yaml", ".agent/schemas/api.yaml"],
+        "resources": resources,
+    }
+
+
+async def issue(session: Any, operation: str, rng: random.Random, fixtures: dict) -> bool:
+    """Send one request; return False if the server reported an error."""
+    if operation == "read_resource":
+        await session.read_resource(rng.choice(fixtures["resources"]))
+        return True
+
+    if operation == "diff_code_docs":
+        arguments = {"code_path": fixtures["code_path"]}
+    elif operation == "get_section":
+        arguments = {
+            "document_path": fixtures["design_path"],
+            "section_name": rng.choice(fixtures["sections"]),
+        }
+    elif operation == "validate_document":
+        arguments = {"document_path": rng.choice(fixtures["validate_paths"])}
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+
+    result = await session.call_tool(operation, arguments)
+    return not result.isError
+
+
+async def simulated_client(
+    session: Any,
+    rng: random.Random,
+    requests: int,
+    mix: dict[str, float],
+    fixtures: dict,
+    latencies: dict[str, list[float]],
+    errors: dict[str, int],
+) -> None:
+    """Issue a random mix of requests back to back."""
+    operations = list(mix)
+    weights = list(mix.values())
+    for _ in range(requests):
+        operation = rng.choices(operations, weights)[0]
+        start = time.perf_counter()
+        try:
+            ok = await issue(session, operation, rng, fixtures)
+        except Exception:
+            ok = False
+        latencies[operation].append(time.perf_counter() - start)
+        if not ok:
+            errors[operation] += 1
+
+
+async def probe_loop_lag(lags: list[float], stop: anyio.Event) -> None:
+    """Record how late a periodic wake-up runs while the load test is active."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await anyio.sleep(LAG_PROBE_INTERVAL)
+        lags.append(max(time.perf_counter() - start - LAG_PROBE_INTERVAL, 0.0))
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of a list of values (q in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def latency_summary(values: list[float], wall: float) -> dict[str, float]:
+    """Summarize latencies (milliseconds) and throughput over the run's wall time."""
+    return {
+        "count": len(values),
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(max(values, default=0.0) * 1000, 2),
+        "throughput_per_sec": round(len(values) / wall, 2) if wall else 0.0,
+    }
+
+
+async def run_load(
+    clients: int,
+    requests: int,
+    mix: dict[str, float],
+    fixtures: dict,
+    seed: int,
+    per_client_sessions: bool,
+) -> dict[str, Any]:
+    """Run the simulated clients against the server and collect statistics."""
+    from mcp.shared.memory import create_connected_server_and_client_session
+
+    from ..server import server
+
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    lags: list[float] = []
+
+    async with AsyncExitStack() as stack:
+        session_count = clients if per_client_sessions else 1
+        sessions = [
+            await stack.enter_async_context(create_connected_server_and_client_session(server))
+            for _ in range(session_count)
+        ]
+
+        # Warm up: one request per operation so caches and imports are not measured
+        warmup_rng = random.Random(f"{seed}:warmup")
+        for operation in mix:
+            await issue(sessions[0], operation, warmup_rng, fixtures)
+
+        stop = anyio.Event()
+        start = time.perf_counter()
+        async with anyio.create_task_group() as probe_group:
+            probe_group.start_soon(probe_loop_lag, lags, stop)
+            async with anyio.create_task_group() as client_group:
+                for i in range(clients):
+                    client_group.start_soon(
+                        simulated_client,
+                        sessions[i % session_count],
+                        random.Random(f"{seed}:{i}"),
+                        requests,
+                        mix,
+                        fixtures,
+                        latencies,
+                        errors,
+                    )
+            wall = time.perf_counter() - start
+            stop.set()
+
+    all_latencies = [v for values in latencies.values() for v in values]
+    return {
+        "wall_seconds": round(wall, 3),
+        "total": latency_summary(all_latencies, wall),
+        "operations": {
+            operation: {**latency_summary(latencies[operation], wall), "errors": errors[operation]}
+            for operation in sorted(latencies)
+        },
+        "loop_lag": {
+            "p50_ms": round(percentile(lags, 50) * 1000, 2),
+            "p99_ms": round(percentile(lags, 99) * 1000, 2),
+            "max_ms": round(max(lags, default=0.0) * 1000, 2),
+        },
+    }
+
+
+def parse_mix(values: list[str]) -> dict[str, float]:
+    """Parse ``operation=weight`` arguments."""
+    mix = {}
+    for value in values:
+        operation, sep, weight = value.partition("=")
+        if not sep or operation not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                f"expected one of {', '.join(DEFAULT_MIX)} as OPERATION=WEIGHT, got {value!r}"
+            )
+        mix[operation] = float(weight)
+    return mix
+
+
+def run(
+    clients: int,
+    requests: int,
+    files: int,
+    sections: int,
+    mix: dict[str, float],
+    seed: int,
+    per_client_sessions: bool,
+) -> dict[str, Any]:
+    """Prepare a project and run the load test against it."""
+    with tempfile.TemporaryDirectory() as tmp:
+        fixtures = prepare_project(Path(tmp), files, sections, seed)
+        os.environ["BYEBYE_DOCS_PROJECT_PATH"] = tmp
+        stats = anyio.run(
+            run_load, clients, requests, mix, fixtures, seed, per_client_sessions
+        )
+
+    return {
+        "benchmark": "load",
+        "clients": clients,
+        "requests_per_client": requests,
+        "files": files,
+        "mix": mix,
+        "per_client_sessions": per_client_sessions,
+        "seed": seed,
+        **stats,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the load test and print a JSON report."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--clients", type=int, default=8)
+    arg_parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    arg_parser.add_argument("--files", type=int, default=200, help="synthetic source files")
+    arg_parser.add_argument("--sections", type=int, default=50, help="sections in the design doc")
+    arg_parser.add_argument("--mix", nargs="+", default=[], help="OPERATION=WEIGHT overrides")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--per-client-sessions", action="store_true")
+    args = arg_parser.parse_args(argv)
+
+    mix = {**DEFAULT_MIX, **parse_mix(args.mix)} if args.mix else dict(DEFAULT_MIX)
+    mix = {operation: weight for operation, weight in mix.items() if weight > 0}
+
+    report = run(
+        args.clients,
+        args.requests,
+        args.files,
+        args.sections,
+        mix,
+        args.seed,
+        args.per_client_sessions,
+    )
+    print(json.dumps(report, indent=2))
+    errors = sum(op["errors"] for op in report["operations"].values())
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
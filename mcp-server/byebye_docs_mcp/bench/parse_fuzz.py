@@ -0,0 +1,159 @@
+"""Fuzz/perf corpus check for the regex-based parsers.
+
+Generates adversarial and randomly mutated sources, parses each file and
+fails if any single file takes longer than a fixed bound.
+
+Usage:
+    python -m byebye_docs_mcp.bench.parse_fuzz [--size 50000] [--bound 1.0]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+from ..parsers import PythonParser, TypeScriptParser
+
+# Snippets that exercise every TypeScript pattern
+TS_FRAGMENTS = [
+    "@Controller('users')\n",
+    "@Get(':id')\n",
+    "@Post()\n",
+    "async findOne(@Param('id') id: string): Promise<User> {\n",
+    "app.get('/health', handler);\n",
+    "router.post(\"/orders/:orderId\", async (req, res) => {\n",
+    "const handler = async (req, res): Promise<void> => {\n",
+    "@Entity('users')\n",
+    "export class User extends BaseEntity implements Auditable {\n",
+    "@Column({ nullable: true })\n",
+    "@PrimaryGeneratedColumn('uuid')\n",
+    "  email?: string;\n",
+    "export interface UserDto {\n",
+    "export type OrderData = {\n",
+    "  readonly id: number;\n",
+    "}\n",
+    "(",
+    ")",
+    "{",
+    ":",
+    "'",
+    "  ",
+    "\n\n",
+]
+
+
+def adversarial_typescript(size: int) -> dict[str, str]:
+    """Build inputs that trigger catastrophic backtracking in naive patterns."""
+    return {
+        "unclosed_call.ts": "f(" + "a " * (size // 2),
+        "return_type_no_brace.ts": "f(): " + "x " * (size // 2),
+        "arrow_no_arrow.ts": "const f = async (): " + "T " * (size // 2),
+        "long_identifier.ts": "a" * size + "(",
+        "nested_calls.ts": "f(" * (size // 2),
+        "column_no_property.ts": "@Column(" + " " * size,
+        "column_repeated.ts": "@Column()\n" * (size // 10),
+        "column_type_run.ts": "@Column() x: " + "T " * (size // 2),
+        "nest_route_spaces.ts": "@Get(" + " " * size,
+        "blank_lines.ts": "interface AModel {\n" + "\n" * size + "}",
+        "property_spaces.ts": "interface AModel {\n  a" + " " * size + "}",
+        "interface_extends.ts": "interface A extends " + "B, " * (size // 3),
+        "class_implements.ts": "class A implements " + "B, " * (size // 3),
+        "unterminated_quote.ts": "app.get('" + "x" * size,
+        "entities_no_class.ts": "@Entity()\n" * (size // 10),
+        "entities_unclosed.ts": "@Entity()\nclass A {\n@Column() a: T;\n" * (size // 35),
+    }
+
+
+def adversarial_prisma(size: int) -> dict[str, str]:
+    """Build Prisma inputs with long whitespace runs and unterminated models."""
+    return {
+        "blank_fields.prisma": "model A {\n" + "  id Int\n" + "\n" * size + "}",
+        "spaces_field.prisma": "model A {\n  id" + " " * size + "Int\n}",
+        "unterminated.prisma": "model A {\n" + "  id Int\n" * (size // 8),
+    }
+
+
+def adversarial_python(size: int) -> dict[str, str]:
+    """Build large but valid Python inputs."""
+    fields = "\n".join(f"    field_{i}: str" for i in range(size // 20))
+    return {
+        "wide_model.py": f"class WideModel(BaseModel):\n{fields}\n",
+        "deep_nesting.py": "x = " + "[" * 50 + "]" * 50 + "\n",
+    }
+
+
+def random_typescript(seed: int, size: int) -> str:
+    """Build a random mix of TypeScript fragments."""
+    rng = random.Random(seed)
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        fragment = rng.choice(TS_FRAGMENTS)
+        parts.append(fragment)
+        length += len(fragment)
+    return "".join(parts)
+
+
+def build_corpus(root: Path, size: int, random_files: int) -> Iterator[Path]:
+    """Write the fuzz corpus under root and yield each file path."""
+    corpus: dict[str, str] = {}
+    corpus.update(adversarial_typescript(size))
+    corpus.update(adversarial_prisma(size))
+    corpus.update(adversarial_python(size))
+    for seed in range(random_files):
+        corpus[f"random_{seed}.ts"] = random_typescript(seed, size)
+
+    for name, content in corpus.items():
+        file_path = root / name
+        file_path.write_text(content, encoding="utf-8")
+        yield file_path
+
+
+def run(size: int, bound: float, random_files: int) -> dict:
+    """Parse every corpus file and report per-file timings."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        parsers = {
+            "typescript": TypeScriptParser(root),
+            "python": PythonParser(root),
+        }
+        timings: list[dict] = []
+
+        for file_path in build_corpus(root, size, random_files):
+            parser = parsers["python" if file_path.suffix == ".py" else "typescript"]
+            start = time.perf_counter()
+            parser.parse_file(file_path)
+            elapsed = time.perf_counter() - start
+            timings.append({"file": file_path.name, "seconds": round(elapsed, 4)})
+
+    timings.sort(key=lambda t: t["seconds"], reverse=True)
+    return {
+        "benchmark": "parse_fuzz",
+        "size": size,
+        "bound_seconds": bound,
+        "files": len(timings),
+        "max_seconds": timings[0]["seconds"] if timings else 0.0,
+        "over_bound": [t for t in timings if t["seconds"] > bound],
+        "slowest": timings[:5],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the fuzz corpus and exit non-zero if any file exceeds the bound."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=50_000, help="approx. bytes per file")
+    arg_parser.add_argument("--bound", type=float, default=1.0, help="max seconds per file")
+    arg_parser.add_argument("--random-files", type=int, default=20)
+    args = arg_parser.parse_args(argv)
+
+    report = run(args.size, args.bound, args.random_files)
+    print(json.dumps(report, indent=2))
+    return 1 if report["over_bound"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""Startup-time benchmark for the byebye-docs entry point.
+
+Imports the server module in fresh interpreters and reports wall-clock
+import time, which byebye_docs_mcp modules were loaded and the slowest
+imports according to ``python -X importtime``. It also measures cold start
+as an MCP client sees it: the time from launching the server process to
+receiving the response to its first ``initialize`` request.
+
+Usage:
+    python -m byebye_docs_mcp.bench.startup [--module byebye_docs_mcp.server] [--runs 10]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+# Run in the child: time the import and list the package modules it loaded
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = sorted(m for m in sys.modules if m.startswith("byebye_docs_mcp"))
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+# First message an MCP client sends over stdio
+_INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "byebye-docs-bench", "version": "0"},
+    },
+}
+
+SERVER_COMMAND = [sys.executable, "-m", "byebye_docs_mcp"]
+
+# Longest a child interpreter may take to import or answer (seconds)
+STARTUP_TIMEOUT = 60.0
+
+
+def measure_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and return timing and loaded modules."""
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=STARTUP_TIMEOUT,
+    )
+    return json.loads(completed.stdout)
+
+
+def measure_initialize(command: list[str], timeout: float = STARTUP_TIMEOUT) -> float:
+    """Launch the server and time until the initialize response arrives (seconds).
+
+    Raises:
+        RuntimeError: If the server exits, answers with something else or
+            does not answer within the timeout (it is killed either way).
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    try:
+        assert process.stdin and process.stdout
+        process.stdin.write(json.dumps(_INITIALIZE_REQUEST) + "\n")
+        process.stdin.flush()
+        # readline() has no timeout: read on a thread and stop waiting at the deadline
+        lines: list[str] = []
+        reader = threading.Thread(
+            target=lambda: lines.append(process.stdout.readline()),  # type: ignore[union-attr]
+            daemon=True,
+        )
+        reader.start()
+        reader.join(timeout)
+        elapsed = time.perf_counter() - start
+        timed_out = reader.is_alive()
+    finally:
+        process.kill()
+        process.wait()
+
+    if timed_out:
+        raise RuntimeError(f"no initialize response within {timeout:g}s")
+    response = lines[0]
+    if not response:
+        raise RuntimeError(f"server exited before answering (exit code {process.returncode})")
+    if '"id":1' not in response.replace(" ", ""):
+        raise RuntimeError(f"unexpected initialize response: {response!r}")
+    return elapsed
+
+
+def slowest_imports(module: str, top: int) -> list[dict]:
+    """Get the slowest imports (cumulative microseconds) from -X importtime."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=STARTUP_TIMEOUT,
+    )
+
+    imports = []
+    for line in completed.stderr.splitlines():
+        # "import time:      self [us] |  cumulative | imported package"
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        imports.append({"module": parts[2].strip(), "cumulative_us": int(parts[1])})
+
+    imports.sort(key=lambda i: i["cumulative_us"], reverse=True)
+    # A module can show up more than once (package and nested import); keep the largest
+    unique = {i["module"]: i for i in reversed(imports)}
+    return sorted(unique.values(), key=lambda i: i["cumulative_us"], reverse=True)[:top]
+
+
+def run(module: str, runs: int, top: int) -> dict:
+    """Measure import and cold-start time over several fresh interpreters."""
+    samples = [measure_import(module) for _ in range(runs)]
+    seconds = [s["seconds"] for s in samples]
+    initialize = [measure_initialize(SERVER_COMMAND) for _ in range(runs)]
+
+    return {
+        "benchmark": "startup",
+        "module": module,
+        "runs": runs,
+        "min_ms": round(min(seconds) * 1000, 1),
+        "median_ms": round(statistics.median(seconds) * 1000, 1),
+        "initialize_min_ms": round(min(initialize) * 1000, 1),
+        "initialize_median_ms": round(statistics.median(initialize) * 1000, 1),
+        "loaded_modules": samples[-1]["loaded"],
+        "slowest_imports": slowest_imports(module, top),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the startup benchmark and print a JSON report."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--module", default="byebye_docs_mcp.server")
+    arg_parser.add_argument("--runs", type=int, default=10)
+    arg_parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    args = arg_parser.parse_args(argv)
+
+    report = run(args.module, args.runs, args.top)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
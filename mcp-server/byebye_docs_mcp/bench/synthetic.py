@@ -0,0 +1,425 @@
+"""Synthetic-repo generator and parser throughput benchmark.
+
+Generates deterministic source trees (FastAPI, Flask, SQLAlchemy and
+Pydantic modules; Express, NestJS and TypeORM files; Prisma schemas) with
+a known number of endpoints and entities, then parses every file and
+reports files/sec, MB/sec and elements/sec per parser at each repo size.
+
+Usage:
+    python -m byebye_docs_mcp.bench.synthetic [--files 1000 10000 100000] [--seed 0]
+    python -m byebye_docs_mcp.bench.synthetic --files 5000 --keep /tmp/synthetic
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from ..parsers import ParserRegistry
+
+RESOURCES = [
+    "order",
+    "customer",
+    "invoice",
+    "product",
+    "user",
+    "payment",
+    "shipment",
+    "cart",
+    "review",
+    "coupon",
+    "account",
+    "address",
+    "warehouse",
+    "supplier",
+]
+
+# Files per directory, so large repos look like real trees rather than one flat directory
+FILES_PER_DIR = 100
+
+# Share of files that define nothing (utilities, helpers)
+HELPER_RATIO = 0.1
+
+# (SQLAlchemy column type, Pydantic annotation, TypeScript type, Prisma type)
+FIELD_TYPES = [
+    ("String(255)", "str", "string", "String"),
+    ("Integer", "int", "number", "Int"),
+    ("Boolean", "bool", "boolean", "Boolean"),
+    ("DateTime", "datetime", "Date", "DateTime"),
+    ("Float", "float", "number", "Float"),
+    ("Text", "str", "string", "String"),
+]
+
+FIELD_NAMES = [
+    "name",
+    "status",
+    "email",
+    "total",
+    "quantity",
+    "note",
+    "created_at",
+    "updated_at",
+    "customer_id",
+    "price",
+    "active",
+    "code",
+    "title",
+    "score",
+]
+
+# A generated file: (source, endpoint count, entity count)
+Generated = tuple[str, int, int]
+Generator = Callable[[random.Random, int], Generated]
+
+
+def _fields(rng: random.Random, low: int = 3, high: int = 10) -> list[tuple[str, int, bool]]:
+    """Pick distinct (field name, FIELD_TYPES index, optional) triples."""
+    names = rng.sample(FIELD_NAMES, rng.randint(low, high))
+    return [(name, rng.randrange(len(FIELD_TYPES)), rng.random() < 0.3) for name in names]
+
+
+def _crud_routes(count: int) -> list[tuple[str, str, str]]:
+    """Get the first ``count`` of six (method, path suffix, action) CRUD routes."""
+    routes = [
+        ("get", "", "list"),
+        ("post", "", "create"),
+        ("get", "/{id}", "get"),
+        ("put", "/{id}", "replace"),
+        ("patch", "/{id}", "update"),
+        ("delete", "/{id}", "delete"),
+    ]
+    return routes[:count]
+
+
+def fastapi_module(rng: random.Random, n: int) -> Generated:
+    """FastAPI router module with 2-6 CRUD endpoints."""
+    resource = f"{rng.choice(RESOURCES)}{n}"
+    routes = _crud_routes(rng.randint(2, 6))
+    lines = [
+        f'"""HTTP routes for {resource}."""',
+        "",
+        "from fastapi import APIRouter",
+        "",
+        "router = APIRouter()",
+    ]
+    for method, suffix, action in routes:
+        path = f"/{resource}s{suffix.replace('{id}', '{' + resource + '_id}')}"
+        args = f"{resource}_id: int" if suffix else "limit: int = 50, offset: int = 0"
+        lines += [
+            "",
+            "",
+            f'@router.{method}("{path}")',
+            f"async def {action}_{resource}({args}):",
+            f'    """{action.capitalize()} {resource}."""',
+            "    return {}",
+        ]
+    return "\n".join(lines) + "\n", len(routes), 0
+
+
+def flask_module(rng: random.Random, n: int) -> Generated:
+    """Flask blueprint module with 2-6 single-method routes."""
+    resource = f"{rng.choice(RESOURCES)}{n}"
+    routes = _crud_routes(rng.randint(2, 6))
+    lines = [
+        "from flask import Blueprint, jsonify",
+        "",
+        f'bp = Blueprint("{resource}", __name__)',
+    ]
+    for method, suffix, action in routes:
+        path = f"/{resource}s{suffix.replace('{id}', '<int:item_id>')}"
+        args = "item_id" if suffix else ""
+        lines += [
+            "",
+            "",
+            f'@bp.route("{path}", methods=["{method.upper()}"])',
+            f"def {action}_{resource}({args}):",
+            "    return jsonify({})",
+        ]
+    return "\n".join(lines) + "\n", len(routes), 0
+
+
+def sqlalchemy_module(rng: random.Random, n: int) -> Generated:
+    """SQLAlchemy declarative models, 1-3 per module."""
+    count = rng.randint(1, 3)
+    lines = [
+        "from sqlalchemy import Boolean, Column, DateTime, Float, Integer, String, Text",
+        "",
+        "from .base import Base",
+    ]
+    for i in range(count):
+        name = f"{rng.choice(RESOURCES).capitalize()}{n}x{i}"
+        lines += [
+            "",
+            "",
+            f"class {name}(Base):",
+            f'    """{name} table."""',
+            "",
+            f'    __tablename__ = "{name.lower()}"',
+            "",
+            "    id = Column(Integer, primary_key=True)",
+        ]
+        for field_name, type_index, optional in _fields(rng):
+            column_type = FIELD_TYPES[type_index][0]
+            lines.append(f"    {field_name} = Column({column_type}, nullable={optional})")
+    return "\n".join(lines) + "\n", 0, count
+
+
+def pydantic_module(rng: random.Random, n: int) -> Generated:
+    """Pydantic schemas, 1-3 per module."""
+    count = rng.randint(1, 3)
+    lines = ["from datetime import datetime", "", "from pydantic import BaseModel"]
+    for i in range(count):
+        name = f"{rng.choice(RESOURCES).capitalize()}{n}x{i}Schema"
+        lines += ["", "", f"class {name}(BaseModel):", f'    """{name}."""', ""]
+        for field_name, type_index, optional in _fields(rng):
+            annotation = FIELD_TYPES[type_index][1]
+            if optional:
+                lines.append(f"    {field_name}: {annotation} | None = None")
+            else:
+                lines.append(f"    {field_name}: {annotation}")
+    return "\n".join(lines) + "\n", 0, count
+
+
+def express_module(rng: random.Random, n: int) -> Generated:
+    """Express router with 2-6 routes."""
+    resource = f"{rng.choice(RESOURCES)}{n}"
+    routes = _crud_routes(rng.randint(2, 6))
+    lines = ["import { Router } from 'express';", "", "const router = Router();"]
+    for method, suffix, _ in routes:
+        path = f"/{resource}s{suffix.replace('{id}', ':id')}"
+        lines += [
+            "",
+            f"router.{method}('{path}', async (req, res) => {{",
+            "  res.json({ ok: true });",
+            "});",
+        ]
+    lines += ["", "export default router;"]
+    return "\n".join(lines) + "\n", len(routes), 0
+
+
+def nestjs_module(rng: random.Random, n: int) -> Generated:
+    """NestJS controller with 2-6 routes and a DTO interface."""
+    resource = f"{rng.choice(RESOURCES)}{n}"
+    name = resource.capitalize()
+    routes = _crud_routes(rng.randint(2, 6))
+    lines = [
+        "import { Body, Controller, Delete, Get, Param, Patch, Post, Put } from '@nestjs/common';",
+        "",
+        f"export interface {name}Dto {{",
+    ]
+    for field_name, type_index, optional in _fields(rng, 2, 6):
+        lines.append(f"  {field_name}{'?' if optional else ''}: {FIELD_TYPES[type_index][2]};")
+    lines += ["}", "", f"@Controller('{resource}s')", f"export class {name}Controller {{"]
+    for method, suffix, action in routes:
+        decorator_path = "':id'" if suffix else ""
+        args = "@Param('id') id: string" if suffix else f"@Body() body: {name}Dto"
+        lines += [
+            f"  @{method.capitalize()}({decorator_path})",
+            f"  async {action}({args}): Promise<{name}Dto> {{",
+            f"    return this.service.{action}();",
+            "  }",
+            "",
+        ]
+    lines.append("}")
+    return "\n".join(lines) + "\n", len(routes), 1
+
+
+def typeorm_module(rng: random.Random, n: int) -> Generated:
+    """TypeORM entity classes, 1-2 per file."""
+    count = rng.randint(1, 2)
+    lines = ["import { Column, Entity, PrimaryGeneratedColumn } from 'typeorm';"]
+    for i in range(count):
+        name = f"{rng.choice(RESOURCES).capitalize()}{n}x{i}"
+        lines += [
+            "",
+            f"@Entity('{name.lower()}')",
+            f"export class {name} {{",
+            "  @PrimaryGeneratedColumn()",
+            "  id: number;",
+        ]
+        for field_name, type_index, optional in _fields(rng):
+            options = "{ nullable: true }" if optional else ""
+            lines += [
+                "",
+                f"  @Column({options})",
+                f"  {field_name}{'?' if optional else ''}: {FIELD_TYPES[type_index][2]};",
+            ]
+        lines.append("}")
+    return "\n".join(lines) + "\n", 0, count
+
+
+def prisma_schema(rng: random.Random, n: int) -> Generated:
+    """Prisma schema with 1-4 models."""
+    count = rng.randint(1, 4)
+    lines = []
+    for i in range(count):
+        name = f"{rng.choice(RESOURCES).capitalize()}{n}x{i}"
+        lines += [f"model {name} {{", "  id Int @id @default(autoincrement())"]
+        for field_name, type_index, optional in _fields(rng):
+            lines.append(f"  {field_name} {FIELD_TYPES[type_index][3]}{'?' if optional else ''}")
+        lines += ["}", ""]
+    return "\n".join(lines), 0, count
+
+
+def python_helper(rng: random.Random, n: int) -> Generated:
+    """Python module without endpoints or entities."""
+    return f"def helper_{n}(value):\n    return value * {rng.randint(2, 9)}\n", 0, 0
+
+
+def typescript_helper(rng: random.Random, n: int) -> Generated:
+    """TypeScript module without endpoints or entities."""
+    factor = rng.randint(2, 9)
+    source = (
+        f"export function helper{n}(value: number): number {{\n"
+        f"  return value * {factor};\n}}\n"
+    )
+    return source, 0, 0
+
+
+# Per benchmarked parser: (language, file suffix, generators, helper generator)
+CORPORA: dict[str, tuple[str, str, list[Generator], Generator | None]] = {
+    "python": (
+        "python",
+        ".py",
+        [fastapi_module, flask_module, sqlalchemy_module, pydantic_module],
+        python_helper,
+    ),
+    "typescript": (
+        "typescript",
+        ".ts",
+        [express_module, nestjs_module, typeorm_module],
+        typescript_helper,
+    ),
+    "prisma": ("typescript", ".prisma", [prisma_schema], None),
+}
+
+
+def generate_repo(root: Path, files: int, seed: int = 0, corpora: list[str] | None = None) -> dict:
+    """Write a synthetic repository with ``files`` source files per corpus.
+
+    The output depends only on ``files``, ``seed`` and the corpus names.
+    Files go to ``root/<corpus>/d<NNNN>/`` with FILES_PER_DIR files per
+    directory.
+
+    Returns:
+        Manifest mapping corpus name to its file paths, total bytes and the
+        expected number of endpoints and entities.
+    """
+    manifest: dict[str, dict] = {}
+
+    for corpus in corpora or list(CORPORA):
+        _, suffix, generators, helper = CORPORA[corpus]
+        rng = random.Random(f"{seed}:{corpus}")
+        paths: list[Path] = []
+        total_bytes = endpoints = entities = 0
+
+        for n in range(files):
+            if helper is not None and rng.random() < HELPER_RATIO:
+                source, file_endpoints, file_entities = helper(rng, n)
+            else:
+                source, file_endpoints, file_entities = generators[n % len(generators)](rng, n)
+
+            directory = root / corpus / f"d{n // FILES_PER_DIR:04d}"
+            if n % FILES_PER_DIR == 0:
+                directory.mkdir(parents=True, exist_ok=True)
+            file_path = directory / f"m{n}{suffix}"
+            data = source.encode("utf-8")
+            file_path.write_bytes(data)
+
+            paths.append(file_path)
+            total_bytes += len(data)
+            endpoints += file_endpoints
+            entities += file_entities
+
+        manifest[corpus] = {
+            "paths": paths,
+            "bytes": total_bytes,
+            "endpoints": endpoints,
+            "entities": entities,
+        }
+
+    return manifest
+
+
+def measure_parser(root: Path, corpus: str, entry: dict) -> dict:
+    """Parse every file of a corpus and report throughput."""
+    language = CORPORA[corpus][0]
+    parser = ParserRegistry.get_parser(language, root)
+    if parser is None:
+        raise RuntimeError(f"No parser available for language: {language}")
+
+    endpoints = entities = 0
+    start = time.perf_counter()
+    for file_path in entry["paths"]:
+        elements = parser.parse_file(file_path)
+        endpoints += len(elements.api_endpoints)
+        entities += len(elements.entities)
+    elapsed = time.perf_counter() - start
+
+    files = len(entry["paths"])
+    megabytes = entry["bytes"] / 1e6
+    elements = endpoints + entities
+    return {
+        "corpus": corpus,
+        "parser": type(parser).__name__,
+        "files": files,
+        "megabytes": round(megabytes, 2),
+        "elements": elements,
+        "seconds": round(elapsed, 3),
+        "files_per_sec": round(files / elapsed, 1),
+        "mb_per_sec": round(megabytes / elapsed, 2),
+        "elements_per_sec": round(elements / elapsed, 1),
+        "mismatches": {
+            "endpoints": endpoints - entry["endpoints"],
+            "entities": entities - entry["entities"],
+        },
+    }
+
+
+def run(sizes: list[int], seed: int, corpora: list[str], keep: Path | None = None) -> dict:
+    """Generate a repo per size and measure each parser on it."""
+    results: list[dict] = []
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = keep / str(size) if keep else Path(tmp)
+            start = time.perf_counter()
+            manifest = generate_repo(root, size, seed, corpora)
+            generate_seconds = time.perf_counter() - start
+
+            for corpus in corpora:
+                result = measure_parser(root, corpus, manifest[corpus])
+                result["size"] = size
+                result["generate_seconds"] = round(generate_seconds, 2)
+                results.append(result)
+
+    return {
+        "benchmark": "synthetic",
+        "seed": seed,
+        "results": results,
+        "incorrect": [
+            r for r in results if r["mismatches"]["endpoints"] or r["mismatches"]["entities"]
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the throughput benchmark and exit non-zero on element count mismatches."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--files", type=int, nargs="+", default=[1000, 10000, 100000])
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--corpus", nargs="+", choices=list(CORPORA), default=list(CORPORA))
+    arg_parser.add_argument("--keep", type=Path, help="write repos here instead of a temp dir")
+    args = arg_parser.parse_args(argv)
+
+    report = run(args.files, args.seed, args.corpus, args.keep)
+    print(json.dumps(report, indent=2))
+    return 1 if report["incorrect"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Command line interface for CI and pre-commit hooks.
+
+Runs the diff, extract, sync and validate operations directly, without the
+MCP layer, printing JSON (or YAML for ``extract --format yaml``) to stdout.
+With ``--cache`` (or ``BYEBYE_DOCS_PARSE_CACHE=1``) parse results are kept
+in ``.agent/.cache``, the same cache the server uses; otherwise nothing is
+written to the project by read-only commands.
+Without a subcommand the MCP server is started on stdio.
+
+Exit codes:
+    0  in sync / valid / applied
+    1  drift found, sync preview has pending changes, or invalid documents
+    2  errors (missing paths, unreadable code, bad arguments)
+
+Usage:
+    byebye-docs diff src/ --doc-type api
+    byebye-docs sync src/ --mode apply
+    byebye-docs validate .agent/architecture.yaml
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+# Only argparse/json are imported up front; each command imports what it uses
+
+EXIT_OK = 0
+EXIT_DRIFT = 1
+EXIT_ERROR = 2
+
+
+def project_root(args: argparse.Namespace) -> Path:
+    """Get the project root from --project, the environment or the current directory."""
+    if args.project:
+        return Path(args.project)
+    return Path(os.environ.get("BYEBYE_DOCS_PROJECT_PATH") or Path.cwd())
+
+
+def print_json(data: Any) -> None:
+    """Print a command result as JSON."""
+    print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def print_setup_error(error: ValueError) -> int:
+    """Report a bad setting (e.g. BYEBYE_DOCS_PARSE_MODE) and return the error exit code."""
+    print_json({"success": False, "errors": [str(error)]})
+    return EXIT_ERROR
+
+
+def run_diff(args: argparse.Namespace) -> int:
+    """Compare code with the API/entity specs."""
+    from .core import DiffEngine
+    from .models.diff_result import result_payload
+
+    try:
+        diff_engine = DiffEngine(project_root(args), parse_mode=args.parse_mode)
+    except ValueError as e:
+        return print_setup_error(e)
+    result = diff_engine.diff(
+        args.code_path, args.doc_type, args.language, args.stats, args.slowest_files
+    )
+    print_json(result_payload(result))
+
+    if result.errors:
+        return EXIT_ERROR
+    return EXIT_DRIFT if result.summary.has_drift else EXIT_OK
+
+
+def run_extract(args: argparse.Namespace) -> int:
+    """Extract OpenAPI and entity specs from code."""
+    from .core import DiffEngine
+    from .extractors import ApiExtractor, EntityExtractor
+
+    root = project_root(args)
+    try:
+        diff_engine = DiffEngine(root, parse_mode=args.parse_mode)
+    except ValueError as e:
+        return print_setup_error(e)
+    code_elements, errors = diff_engine.get_code_elements(args.code_path, args.language)
+    if errors or code_elements is None:
+        print_json({"success": False, "errors": errors or ["Failed to parse code"]})
+        return EXIT_ERROR
+
+    extracted: dict[str, Any] = {}
+    yaml_documents = []
+    if args.type in ("api", "all"):
+        api_extractor = ApiExtractor(root)
+        existing_spec = (
+            api_extractor.load_existing_spec(root / ".agent" / "schemas" / "api.yaml")
+            if args.merge
+            else None
+        )
+        extracted["api"] = api_extractor.extract_to_openapi(
+            code_elements, existing_spec, args.merge
+        )
+        yaml_documents.append(api_extractor.to_yaml(extracted["api"]))
+
+    if args.type in ("entities", "all"):
+        entity_extractor = EntityExtractor(root)
+        existing_entities = (
+            entity_extractor.load_existing_entities(root / ".agent" / "schemas" / "entities.yaml")
+            if args.merge
+            else None
+        )
+        extracted["entities"] = entity_extractor.extract_to_entities_yaml(
+            code_elements, existing_entities, args.merge
+        )
+        yaml_documents.append(entity_extractor.to_yaml(extracted["entities"]))
+
+    for warning in code_elements.warnings:
+        print(f"warning: {warning}", file=sys.stderr)
+
+    if args.format == "yaml":
+        print("---\n".join(yaml_documents), end="")
+    else:
+        result: dict[str, Any] = {"success": True, "extracted": extracted}
+        if code_elements.warnings:
+            result["warnings"] = code_elements.warnings
+        print_json(result)
+    return EXIT_OK
+
+
+def run_sync(args: argparse.Namespace) -> int:
+    """Preview or apply spec updates from code."""
+    from .core import SyncManager
+    from .models.diff_result import result_payload
+
+    try:
+        sync_manager = SyncManager(project_root(args), parse_mode=args.parse_mode)
+    except ValueError as e:
+        return print_setup_error(e)
+    result = sync_manager.sync(
+        args.code_path,
+        args.target,
+        args.mode,
+        args.language,
+        args.stats,
+        args.slowest_files,
+    )
+    print_json(result_payload(result))
+
+    if not result.success or result.errors:
+        return EXIT_ERROR
+    if args.mode == "preview" and result.changes:
+        return EXIT_DRIFT
+    return EXIT_OK
+
+
+def run_validate(args: argparse.Namespace) -> int:
+    """Validate documents against their schemas."""
+    from .validation import validate_all_documents, validate_document_file
+
+    root = project_root(args)
+    if not args.documents:
+        try:
+            report = validate_all_documents(root, args.directory)
+        except ValueError as e:
+            print_json({"valid": False, "errors": [str(e)]})
+            return EXIT_ERROR
+        print_json(report)
+        return EXIT_OK if report["valid"] else EXIT_DRIFT
+
+    documents = []
+    missing = []
+    for doc_path in args.documents:
+        result = validate_document_file(root, doc_path)
+        if result is None:
+            missing.append(doc_path)
+        else:
+            documents.append({"path": doc_path, **result})
+    valid = all(d["valid"] for d in documents)
+    print_json({"valid": valid and not missing, "missing": missing, "documents": documents})
+
+    if missing:
+        return EXIT_ERROR
+    return EXIT_OK if valid else EXIT_DRIFT
+
+
+def package_version() -> str:
+    """Get the installed package version, falling back to the source tree's."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("byebye-docs-mcp")
+    except PackageNotFoundError:
+        from . import __version__
+
+        return __version__
+
+
+class VersionAction(argparse.Action):
+    """Print the package version, looking it up only when asked for."""
+
+    def __init__(self, option_strings: list[str], dest: str, **kwargs: Any):
+        super().__init__(
+            option_strings,
+            dest,
+            nargs=0,
+            default=argparse.SUPPRESS,
+            help="show the version and exit",
+        )
+
+    def __call__(self, parser: argparse.ArgumentParser, *args: Any) -> None:
+        print(f"{parser.prog} {package_version()}")
+        parser.exit()
+
+
+def non_negative_int(value: str) -> int:
+    """Parse an argument that must be an integer of 0 or more."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"expected a non-negative integer: {value!r}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser with one subcommand per operation."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--project", help="project root (default: $BYEBYE_DOCS_PROJECT_PATH or cwd)"
+    )
+
+    code = argparse.ArgumentParser(add_help=False, parents=[common])
+    code.add_argument("code_path", nargs="?", default="src/", help="code directory or file")
+    code.add_argument("--language", choices=["python", "typescript", "auto"], default="auto")
+    code.add_argument("--parse-mode", choices=["inline", "isolated"])
+    code.add_argument(
+        "--cache",
+        action="store_true",
+        help="keep the parse cache in .agent/.cache (same as BYEBYE_DOCS_PARSE_CACHE=1)",
+    )
+
+    timed = argparse.ArgumentParser(add_help=False)
+    timed.add_argument("--stats", action="store_true", help="include parse counters and timings")
+    timed.add_argument(
+        "--slowest-files",
+        type=non_negative_int,
+        default=0,
+        metavar="N",
+        help="report the N slowest files",
+    )
+
+    arg_parser = argparse.ArgumentParser(
+        prog="byebye-docs", description="Keep .agent docs in sync with code (no args: MCP server)"
+    )
+    arg_parser.add_argument("--version", action=VersionAction)
+    commands = arg_parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    diff = commands.add_parser(
+        "diff", parents=[code, timed], help="compare code with the API/entity specs"
+    )
+    diff.add_argument("--doc-type", choices=["api", "entities", "all"], default="all")
+    diff.set_defaults(run=run_diff)
+
+    extract = commands.add_parser("extract", parents=[code], help="extract specs from code")
+    extract.add_argument("--type", choices=["api", "entities", "all"], default="all")
+    extract.add_argument("--merge", action="store_true", help="merge with the existing specs")
+    extract.add_argument("--format", choices=["json", "yaml"], default="json")
+    extract.set_defaults(run=run_extract)
+
+    sync = commands.add_parser(
+        "sync", parents=[code, timed], help="preview or apply spec updates from code"
+    )
+    sync.add_argument("--mode", choices=["preview", "apply"], default="preview")
+    sync.add_argument(
+        "--target",
+        nargs="+",
+        metavar="DOC",
+        help="documents to sync (default: api.yaml entities.yaml)",
+    )
+    sync.set_defaults(run=run_sync)
+
+    validate = commands.add_parser(
+        "validate", parents=[common], help="validate documents against their schemas"
+    )
+    validate.add_argument("documents", nargs="*", help="documents to validate (default: all)")
+    validate.add_argument("--directory", default=".agent", help="directory validated by default")
+    validate.set_defaults(run=run_validate)
+
+    commands.add_parser("serve", help="run the MCP server on stdio (the default)")
+    return arg_parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run a subcommand, or the MCP server when none is given."""
+    args = build_parser().parse_args(argv)
+    if getattr(args, "cache", False):
+        os.environ["BYEBYE_DOCS_PARSE_CACHE"] = "1"
+    if args.command in (None, "serve"):
+        from .server import main as run_server
+
+        run_server()
+        return EXIT_OK
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,16 @@
 """Core functionality for code-document synchronization."""
 
 from .diff_engine import DiffEngine
+from .documents import Document, DocumentStore
+from .element_index import ElementIndex
+from .spec_index import SpecIndex
 from .sync_manager import SyncManager
 
 __all__ = [
     "DiffEngine",
+    "Document",
+    "DocumentStore",
+    "ElementIndex",
+    "SpecIndex",
     "SyncManager",
 ]
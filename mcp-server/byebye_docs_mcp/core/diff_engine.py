@@ -1,5 +1,7 @@
 """Engine for detecting differences between code and documentation."""
 
+import os
+import time
 from pathlib import Path
 from typing import Any
 
@@ -13,24 +15,63 @@ from ..models.diff_result import (
     DriftItem,
     DriftType,
     ElementType,
+    FileTiming,
+    OperationStats,
+    timed,
 )
 from ..parsers import ParserRegistry
+from ..parsers.cache import FileKeyIndex, ParseCache, memory_caches, persistent_cache_enabled
+from ..tracing import span
+
+# Ways to run the parsers: in this process, or in supervised worker processes
+PARSE_MODES = ("inline", "isolated")
 
 
 class DiffEngine:
     """Engine for detecting differences between code and documentation."""
 
-    def __init__(self, project_root: Path):
-        """Initialize diff engine with project root."""
+    def __init__(
+        self,
+        project_root: Path,
+        parse_mode: str | None = None,
+        persist_cache: bool | None = None,
+    ):
+        """Initialize diff engine with project root.
+
+        Args:
+            project_root: Project root directory.
+            parse_mode: "inline" (default) or "isolated" to parse in supervised
+                worker processes (defaults to BYEBYE_DOCS_PARSE_MODE).
+            persist_cache: Whether to keep the parse cache and reverse index in
+                .agent/.cache (defaults to BYEBYE_DOCS_PARSE_CACHE, off unless
+                set). Otherwise they are kept in memory for this process only.
+
+        Raises:
+            ValueError: If the parse mode is not "inline" or "isolated".
+        """
         self.project_root = project_root
         self.api_extractor = ApiExtractor(project_root)
         self.entity_extractor = EntityExtractor(project_root)
+        self.parse_mode = parse_mode or os.environ.get("BYEBYE_DOCS_PARSE_MODE", "inline")
+        if self.parse_mode not in PARSE_MODES:
+            raise ValueError(
+                f"Unknown parse mode: {self.parse_mode!r} (expected 'inline' or 'isolated')"
+            )
+        if persist_cache is None:
+            persist_cache = persistent_cache_enabled()
+        if persist_cache:
+            self.parse_cache = ParseCache(project_root)
+            self.file_keys = FileKeyIndex(project_root)
+        else:
+            self.parse_cache, self.file_keys = memory_caches(project_root)
 
     def diff(
         self,
         code_path: str,
         doc_type: str = "all",
         language: str = "auto",
+        include_stats: bool = False,
+        slowest_files: int = 0,
     ) -> DiffResult:
         """Compare code with documentation and return differences.
 
@@ -38,63 +79,119 @@ class DiffEngine:
             code_path: Path to code directory/file (relative to project root).
             doc_type: Type of documentation to compare ("api", "entities", "all").
             language: Programming language ("python", "auto").
+            include_stats: Collect file counts and stage timings into result.stats.
+            slowest_files: Also report the N files that took longest to parse
+                (implies include_stats).
 
         Returns:
             DiffResult containing all detected differences.
         """
-        result = DiffResult()
-        code_dir = self.project_root / code_path
+        stats = None
+        if include_stats or slowest_files:
+            stats = OperationStats(slowest_files=slowest_files)
+        result = DiffResult(stats=stats)
 
-        if not code_dir.exists():
-            result.errors.append(f"Code path not found: {code_path}")
+        # Parse code
+        code_elements, errors = self.get_code_elements(code_path, language, result.stats)
+        if errors or code_elements is None:
+            result.errors.extend(errors)
             return result
 
-        # Detect or validate language
-        if language == "auto":
-            detected = ParserRegistry.detect_language(code_dir)
-            if not detected:
-                result.errors.append("Could not detect programming language")
-                return result
-            language = detected
+        self._compare(result, code_elements, doc_type)
+        return result
 
-        # Get parser for the language
-        parser = ParserRegistry.get_parser(language, self.project_root)
-        if not parser:
-            result.errors.append(f"No parser available for language: {language}")
-            return result
+    def impact(
+        self,
+        files: list[str],
+        code_path: str | None = None,
+        doc_type: str = "all",
+        language: str = "auto",
+    ) -> dict[str, Any]:
+        """Find the documented elements a set of changed files can affect.
 
-        # Parse code
-        if code_dir.is_file():
-            code_elements = parser.parse_file(code_dir)
+        The answer comes from the file-to-key index. With a code path, the
+        code is parsed first (unchanged files come from the parse cache) and
+        a diff restricted to the affected keys is included; keys the files
+        defined before the change are kept so removals are reported too.
+
+        Args:
+            files: Changed files, relative to the project root.
+            code_path: Code directory to diff against (optional).
+            doc_type: Type of documentation to compare ("api", "entities", "all").
+            language: Programming language.
+
+        Returns:
+            Dict with affected endpoint and entity keys, the per-file
+            breakdown, unindexed files and (with a code path) the scoped diff.
+        """
+        before = self.file_keys.lookup(files)
+        if not code_path:
+            return before
+
+        result = DiffResult()
+        code_elements, errors = self.get_code_elements(code_path, language)
+        after = self.file_keys.lookup(files)
+
+        impact = {
+            **after,
+            "endpoints": sorted(set(before["endpoints"]) | set(after["endpoints"])),
+            "entities": sorted(set(before["entities"]) | set(after["entities"])),
+        }
+        if errors or code_elements is None:
+            result.errors.extend(errors)
         else:
-            code_elements = parser.parse_directory(code_dir)
+            keys = set(impact["endpoints"]) | set(impact["entities"])
+            self._compare(result, code_elements, doc_type, keys)
+
+        impact["diff"] = result.to_dict()
+        return impact
+
+    def _compare(
+        self,
+        result: DiffResult,
+        code_elements: CodeElements,
+        doc_type: str,
+        keys: set[str] | None = None,
+    ) -> None:
+        """Compare parsed code with documentation, optionally only for some keys."""
+        result.warnings.extend(code_elements.warnings)
 
         # Compare with documentation
-        if doc_type in ("api", "all"):
-            api_diffs = self._diff_api(code_elements)
-            result.details.extend(api_diffs)
+        with timed(result.stats, "compare"):
+            if doc_type in ("api", "all"):
+                with span("diff_api", endpoints=len(code_elements.api_endpoints)):
+                    api_diffs = self._diff_api(code_elements, keys, result.stats)
+                result.details.extend(api_diffs)
 
-        if doc_type in ("entities", "all"):
-            entity_diffs = self._diff_entities(code_elements)
-            result.details.extend(entity_diffs)
+            if doc_type in ("entities", "all"):
+                with span("diff_entities", entities=len(code_elements.entities)):
+                    entity_diffs = self._diff_entities(code_elements, keys, result.stats)
+                result.details.extend(entity_diffs)
 
         # Calculate summary
         result.summary = self._calculate_summary(result.details)
         result.status = "drift_detected" if result.summary.has_drift else "in_sync"
 
-        return result
-
-    def _diff_api(self, code_elements: CodeElements) -> list[DriftItem]:
+    def _diff_api(
+        self,
+        code_elements: CodeElements,
+        keys: set[str] | None = None,
+        stats: OperationStats | None = None,
+    ) -> list[DriftItem]:
         """Compare API endpoints between code and documentation."""
         diffs: list[DriftItem] = []
+        code_endpoints = [
+            ep for ep in code_elements.api_endpoints if keys is None or ep.unique_key() in keys
+        ]
 
         # Load existing API spec
         api_path = self.project_root / ".agent" / "schemas" / "api.yaml"
-        existing_spec = self.api_extractor.load_existing_spec(api_path)
+        with timed(stats, "yaml_load"):
+            existing_spec = self.api_extractor.load_existing_spec(api_path)
 
         if not existing_spec:
             # No existing spec - all code endpoints are new
-            for endpoint in code_elements.api_endpoints:
+            for endpoint in code_endpoints:
                 diffs.append(
                     DriftItem(
                         element_type=ElementType.API_ENDPOINT,
@@ -113,8 +210,12 @@ class DiffEngine:
         doc_endpoints = self.api_extractor.get_endpoints_from_spec(existing_spec)
 
         # Build lookup maps
-        code_by_key = {ep.unique_key(): ep for ep in code_elements.api_endpoints}
-        doc_by_key = {ep.unique_key(): ep for ep in doc_endpoints}
+        code_by_key = {ep.unique_key(): ep for ep in code_endpoints}
+        doc_by_key = {
+            ep.unique_key(): ep
+            for ep in doc_endpoints
+            if keys is None or ep.unique_key() in keys
+        }
 
         # Find endpoints in code but not in docs
         for key, endpoint in code_by_key.items():
@@ -190,17 +291,26 @@ class DiffEngine:
 
         return changes
 
-    def _diff_entities(self, code_elements: CodeElements) -> list[DriftItem]:
+    def _diff_entities(
+        self,
+        code_elements: CodeElements,
+        keys: set[str] | None = None,
+        stats: OperationStats | None = None,
+    ) -> list[DriftItem]:
         """Compare entities between code and documentation."""
         diffs: list[DriftItem] = []
+        code_entities = [
+            e for e in code_elements.entities if keys is None or e.unique_key() in keys
+        ]
 
         # Load existing entities spec
         entities_path = self.project_root / ".agent" / "schemas" / "entities.yaml"
-        existing_spec = self.entity_extractor.load_existing_entities(entities_path)
+        with timed(stats, "yaml_load"):
+            existing_spec = self.entity_extractor.load_existing_entities(entities_path)
 
         if not existing_spec:
             # No existing spec - all code entities are new
-            for entity in code_elements.entities:
+            for entity in code_entities:
                 diffs.append(
                     DriftItem(
                         element_type=ElementType.ENTITY,
@@ -219,8 +329,10 @@ class DiffEngine:
         doc_entities = self.entity_extractor.get_entities_from_spec(existing_spec)
 
         # Build lookup maps
-        code_by_key = {e.unique_key(): e for e in code_elements.entities}
-        doc_by_key = {e.unique_key(): e for e in doc_entities}
+        code_by_key = {e.unique_key(): e for e in code_entities}
+        doc_by_key = {
+            e.unique_key(): e for e in doc_entities if keys is None or e.unique_key() in keys
+        }
 
         # Find entities in code but not in docs
         for key, entity in code_by_key.items():
@@ -325,13 +437,17 @@ class DiffEngine:
         return summary
 
     def get_code_elements(
-        self, code_path: str, language: str = "auto"
+        self,
+        code_path: str,
+        language: str = "auto",
+        stats: OperationStats | None = None,
     ) -> tuple[CodeElements | None, list[str]]:
         """Parse code and return extracted elements.
 
         Args:
             code_path: Path to code directory/file.
             language: Programming language.
+            stats: Optional stats to fill with parse counters and timings.
 
         Returns:
             Tuple of (CodeElements or None, list of error messages).
@@ -356,5 +472,30 @@ class DiffEngine:
             return None, errors
 
         if code_dir.is_file():
-            return parser.parse_file(code_dir), errors
-        return parser.parse_directory(code_dir), errors
+            with timed(stats, "parse"):
+                start = time.perf_counter()
+                code_elements = parser.parse_file(code_dir)
+            if stats is not None:
+                stats.files_discovered += 1
+                stats.files_parsed += 1
+                stats.record_file(
+                    FileTiming(
+                        file_path=code_path,
+                        parser=type(parser).__name__,
+                        size=code_dir.stat().st_size,
+                        seconds=time.perf_counter() - start,
+                    )
+                )
+                stats.endpoints_found += len(code_elements.api_endpoints)
+                stats.entities_found += len(code_elements.entities)
+            return code_elements, errors
+
+        code_elements = parser.parse_directory(
+            code_dir,
+            cache=self.parse_cache,
+            isolated=self.parse_mode == "isolated",
+            stats=stats,
+        )
+        with timed(stats, "index"):
+            self.file_keys.update(self.parse_cache)
+        return code_elements, errors
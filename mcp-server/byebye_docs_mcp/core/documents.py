@@ -0,0 +1,352 @@
+"""Cached access to design documents with a heading-offset index."""
+
+import os
+import re
+import stat
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..metrics import cache_counter
+
+# Level-2 markdown heading ("## Name"), matched per line
+HEADING_PATTERN = re.compile(r"^##[ \t]+(.*?)[ \t]*$", re.MULTILINE)
+
+# AI_EDITABLE marker comment ("<!-- AI_EDITABLE_START: name -->" / "..._END: name -->")
+EDITABLE_MARKER_PATTERN = re.compile(r"<!-- AI_EDITABLE_(START|END): ([^\n]*?) -->")
+
+# Number of documents kept in memory
+DEFAULT_MAX_DOCUMENTS = 64
+
+# Hits and misses of document reads, reported by metrics://server
+_lookups = cache_counter("document_store")
+
+
+@dataclass
+class Document:
+    """A document's content plus an index of its level-2 sections."""
+
+    content: str
+    signature: tuple[int, int] | None = None
+    _sections: dict[str, tuple[int, int]] | None = field(default=None, repr=False)
+    _headings: list[str] = field(default_factory=list, repr=False)
+
+    @property
+    def sections(self) -> dict[str, tuple[int, int]]:
+        """Map of lower-cased heading name to (start, end) offsets, built on first use.
+
+        A section runs from its heading to the next level-2 heading with a
+        different name; if a heading occurs more than once, the first
+        occurrence wins.
+        """
+        if self._sections is None:
+            self._build_index()
+        return self._sections  # type: ignore[return-value]
+
+    def section(self, name: str) -> str | None:
+        """Get a section (heading line included) by heading name, case-insensitively."""
+        span = self.sections.get(name.strip().lower())
+        if span is None:
+            return None
+        return self.content[span[0] : span[1]].strip()
+
+    def heading_names(self) -> list[str]:
+        """Get the level-2 heading names in document order."""
+        if self._sections is None:
+            self._build_index()
+        return list(self._headings)
+
+    def _build_index(self) -> None:
+        """Scan the content once for level-2 headings."""
+        headings = list(HEADING_PATTERN.finditer(self.content))
+        names = [match.group(1).lower() for match in headings]
+        sections: dict[str, tuple[int, int]] = {}
+        end = len(self.content)
+        # Walk backwards so each heading knows where the next differently named one starts
+        for i in range(len(headings) - 1, -1, -1):
+            if i + 1 < len(headings) and names[i + 1] != names[i]:
+                end = headings[i + 1].start()
+            sections[names[i]] = (headings[i].start(), end)
+        self._headings = [match.group(1) for match in headings]
+        self._sections = sections
+
+
+def find_editable_sections(content: str, names: set[str]) -> dict[str, list[tuple[int, int]]]:
+    """Locate the inner spans of AI_EDITABLE marker pairs in a single scan.
+
+    Each START marker is paired with the next END marker of the same name;
+    every pair of a name is returned, in document order.
+
+    Args:
+        content: Document content.
+        names: Section names to look for.
+
+    Returns:
+        Map of section name to (start, end) offsets of the text between markers.
+    """
+    spans: dict[str, list[tuple[int, int]]] = {}
+    open_at: dict[str, int] = {}
+
+    for match in EDITABLE_MARKER_PATTERN.finditer(content):
+        kind, name = match.group(1), match.group(2)
+        if name not in names:
+            continue
+        if kind == "START":
+            open_at.setdefault(name, match.end())
+        elif name in open_at:
+            spans.setdefault(name, []).append((open_at.pop(name), match.start()))
+
+    return spans
+
+
+def replace_editable_sections(
+    content: str, updates: dict[str, str]
+) -> tuple[str, list[str], list[str]]:
+    """Replace the content of several AI_EDITABLE sections in one pass.
+
+    Args:
+        content: Document content.
+        updates: Map of section name to new section content.
+
+    Returns:
+        Tuple of (new content, updated section names, section names whose
+        markers are missing or overlap another section). Content is returned
+        unchanged if any section could not be updated.
+    """
+    spans = find_editable_sections(content, set(updates))
+    missing = [name for name in updates if name not in spans]
+
+    replacements = sorted(
+        (start, end, name) for name, name_spans in spans.items() for start, end in name_spans
+    )
+    # Sections nested in or crossing another one cannot be spliced independently
+    for (_, prev_end, prev_name), (start, _, name) in zip(replacements, replacements[1:]):
+        if start < prev_end:
+            missing.extend(n for n in (prev_name, name) if n not in missing)
+
+    if missing:
+        return content, [], missing
+
+    pieces = []
+    pos = 0
+    for start, end, name in replacements:
+        pieces.append(content[pos:start])
+        pieces.append(f"\n{updates[name]}\n")
+        pos = end
+    pieces.append(content[pos:])
+
+    return "".join(pieces), list(updates), []
+
+
+def write_text_atomic(file_path: Path, content: str) -> None:
+    """Write a text file atomically (temporary file + rename), keeping its mode."""
+    try:
+        mode = stat.S_IMODE(file_path.stat().st_mode)
+    except OSError:
+        mode = None
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+class DocumentStore:
+    """In-memory cache of documents keyed by path and invalidated by mtime.
+
+    Repeated reads of an unchanged document reuse its content and heading
+    index instead of reading and scanning the file again.
+    """
+
+    def __init__(self, max_documents: int = DEFAULT_MAX_DOCUMENTS):
+        """Initialize an empty store."""
+        self.max_documents = max_documents
+        self._documents: OrderedDict[Path, Document] = OrderedDict()
+
+    def get(self, file_path: Path) -> Document | None:
+        """Get a document, reading it only if it changed since the last call.
+
+        Returns:
+            The document, or None if the file does not exist.
+        """
+        signature = self._signature(file_path)
+        if signature is None:
+            self._documents.pop(file_path, None)
+            return None
+
+        document = self._documents.get(file_path)
+        if document is not None and document.signature == signature:
+            self._documents.move_to_end(file_path)
+            _lookups.hits += 1
+            return document
+        _lookups.misses += 1
+
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return None
+
+        document = Document(content=content, signature=signature)
+        self._documents[file_path] = document
+        while len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+        return document
+
+    def invalidate(self, file_path: Path) -> None:
+        """Drop a document from the store (e.g. after writing it)."""
+        self._documents.pop(file_path, None)
+
+    def clear(self) -> None:
+        """Drop all documents."""
+        self._documents.clear()
+
+    def _signature(self, file_path: Path) -> tuple[int, int] | None:
+        """Get the (size, mtime_ns) signature of a regular file."""
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return (file_stat.st_size, file_stat.st_mtime_ns)
+
+
+class DocsListing:
+    """Cached listing of the documentation files under ``.agent/``.
+
+    The tree is walked again only when a directory's mtime changes (files
+    were added, removed or renamed); otherwise only the known files are
+    stat'ed, and entries are re-formatted only if they changed. ``version``
+    increases whenever the listing changes, so callers can cache anything
+    derived from it.
+    """
+
+    def __init__(self, project_root: Path, suffixes: tuple[str, ...] = (".yaml", ".yml")):
+        """Initialize an empty listing for a project."""
+        self.agent_dir = project_root / ".agent"
+        self.project_root = project_root
+        self.suffixes = suffixes
+        self.version = 0
+        self._dir_mtimes: dict[str, int] | None = None
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._signatures: dict[str, tuple[int, int]] = {}
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Get the docs as [{path, size, modified}] sorted by path."""
+        self.refresh()
+        return list(self._entries.values())
+
+    def refresh(self) -> None:
+        """Bring the listing up to date with the file system."""
+        if self._dirs_changed():
+            self._rescan()
+            return
+
+        changed = False
+        for path in list(self._entries):
+            try:
+                file_stat = (self.project_root / path).stat()
+            except OSError:
+                # Removed without the directory mtime changing (coarse timestamps)
+                self._rescan()
+                return
+            signature = (file_stat.st_size, file_stat.st_mtime_ns)
+            if signature != self._signatures[path]:
+                self._set_entry(path, file_stat)
+                changed = True
+
+        if changed:
+            self.version += 1
+
+    def _dirs_changed(self) -> bool:
+        """Check whether any directory in the tree was modified since the last walk."""
+        if self._dir_mtimes is None:
+            return True
+        for path, mtime in self._dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _rescan(self) -> None:
+        """Walk the tree and rebuild the listing."""
+        dir_mtimes: dict[str, int] = {}
+        self._entries.clear()
+        self._signatures.clear()
+
+        try:
+            dir_mtimes[str(self.agent_dir)] = os.stat(self.agent_dir).st_mtime_ns
+        except OSError:
+            # No .agent directory: watch the project root for it to appear
+            try:
+                dir_mtimes[str(self.project_root)] = os.stat(self.project_root).st_mtime_ns
+            except OSError:
+                pass
+        else:
+            found: list[tuple[str, os.stat_result]] = []
+            self._walk(str(self.agent_dir), dir_mtimes, found)
+            for path, file_stat in sorted(found):
+                self._set_entry(path, file_stat)
+
+        self._dir_mtimes = dir_mtimes
+        self.version += 1
+
+    def _walk(
+        self,
+        directory: str,
+        dir_mtimes: dict[str, int],
+        found: list[tuple[str, os.stat_result]],
+    ) -> None:
+        """Collect matching files and directory mtimes below a directory."""
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                    self._walk(entry.path, dir_mtimes, found)
+                elif entry.is_file() and os.path.splitext(entry.name)[1] in self.suffixes:
+                    rel_path = os.path.relpath(entry.path, self.project_root)
+                    found.append((rel_path, entry.stat()))
+            except OSError:
+                continue
+
+    def _set_entry(self, path: str, file_stat: os.stat_result) -> None:
+        """Store the formatted entry for a file."""
+        self._signatures[path] = (file_stat.st_size, file_stat.st_mtime_ns)
+        self._entries[path] = {
+            "path": path,
+            "size": file_stat.st_size,
+            "modified": datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+        }
+
+
+_listings: dict[Path, DocsListing] = {}
+
+
+def get_docs_listing(project_root: Path) -> DocsListing:
+    """Get the shared docs listing for a project."""
+    listing = _listings.get(project_root)
+    if listing is None:
+        listing = _listings[project_root] = DocsListing(project_root)
+    return listing
+
+
+# Shared by the server's document tools
+document_store = DocumentStore()
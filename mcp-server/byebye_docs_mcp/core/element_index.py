@@ -0,0 +1,241 @@
+"""Inverted index over extracted endpoints, entities and fields."""
+
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+from ..parsers.cache import ParseCache, memory_caches, persistent_cache_enabled
+
+# Splits identifiers and paths into searchable words
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+
+ELEMENT_KINDS = ("endpoint", "entity", "field")
+
+
+def tokenize(text: str) -> set[str]:
+    """Get the lower-cased search tokens of an identifier, type or path.
+
+    The whole value, each ``/``-separated segment (braces removed) and each
+    word of snake_case and camelCase identifiers are all tokens, so
+    ``customer_id`` is found by "customer_id", "customer" and "id".
+    """
+    tokens: set[str] = set()
+    text = text.strip()
+    if not text:
+        return tokens
+
+    tokens.add(text.lower())
+    for segment in text.split("/"):
+        segment = segment.strip("{}:<> ")
+        if segment:
+            tokens.add(segment.lower())
+    for word in _WORD_PATTERN.findall(text):
+        tokens.add(word.lower())
+        tokens.update(part.lower() for part in _CAMEL_PATTERN.findall(word))
+    return tokens
+
+
+class ElementIndex:
+    """Inverted index from search tokens to extracted elements.
+
+    Built from the parse cache and updated incrementally: only files whose
+    cache entry changed since the last sync are re-indexed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._records: dict[int, dict[str, Any]] = {}
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        self._record_tokens: dict[int, set[str]] = {}
+        self._file_records: dict[str, list[int]] = {}
+        self._file_signatures: dict[str, Any] = {}
+        self._next_id = 0
+
+    def __len__(self) -> int:
+        """Number of indexed elements."""
+        return len(self._records)
+
+    def sync(self, cache: ParseCache) -> int:
+        """Bring the index up to date with the parse cache.
+
+        Returns:
+            Number of files re-indexed or removed.
+        """
+        entries = cache.entries()
+        changed = 0
+
+        for file_key in list(self._file_records):
+            if file_key not in entries:
+                self._remove_file(file_key)
+                changed += 1
+
+        for file_key, entry in entries.items():
+            signature = entry.get("signature")
+            if self._file_signatures.get(file_key) == signature and file_key in self._file_records:
+                continue
+            self._remove_file(file_key)
+            self._add_file(file_key, entry.get("elements", {}))
+            self._file_signatures[file_key] = signature
+            changed += 1
+
+        return changed
+
+    def search(self, query: str, kind: str | None = None, limit: int = 50) -> dict[str, Any]:
+        """Find elements matching every term of a query.
+
+        Args:
+            query: Whitespace-separated terms (path segments, names, types).
+            kind: Restrict to "endpoint", "entity" or "field".
+            limit: Maximum number of results.
+
+        Returns:
+            Dict with total match count and the matching records.
+        """
+        terms = query.split()
+        if not terms:
+            return {"total": 0, "results": []}
+
+        matches: set[int] | None = None
+        # Intersect the smallest posting lists first
+        term_sets = sorted((self._term_matches(term) for term in terms), key=len)
+        for term_set in term_sets:
+            matches = set(term_set) if matches is None else matches & term_set
+            if not matches:
+                break
+
+        ids = sorted(matches or ())
+        if kind:
+            ids = [i for i in ids if self._records[i]["type"] == kind]
+
+        # Elements whose whole path or name is a query term come first
+        exact: set[int] = set()
+        for term in terms:
+            exact |= self._postings.get(term.lower(), set())
+        ids.sort(key=lambda i: i not in exact)
+
+        return {
+            "total": len(ids),
+            "results": [self._records[i] for i in ids[:limit]],
+        }
+
+    def _term_matches(self, term: str) -> set[int]:
+        """Get ids matching every segment of one query term.
+
+        ``/orders`` matches ``/orders/{order_id}`` and ``/customers/{cid}/orders``
+        too; a segment that is not a token itself (``orders.v2``) is split into words.
+        """
+        tokens: set[str] = set()
+        for segment in term.split("/"):
+            segment = segment.strip("{}:<> ").lower()
+            if not segment:
+                continue
+            if segment in self._postings:
+                tokens.add(segment)
+            else:
+                tokens |= (tokenize(segment) - {segment}) or {segment}
+        if not tokens:
+            return set()
+
+        result: set[int] | None = None
+        for token in sorted(tokens, key=lambda t: len(self._postings.get(t, ()))):
+            postings = self._postings.get(token, set())
+            result = set(postings) if result is None else result & postings
+            if not result:
+                return set()
+        return result or set()
+
+    def _add_file(self, file_key: str, elements: dict[str, Any]) -> None:
+        """Index the elements of one cached file."""
+        ids: list[int] = []
+
+        for endpoint in elements.get("api_endpoints", []):
+            method = str(endpoint.get("method", "")).upper()
+            path = endpoint.get("path", "")
+            function_name = endpoint.get("function_name", "")
+            record = {
+                "type": "endpoint",
+                "key": f"{method} {path}",
+                "method": method,
+                "path": path,
+                "function_name": function_name,
+                "file": endpoint.get("file_path") or file_key,
+                "line": endpoint.get("line_number", 0),
+            }
+            tokens = tokenize(path) | tokenize(function_name) | {method.lower()}
+            ids.append(self._add_record(record, tokens))
+
+        for entity in elements.get("entities", []):
+            name = entity.get("schema", "")
+            table_name = entity.get("table_name") or ""
+            fields = entity.get("fields", [])
+            file_path = entity.get("file_path") or file_key
+            line = entity.get("line_number", 0)
+            record = {
+                "type": "entity",
+                "key": name,
+                "table_name": table_name or None,
+                "fields": len(fields),
+                "file": file_path,
+                "line": line,
+            }
+            ids.append(self._add_record(record, tokenize(name) | tokenize(table_name)))
+
+            for entity_field in fields:
+                field_name = entity_field.get("name", "")
+                field_type = entity_field.get("type", "")
+                record = {
+                    "type": "field",
+                    "key": f"{name}.{field_name}",
+                    "entity": name,
+                    "name": field_name,
+                    "field_type": field_type,
+                    "nullable": entity_field.get("nullable", True),
+                    "file": file_path,
+                    "line": line,
+                }
+                ids.append(self._add_record(record, tokenize(field_name) | tokenize(field_type)))
+
+        self._file_records[file_key] = ids
+
+    def _add_record(self, record: dict[str, Any], tokens: set[str]) -> int:
+        """Store a record and add it to the postings of its tokens."""
+        record_id = self._next_id
+        self._next_id += 1
+        self._records[record_id] = record
+        self._record_tokens[record_id] = tokens
+        for token in tokens:
+            self._postings[token].add(record_id)
+        return record_id
+
+    def _remove_file(self, file_key: str) -> None:
+        """Drop all records contributed by a file."""
+        for record_id in self._file_records.pop(file_key, []):
+            del self._records[record_id]
+            for token in self._record_tokens.pop(record_id, ()):
+                postings = self._postings.get(token)
+                if postings is not None:
+                    postings.discard(record_id)
+                    if not postings:
+                        del self._postings[token]
+        self._file_signatures.pop(file_key, None)
+
+
+_indexes: dict[Path, tuple[ParseCache, ElementIndex]] = {}
+
+
+def get_element_index(project_root: Path) -> ElementIndex:
+    """Get the project's element index, synced with the project's parse cache."""
+    shared = _indexes.get(project_root)
+    if shared is None:
+        if persistent_cache_enabled():
+            cache = ParseCache(project_root)
+        else:
+            cache = memory_caches(project_root)[0]
+        shared = _indexes[project_root] = (cache, ElementIndex())
+
+    cache, index = shared
+    cache.reload_if_changed()
+    index.sync(cache)
+    return index
@@ -0,0 +1,151 @@
+"""Keyed index over api.yaml and entities.yaml for per-element reads."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from ..metrics import cache_counter
+from ..tracing import span
+
+# HTTP methods that can appear as keys of an OpenAPI path item
+OPENAPI_METHODS = ("get", "post", "put", "patch", "delete", "head", "options", "trace")
+
+# Hits and misses of spec file lookups, reported by metrics://server
+_lookups = cache_counter("spec_index")
+
+
+def index_api_spec(spec: Any) -> dict[str, dict[str, Any]]:
+    """Index OpenAPI operations by "METHOD /path"."""
+    index: dict[str, dict[str, Any]] = {}
+    paths = spec.get("paths") if isinstance(spec, dict) else None
+    if not isinstance(paths, dict):
+        return index
+
+    for path, path_item in paths.items():
+        if not isinstance(path_item, dict):
+            continue
+        for method in OPENAPI_METHODS:
+            operation = path_item.get(method)
+            if operation is None:
+                continue
+            element: dict[str, Any] = {
+                "method": method.upper(),
+                "path": path,
+                "operation": operation,
+            }
+            if "parameters" in path_item:
+                element["path_parameters"] = path_item["parameters"]
+            index[f"{method.upper()} {path}"] = element
+
+    return index
+
+
+def index_entities_spec(spec: Any) -> dict[str, dict[str, Any]]:
+    """Index entities by schema name."""
+    index: dict[str, dict[str, Any]] = {}
+    entities = spec.get("entities") if isinstance(spec, dict) else None
+    if not isinstance(entities, list):
+        return index
+
+    for entity in entities:
+        if isinstance(entity, dict) and entity.get("schema"):
+            index.setdefault(str(entity["schema"]), entity)
+
+    return index
+
+
+class _IndexedFile:
+    """One spec file's index, valid for a single (size, mtime) version."""
+
+    def __init__(self, signature: tuple[int, int], elements: dict[str, dict[str, Any]]):
+        self.signature = signature
+        self.elements = elements
+        self.serialized: dict[str, str] = {}
+
+    def get_json(self, key: str) -> str | None:
+        """Get an element serialized as JSON (serialized once per version)."""
+        text = self.serialized.get(key)
+        if text is None:
+            element = self.elements.get(key)
+            if element is None:
+                return None
+            text = json.dumps(element, indent=2, ensure_ascii=False, default=str)
+            self.serialized[key] = text
+        return text
+
+
+class SpecIndex:
+    """Per-element access to the API and entity specs of a project.
+
+    Each spec file is parsed once per version (size and mtime); reading an
+    element afterwards is a dict lookup and serializes only that element.
+    """
+
+    def __init__(self, project_root: Path):
+        """Initialize index for a project."""
+        self.api_path = project_root / ".agent" / "schemas" / "api.yaml"
+        self.entities_path = project_root / ".agent" / "schemas" / "entities.yaml"
+        self._files: dict[Path, _IndexedFile] = {}
+
+    def endpoint(self, method: str, path: str) -> str | None:
+        """Get one API operation as JSON, or None if it does not exist."""
+        indexed = self._get(self.api_path, index_api_spec)
+        return indexed.get_json(f"{method.upper()} {path}") if indexed else None
+
+    def entity(self, name: str) -> str | None:
+        """Get one entity definition as JSON, or None if it does not exist."""
+        indexed = self._get(self.entities_path, index_entities_spec)
+        return indexed.get_json(name) if indexed else None
+
+    def endpoint_keys(self) -> list[str]:
+        """Get all "METHOD /path" keys in the API spec."""
+        indexed = self._get(self.api_path, index_api_spec)
+        return list(indexed.elements) if indexed else []
+
+    def entity_names(self) -> list[str]:
+        """Get all entity names in the entities spec."""
+        indexed = self._get(self.entities_path, index_entities_spec)
+        return list(indexed.elements) if indexed else []
+
+    def _get(
+        self,
+        file_path: Path,
+        build: Callable[[Any], dict[str, dict[str, Any]]],
+    ) -> _IndexedFile | None:
+        """Get the index of a spec file, rebuilding it if the file changed."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            self._files.pop(file_path, None)
+            return None
+
+        signature = (stat.st_size, stat.st_mtime_ns)
+        indexed = self._files.get(file_path)
+        if indexed is not None and indexed.signature == signature:
+            _lookups.hits += 1
+            return indexed
+        _lookups.misses += 1
+
+        try:
+            with span("yaml_load", file=file_path.name):
+                spec = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        except (yaml.YAMLError, OSError, UnicodeDecodeError):
+            return None
+
+        indexed = _IndexedFile(signature, build(spec))
+        self._files[file_path] = indexed
+        return indexed
+
+
+_indexes: dict[Path, SpecIndex] = {}
+
+
+def get_spec_index(project_root: Path) -> SpecIndex:
+    """Get the shared spec index for a project."""
+    index = _indexes.get(project_root)
+    if index is None:
+        index = _indexes[project_root] = SpecIndex(project_root)
+    return index
@@ -9,20 +9,27 @@ import yaml
 
 from ..extractors.api_extractor import ApiExtractor
 from ..extractors.entity_extractor import EntityExtractor
-from ..models.diff_result import SyncChange, SyncOperation, SyncResult
+from ..models.diff_result import (
+    OperationStats,
+    SyncChange,
+    SyncOperation,
+    SyncResult,
+    timed,
+)
 from .diff_engine import DiffEngine
 
 
 class SyncManager:
     """Manager for synchronizing code changes to documentation."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, parse_mode: str | None = None):
         """Initialize sync manager with project root."""
         self.project_root = project_root
-        self.diff_engine = DiffEngine(project_root)
+        self.diff_engine = DiffEngine(project_root, parse_mode=parse_mode)
         self.api_extractor = ApiExtractor(project_root)
         self.entity_extractor = EntityExtractor(project_root)
         self.backup_dir = project_root / ".agent" / ".backups"
+        self._stats: OperationStats | None = None
 
     def sync(
         self,
@@ -30,6 +37,8 @@ class SyncManager:
         target_docs: list[str] | None = None,
         mode: str = "preview",
         language: str = "auto",
+        include_stats: bool = False,
+        slowest_files: int = 0,
     ) -> SyncResult:
         """Synchronize code to documentation.
 
@@ -38,18 +47,27 @@ class SyncManager:
             target_docs: List of target documents (e.g., ["api.yaml", "entities.yaml"]).
             mode: "preview" for dry run, "apply" to make changes.
             language: Programming language.
+            include_stats: Collect file counts and stage timings into result.stats.
+            slowest_files: Also report the N files that took longest to parse
+                (implies include_stats).
 
         Returns:
             SyncResult with changes and status.
         """
-        result = SyncResult(mode=mode)
+        stats = None
+        if include_stats or slowest_files:
+            stats = OperationStats(slowest_files=slowest_files)
+        result = SyncResult(mode=mode, stats=stats)
+        self._stats = result.stats
 
         # Default target docs
         if target_docs is None:
             target_docs = ["api.yaml", "entities.yaml"]
 
         # Parse code
-        code_elements, errors = self.diff_engine.get_code_elements(code_path, language)
+        code_elements, errors = self.diff_engine.get_code_elements(
+            code_path, language, result.stats
+        )
         if errors:
             result.errors.extend(errors)
             result.success = False
@@ -59,14 +77,17 @@ class SyncManager:
             result.errors.append("Failed to parse code")
             result.success = False
             return result
+        result.warnings.extend(code_elements.warnings)
 
         # Process each target document
         for doc_name in target_docs:
             if doc_name == "api.yaml":
-                changes = self._sync_api(code_elements, mode)
+                with timed(result.stats, "compare"):
+                    changes = self._sync_api(code_elements, mode)
                 result.changes.extend(changes)
             elif doc_name == "entities.yaml":
-                changes = self._sync_entities(code_elements, mode)
+                with timed(result.stats, "compare"):
+                    changes = self._sync_entities(code_elements, mode)
                 result.changes.extend(changes)
             else:
                 result.warnings.append(f"Unknown target document: {doc_name}")
@@ -92,7 +113,8 @@ class SyncManager:
         rel_path = ".agent/schemas/api.yaml"
 
         # Load existing spec
-        existing_spec = self.api_extractor.load_existing_spec(api_path)
+        with timed(self._stats, "yaml_load"):
+            existing_spec = self.api_extractor.load_existing_spec(api_path)
 
         # Generate new spec
         new_spec = self.api_extractor.extract_to_openapi(
@@ -147,14 +169,16 @@ class SyncManager:
 
         # Apply changes if in apply mode
         if mode == "apply" and changes:
-            self._apply_yaml_changes(api_path, new_spec)
+            with timed(self._stats, "write"):
+                self._apply_yaml_changes(api_path, new_spec)
 
         # Generate diff text for preview
         if existing_spec:
-            for change in changes:
-                change.diff_text = self._generate_diff_text(
-                    change.old_value, change.new_value
-                )
+            with timed(self._stats, "serialize"):
+                for change in changes:
+                    change.diff_text = self._generate_diff_text(
+                        change.old_value, change.new_value
+                    )
 
         return changes
 
@@ -165,7 +189,8 @@ class SyncManager:
         rel_path = ".agent/schemas/entities.yaml"
 
         # Load existing spec
-        existing_spec = self.entity_extractor.load_existing_entities(entities_path)
+        with timed(self._stats, "yaml_load"):
+            existing_spec = self.entity_extractor.load_existing_entities(entities_path)
 
         # Generate new spec
         new_spec = self.entity_extractor.extract_to_entities_yaml(
@@ -226,11 +251,13 @@ class SyncManager:
         if mode == "apply" and changes:
             # Update last_updated
             new_spec["last_updated"] = datetime.now().strftime("%Y-%m-%d")
-            self._apply_yaml_changes(entities_path, new_spec)
+            with timed(self._stats, "write"):
+                self._apply_yaml_changes(entities_path, new_spec)
 
         # Generate diff text for preview
-        for change in changes:
-            change.diff_text = self._generate_diff_text(change.old_value, change.new_value)
+        with timed(self._stats, "serialize"):
+            for change in changes:
+                change.diff_text = self._generate_diff_text(change.old_value, change.new_value)
 
         return changes
 
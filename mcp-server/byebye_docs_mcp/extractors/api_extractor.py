@@ -1,11 +1,13 @@
 """Extractor for converting API endpoints to OpenAPI format."""
 
+import copy
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from ..models.code_elements import ApiEndpoint, CodeElements
+from ..tracing import span
 
 
 class ApiExtractor:
@@ -31,24 +33,26 @@ class ApiExtractor:
         Returns:
             OpenAPI specification dictionary.
         """
-        if merge and existing_spec:
-            spec = existing_spec.copy()
-        else:
-            spec = self._create_base_spec()
+        with span("merge_openapi", endpoints=len(code_elements.api_endpoints), merge=merge):
+            if merge and existing_spec:
+                # Deep copy: callers compare the result with the spec they passed in
+                spec = copy.deepcopy(existing_spec)
+            else:
+                spec = self._create_base_spec()
 
-        # Ensure paths exists
-        if "paths" not in spec:
-            spec["paths"] = {}
+            # Ensure paths exists
+            if "paths" not in spec:
+                spec["paths"] = {}
 
-        # Ensure components exists
-        if "components" not in spec:
-            spec["components"] = {"schemas": {}, "responses": {}}
+            # Ensure components exists
+            if "components" not in spec:
+                spec["components"] = {"schemas": {}, "responses": {}}
 
-        # Add endpoints
-        for endpoint in code_elements.api_endpoints:
-            self._add_endpoint_to_spec(spec, endpoint, merge)
+            # Add endpoints
+            for endpoint in code_elements.api_endpoints:
+                self._add_endpoint_to_spec(spec, endpoint, merge)
 
-        return spec
+            return spec
 
     def _create_base_spec(self) -> dict[str, Any]:
         """Create a base OpenAPI specification."""
@@ -173,7 +177,8 @@ class ApiExtractor:
 
         try:
             content = file_path.read_text(encoding="utf-8")
-            return yaml.safe_load(content)
+            with span("yaml_load", file=file_path.name):
+                return yaml.safe_load(content)
         except (yaml.YAMLError, OSError):
             return None
 
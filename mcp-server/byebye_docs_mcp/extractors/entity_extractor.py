@@ -1,11 +1,13 @@
 """Extractor for converting entities to YAML format."""
 
+import copy
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from ..models.code_elements import CodeElements, Entity
+from ..tracing import span
 
 
 class EntityExtractor:
@@ -31,39 +33,41 @@ class EntityExtractor:
         Returns:
             Entities specification dictionary.
         """
-        if merge and existing_entities:
-            spec = existing_entities.copy()
-        else:
-            spec = self._create_base_spec()
-
-        # Ensure entities list exists
-        if "entities" not in spec:
-            spec["entities"] = []
-
-        # Build lookup for existing entities
-        existing_by_name: dict[str, int] = {}
-        for idx, entity in enumerate(spec["entities"]):
-            name = entity.get("schema")
-            if name:
-                existing_by_name[name] = idx
-
-        # Add or update entities
-        for entity in code_elements.entities:
-            entity_dict = entity.to_dict()
-
-            if entity.name in existing_by_name:
-                if merge:
-                    # Update existing entity
-                    idx = existing_by_name[entity.name]
-                    spec["entities"][idx] = self._merge_entity(
-                        spec["entities"][idx], entity_dict
-                    )
+        with span("merge_entities", entities=len(code_elements.entities), merge=merge):
+            if merge and existing_entities:
+                # Deep copy: callers compare the result with the spec they passed in
+                spec = copy.deepcopy(existing_entities)
             else:
-                # Add new entity
-                spec["entities"].append(entity_dict)
-                existing_by_name[entity.name] = len(spec["entities"]) - 1
-
-        return spec
+                spec = self._create_base_spec()
+
+            # Ensure entities list exists
+            if "entities" not in spec:
+                spec["entities"] = []
+
+            # Build lookup for existing entities
+            existing_by_name: dict[str, int] = {}
+            for idx, entity in enumerate(spec["entities"]):
+                name = entity.get("schema")
+                if name:
+                    existing_by_name[name] = idx
+
+            # Add or update entities
+            for entity in code_elements.entities:
+                entity_dict = entity.to_dict()
+
+                if entity.name in existing_by_name:
+                    if merge:
+                        # Update existing entity
+                        idx = existing_by_name[entity.name]
+                        spec["entities"][idx] = self._merge_entity(
+                            spec["entities"][idx], entity_dict
+                        )
+                else:
+                    # Add new entity
+                    spec["entities"].append(entity_dict)
+                    existing_by_name[entity.name] = len(spec["entities"]) - 1
+
+            return spec
 
     def _create_base_spec(self) -> dict[str, Any]:
         """Create a base entities specification."""
@@ -139,7 +143,8 @@ class EntityExtractor:
 
         try:
             content = file_path.read_text(encoding="utf-8")
-            return yaml.safe_load(content)
+            with span("yaml_load", file=file_path.name):
+                return yaml.safe_load(content)
         except (yaml.YAMLError, OSError):
             return None
 
@@ -0,0 +1,305 @@
+"""In-process server metrics: request counters, latency histograms and cache stats.
+
+Tool calls and resource reads are counted by wrappers around the MCP
+handlers; caches count their own hits and misses through ``cache_counter``.
+Everything is kept in memory and exposed by the ``metrics://server`` resource.
+This module only uses the standard library so the caches can import it.
+"""
+
+import functools
+import os
+import sys
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from .tracing import span
+
+# Upper bounds of the latency histogram buckets (milliseconds)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Resource URIs reported under their template instead of one series per element
+RESOURCE_TEMPLATES = {
+    "docs://api/": "docs://api/{method}/{path}",
+    "docs://entities/": "docs://entities/{name}",
+}
+
+
+@dataclass
+class LatencyHistogram:
+    """Request count, errors and latency distribution of one tool or resource."""
+
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        """Record one request."""
+        self.count += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Estimate a percentile (ms) as the upper bound of the bucket it falls in."""
+        if not self.count:
+            return None
+        max_ms = round(self.max_seconds * 1000, 3)
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS_MS, self.buckets):
+            seen += bucket_count
+            if seen >= rank:
+                return min(float(bound), max_ms)
+        return max_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization (empty buckets are left out)."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.total_seconds / self.count * 1000, 3) if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "sum_ms": round(self.total_seconds * 1000, 3),
+            "buckets_ms": {
+                f"le_{bound}": bucket_count
+                for bound, bucket_count in zip((*LATENCY_BUCKETS_MS, "inf"), self.buckets)
+                if bucket_count
+            },
+        }
+
+
+@dataclass
+class CacheCounter:
+    """Hit and miss counts of one cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """Share of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        hit_rate = self.hit_rate
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(hit_rate, 4) if hit_rate is not None else None,
+        }
+
+
+class ServerMetrics:
+    """Counters and histograms for the requests handled by this process."""
+
+    def __init__(self):
+        """Initialize empty metrics."""
+        self.started = time.time()
+        self.tools: dict[str, LatencyHistogram] = {}
+        self.resources: dict[str, LatencyHistogram] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.caches: dict[str, CacheCounter] = {}
+        self._queue: Any = None
+
+    @contextmanager
+    def track(self, kind: str, name: str) -> Iterator[None]:
+        """Count a request as in flight and record its latency when it finishes."""
+        series = self.tools if kind == "tool" else self.resources
+        histogram = series.get(name)
+        if histogram is None:
+            histogram = series[name] = LatencyHistogram()
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        start = time.perf_counter()
+        error = True
+        try:
+            yield
+            error = False
+        finally:
+            self.in_flight -= 1
+            histogram.observe(time.perf_counter() - start, error)
+
+    def watch_queue(self, stream: Any) -> None:
+        """Report the buffer of an anyio receive stream as the request queue depth."""
+        self._queue = stream
+
+    def queue_depth(self) -> int | None:
+        """Get the number of received messages the session has not picked up yet."""
+        if self._queue is None:
+            return None
+        try:
+            return self._queue.statistics().current_buffer_used
+        except Exception:
+            return None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get all metrics as a JSON-serializable dict."""
+        return {
+            "uptime_seconds": round(time.time() - self.started, 3),
+            "rss_mb": process_rss_mb(),
+            "queue_depth": self.queue_depth(),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "tools": {name: h.to_dict() for name, h in sorted(self.tools.items())},
+            "resources": {name: h.to_dict() for name, h in sorted(self.resources.items())},
+            "caches": cache_snapshot(),
+        }
+
+    def prometheus(self) -> str:
+        """Get the request metrics in the Prometheus text exposition format."""
+        lines = []
+        gauges = (
+            ("byebye_docs_in_flight", self.in_flight),
+            ("byebye_docs_queue_depth", self.queue_depth()),
+            ("byebye_docs_rss_bytes", _mb_to_bytes(process_rss_mb())),
+        )
+        for metric, value in gauges:
+            if value is not None:
+                lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+
+        for kind, series in (("tool", self.tools), ("resource", self.resources)):
+            metric = f"byebye_docs_{kind}_duration_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in sorted(series.items()):
+                label = f'{kind}="{name}"'
+                seen = 0
+                bounds = (*(f"{b / 1000:g}" for b in LATENCY_BUCKETS_MS), "+Inf")
+                for bound, bucket_count in zip(bounds, histogram.buckets):
+                    seen += bucket_count
+                    lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {seen}')
+                lines.append(f"{metric}_sum{{{label}}} {histogram.total_seconds:.6f}")
+                lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+
+            metric = f"byebye_docs_{kind}_errors_total"
+            lines.append(f"# TYPE {metric} counter")
+            for name, histogram in sorted(series.items()):
+                lines.append(f'{metric}{{{kind}="{name}"}} {histogram.errors}')
+
+        for outcome in ("hits", "misses"):
+            metric = f"byebye_docs_cache_{outcome}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for name, counter in sorted(self.caches.items()):
+                lines.append(f'{metric}{{cache="{name}"}} {getattr(counter, outcome)}')
+        return "\n".join(lines) + "\n"
+
+
+metrics = ServerMetrics()
+
+
+def cache_counter(name: str) -> CacheCounter:
+    """Get the shared hit/miss counter of a cache."""
+    counter = metrics.caches.get(name)
+    if counter is None:
+        counter = metrics.caches[name] = CacheCounter()
+    return counter
+
+
+def cache_snapshot() -> dict[str, dict[str, Any]]:
+    """Get hit rates and sizes of the caches loaded in this process.
+
+    Modules that have not been imported yet are not imported just to report
+    an empty cache.
+    """
+    caches = {name: counter.to_dict() for name, counter in metrics.caches.items()}
+
+    def size(name: str, entries: int) -> None:
+        caches.setdefault(name, {})["size"] = entries
+
+    server_module = sys.modules.get("byebye_docs_mcp.server")
+    if server_module is not None:
+        size("resource_json", len(server_module._resource_json_cache))
+
+    validation = sys.modules.get("byebye_docs_mcp.validation")
+    if validation is not None:
+        info = validation.get_schema_validator.cache_info()
+        caches["schema_validators"] = {
+            **CacheCounter(info.hits, info.misses).to_dict(),
+            "size": info.currsize,
+        }
+
+    documents = sys.modules.get("byebye_docs_mcp.core.documents")
+    if documents is not None:
+        size("document_store", len(documents.document_store._documents))
+
+    spec_index = sys.modules.get("byebye_docs_mcp.core.spec_index")
+    if spec_index is not None:
+        size("spec_index", sum(len(index._files) for index in spec_index._indexes.values()))
+
+    element_index = sys.modules.get("byebye_docs_mcp.core.element_index")
+    if element_index is not None:
+        size("element_index", sum(len(index) for _, index in element_index._indexes.values()))
+
+    return dict(sorted(caches.items()))
+
+
+def resource_label(uri: str) -> str:
+    """Get the series name of a resource URI (query dropped, templates collapsed)."""
+    uri = uri.partition("?")[0]
+    for prefix, template in RESOURCE_TEMPLATES.items():
+        if uri.startswith(prefix):
+            return template
+    return uri
+
+
+def instrument_tool(
+    func: Callable[[str, dict[str, Any]], Awaitable[Any]],
+) -> Callable[[str, dict[str, Any]], Awaitable[Any]]:
+    """Wrap a call_tool handler to record per-tool latency and a trace span."""
+
+    @functools.wraps(func)
+    async def wrapper(name: str, arguments: dict[str, Any]) -> Any:
+        with metrics.track("tool", name), span("call_tool", tool=name):
+            return await func(name, arguments)
+
+    return wrapper
+
+
+def instrument_resource(
+    func: Callable[[Any], Awaitable[Any]],
+) -> Callable[[Any], Awaitable[Any]]:
+    """Wrap a read_resource handler to record per-URI latency and a trace span."""
+
+    @functools.wraps(func)
+    async def wrapper(uri: Any) -> Any:
+        label = resource_label(str(uri))
+        with metrics.track("resource", label), span("read_resource", uri=label):
+            return await func(uri)
+
+    return wrapper
+
+
+def process_rss_mb() -> float | None:
+    """Get the resident memory of this process in MB (peak RSS where /proc is missing)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+        return round(resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _mb_to_bytes(value: float | None) -> int | None:
+    """Convert megabytes to bytes, keeping None."""
+    return int(value * 1024 * 1024) if value is not None else None
@@ -10,6 +10,8 @@ from .diff_result import (
     DriftItem,
     DiffSummary,
     DiffResult,
+    FileTiming,
+    OperationStats,
     SyncChange,
     SyncResult,
 )
@@ -22,6 +24,8 @@ __all__ = [
     "DriftItem",
     "DiffSummary",
     "DiffResult",
+    "FileTiming",
+    "OperationStats",
     "SyncChange",
     "SyncResult",
 ]
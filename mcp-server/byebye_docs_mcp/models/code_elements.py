@@ -36,6 +36,23 @@ class ApiEndpoint:
             "tags": self.tags,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ApiEndpoint":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            path=data["path"],
+            method=data["method"],
+            function_name=data.get("function_name", ""),
+            file_path=data.get("file_path", ""),
+            line_number=data.get("line_number", 0),
+            summary=data.get("summary"),
+            description=data.get("description"),
+            parameters=data.get("parameters") or [],
+            request_body=data.get("request_body"),
+            responses=data.get("responses") or {},
+            tags=data.get("tags") or [],
+        )
+
     def unique_key(self) -> str:
         """Generate a unique key for comparison."""
         return f"{self.method.upper()} {self.path}"
@@ -86,6 +103,28 @@ class EntityField:
             result["description"] = self.description
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "EntityField":
+        """Create from a dictionary produced by to_dict()."""
+        enum_values = None
+        if "enum" in data:
+            enum_values = data["enum"].get("values", [])
+
+        return cls(
+            name=data.get("name", ""),
+            field_type=data.get("type", "string"),
+            nullable=data.get("nullable", True),
+            primary_key=data.get("primary_key", False),
+            auto_generate=data.get("auto_generate", False),
+            unique=data.get("unique", False),
+            max_length=data.get("max_length"),
+            default=data.get("default"),
+            foreign_key=data.get("foreign_key"),
+            enum_values=enum_values,
+            sensitive=data.get("sensitive", False),
+            description=data.get("description"),
+        )
+
 
 @dataclass
 class Entity:
@@ -116,6 +155,27 @@ class Entity:
             result["validations"] = self.validations
         return result
 
+    def to_cache_dict(self) -> dict[str, Any]:
+        """Convert to dictionary including source location (for caching)."""
+        result = self.to_dict()
+        result["file_path"] = self.file_path
+        result["line_number"] = self.line_number
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Entity":
+        """Create from a dictionary produced by to_dict() or to_cache_dict()."""
+        return cls(
+            name=data.get("schema", ""),
+            table_name=data.get("table_name"),
+            file_path=data.get("file_path", ""),
+            line_number=data.get("line_number", 0),
+            description=data.get("description"),
+            fields=[EntityField.from_dict(f) for f in data.get("fields", [])],
+            indexes=data.get("indexes", []),
+            validations=data.get("validations", []),
+        )
+
     def unique_key(self) -> str:
         """Generate a unique key for comparison."""
         return self.name
@@ -129,6 +189,7 @@ class CodeElements:
     entities: list[Entity] = field(default_factory=list)
     language: str = "python"
     source_files: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -137,4 +198,33 @@ class CodeElements:
             "source_files": self.source_files,
             "api_endpoints": [e.to_dict() for e in self.api_endpoints],
             "entities": [e.to_dict() for e in self.entities],
+            "warnings": self.warnings,
+        }
+
+    def to_cache_dict(self) -> dict[str, Any]:
+        """Convert to dictionary that round-trips through from_dict()."""
+        return {
+            "language": self.language,
+            "source_files": self.source_files,
+            "api_endpoints": [e.to_dict() for e in self.api_endpoints],
+            "entities": [e.to_cache_dict() for e in self.entities],
         }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CodeElements":
+        """Create from a dictionary produced by to_cache_dict()."""
+        return cls(
+            api_endpoints=[ApiEndpoint.from_dict(e) for e in data.get("api_endpoints", [])],
+            entities=[Entity.from_dict(e) for e in data.get("entities", [])],
+            language=data.get("language", "python"),
+            source_files=data.get("source_files", []),
+            warnings=data.get("warnings", []),
+        )
+
+    def extend(self, other: "CodeElements") -> None:
+        """Append all elements from another container."""
+        self.api_endpoints.extend(other.api_endpoints)
+        self.entities.extend(other.entities)
+        if other.source_files:
+            self.source_files.extend(other.source_files)
+        self.warnings.extend(other.warnings)
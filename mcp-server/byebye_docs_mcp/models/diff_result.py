@@ -1,5 +1,9 @@
 """Data models for diff and sync results."""
 
+import heapq
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -85,6 +89,99 @@ class DiffSummary:
         }
 
 
+@dataclass
+class FileTiming:
+    """Parse time and size of one source file."""
+
+    file_path: str
+    parser: str
+    size: int
+    seconds: float
+    outcome: str = "parsed"  # "parsed", "failed", "timeout" or "quarantined"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        return {
+            "file": self.file_path,
+            "parser": self.parser,
+            "bytes": self.size,
+            "ms": round(self.seconds * 1000, 3),
+            "outcome": self.outcome,
+        }
+
+
+@dataclass
+class OperationStats:
+    """File counters and stage timings collected during a diff or sync."""
+
+    files_discovered: int = 0
+    files_parsed: int = 0
+    files_cached: int = 0
+    files_skipped: int = 0  # quarantined, timed out or failed
+    cache_lookups: int = 0
+    bytes_read: int = 0
+    endpoints_found: int = 0
+    entities_found: int = 0
+    stages: dict[str, float] = field(default_factory=dict)  # seconds, exclusive
+    file_timings: list[FileTiming] = field(default_factory=list)
+    slowest_files: int = 0  # how many of the slowest files to report
+    _nested: float = field(default=0.0, init=False, repr=False)
+
+    @property
+    def cache_hit_rate(self) -> float | None:
+        """Share of looked-up files served from the parse cache."""
+        return self.files_cached / self.cache_lookups if self.cache_lookups else None
+
+    def record_file(self, timing: FileTiming) -> None:
+        """Record the parse of one file and count its bytes."""
+        self.file_timings.append(timing)
+        self.bytes_read += timing.size
+
+    def slowest(self, n: int) -> list[FileTiming]:
+        """Get the n files that took longest to parse, slowest first."""
+        return heapq.nlargest(n, self.file_timings, key=lambda timing: timing.seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block; time spent in nested stages is not counted twice."""
+        outer = self._nested
+        self._nested = 0.0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed - self._nested
+            self._nested = outer + elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        hit_rate = self.cache_hit_rate
+        result: dict[str, Any] = {
+            "files": {
+                "discovered": self.files_discovered,
+                "parsed": self.files_parsed,
+                "cached": self.files_cached,
+                "skipped": self.files_skipped,
+            },
+            "bytes_read": self.bytes_read,
+            "elements": {
+                "endpoints": self.endpoints_found,
+                "entities": self.entities_found,
+            },
+            "cache_hit_rate": round(hit_rate, 4) if hit_rate is not None else None,
+            "stages_ms": {name: round(secs * 1000, 3) for name, secs in self.stages.items()},
+        }
+        if self.slowest_files:
+            result["slowest_files"] = [t.to_dict() for t in self.slowest(self.slowest_files)]
+        return result
+
+
+def timed(stats: OperationStats | None, name: str) -> AbstractContextManager[None]:
+    """Time a stage into stats, or do nothing when stats are not collected."""
+    return stats.stage(name) if stats is not None else nullcontext()
+
+
 @dataclass
 class DiffResult:
     """Complete result of a diff operation."""
@@ -94,16 +191,20 @@ class DiffResult:
     details: list[DriftItem] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
     warnings: list[str] = field(default_factory=list)
+    stats: OperationStats | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
+        result = {
             "status": self.status,
             "summary": self.summary.to_dict(),
             "details": [d.to_dict() for d in self.details],
             "errors": self.errors,
             "warnings": self.warnings,
         }
+        if self.stats is not None:
+            result["stats"] = self.stats.to_dict()
+        return result
 
 
 class SyncOperation(str, Enum):
@@ -147,6 +248,7 @@ class SyncResult:
     applied: list[dict[str, str]] = field(default_factory=list)  # [{file, backup_path}]
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    stats: OperationStats | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -160,4 +262,15 @@ class SyncResult:
             result["applied"] = self.applied
         result["warnings"] = self.warnings
         result["errors"] = self.errors
+        if self.stats is not None:
+            result["stats"] = self.stats.to_dict()
         return result
+
+
+def result_payload(result: DiffResult | SyncResult) -> dict[str, Any]:
+    """Convert a diff or sync result, timing the conversion into its stats."""
+    with timed(result.stats, "serialize"):
+        payload = result.to_dict()
+    if result.stats is not None:
+        payload["stats"] = result.stats.to_dict()
+    return payload
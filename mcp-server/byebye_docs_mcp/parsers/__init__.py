@@ -1,12 +1,31 @@
 """Code parsers for extracting information from source files."""
 
-from .base import CodeParser, ParserRegistry
-from .python_parser import PythonParser
-from .typescript_parser import TypeScriptParser
+from importlib import import_module
+from typing import Any
+
+from .base import PARSER_ENTRY_POINT_GROUP, CodeParser, ParserRegistry, ParseTimeoutError
+from .cache import ParseCache
+
+# Built-in parser classes are imported on first access (see ParserRegistry)
+_LAZY_EXPORTS = {
+    "PythonParser": ".python_parser",
+    "TypeScriptParser": ".typescript_parser",
+}
 
 __all__ = [
+    "PARSER_ENTRY_POINT_GROUP",
     "CodeParser",
+    "ParseCache",
+    "ParseTimeoutError",
     "ParserRegistry",
     "PythonParser",
     "TypeScriptParser",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import built-in parser classes lazily."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
@@ -1,10 +1,43 @@
 """Abstract base class for code parsers."""
 
+import os
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from ..models.code_elements import CodeElements
+from ..models.diff_result import FileTiming, OperationStats, timed
+from ..tracing import span
+
+if TYPE_CHECKING:
+    from .cache import ParseCache
+
+# Entry point group through which third-party parsers register
+PARSER_ENTRY_POINT_GROUP = "byebye_docs.parsers"
+
+# Default wall-clock budget (seconds) for parsing a single file
+DEFAULT_PARSE_TIME_BUDGET = 5.0
+
+
+class ParseTimeoutError(Exception):
+    """Raised when a single file exceeds its parse time budget."""
+
+
+def default_parse_time_budget() -> float | None:
+    """Get the per-file parse time budget from environment or default.
+
+    A value of 0 (or less) disables the budget.
+    """
+    env_value = os.environ.get("BYEBYE_DOCS_PARSE_BUDGET")
+    if env_value:
+        try:
+            budget = float(env_value)
+        except ValueError:
+            return DEFAULT_PARSE_TIME_BUDGET
+        return budget if budget > 0 else None
+    return DEFAULT_PARSE_TIME_BUDGET
 
 
 class CodeParser(ABC):
@@ -13,9 +46,19 @@ class CodeParser(ABC):
     language: ClassVar[str] = "unknown"
     file_extensions: ClassVar[list[str]] = []
 
-    def __init__(self, project_root: Path):
-        """Initialize parser with project root path."""
+    def __init__(self, project_root: Path, parse_time_budget: float | None = None):
+        """Initialize parser with project root path.
+
+        Args:
+            project_root: Project root directory.
+            parse_time_budget: Seconds allowed per file in parse_directory
+                (defaults to BYEBYE_DOCS_PARSE_BUDGET or 5 seconds).
+        """
         self.project_root = project_root
+        self.parse_time_budget = (
+            parse_time_budget if parse_time_budget is not None else default_parse_time_budget()
+        )
+        self._deadline: float | None = None
 
     @abstractmethod
     def parse_file(self, file_path: Path) -> CodeElements:
@@ -29,11 +72,23 @@ class CodeParser(ABC):
         """
         pass
 
-    def parse_directory(self, directory: Path) -> CodeElements:
+    def parse_directory(
+        self,
+        directory: Path,
+        cache: "ParseCache | None" = None,
+        isolated: bool = False,
+        stats: OperationStats | None = None,
+    ) -> CodeElements:
         """Parse all files in a directory recursively.
 
         Args:
             directory: Path to the directory to parse.
+            cache: Optional parse cache; unchanged files are served from it and
+                quarantined files are skipped.
+            isolated: Parse in supervised worker processes with wall-clock and
+                memory limits instead of in this process.
+            stats: Optional stats to fill with file counts, walk/cache/parse
+                timings and the parse time, size and parser of every parsed file.
 
         Returns:
             CodeElements containing all extracted elements.
@@ -43,23 +98,180 @@ class CodeParser(ABC):
         if not directory.exists():
             return result
 
+        with timed(stats, "walk"), span("discover", directory=self._display_path(directory)):
+            files = list(self.iter_source_files(directory))
+
+        pending: list[Path] = []
+        quarantined = 0
+        with timed(stats, "cache_lookup"):
+            if cache is not None:
+                cache.prune(directory, self.language, files)
+            for file_path in files:
+                if cache is not None:
+                    reason = cache.quarantined(file_path)
+                    if reason:
+                        result.warnings.append(
+                            f"Quarantined, skipped: {self._display_path(file_path)} ({reason})"
+                        )
+                        quarantined += 1
+                        continue
+
+                    cached = cache.get(file_path, self.language)
+                    if cached is not None:
+                        result.extend(cached)
+                        continue
+
+                pending.append(file_path)
+
+        with timed(stats, "parse"):
+            if isolated:
+                parsed = self._parse_isolated(pending, result, cache, stats)
+            else:
+                parsed = self._parse_inline(pending, result, cache, stats)
+
+        if cache is not None:
+            with timed(stats, "cache_write"):
+                cache.save()
+
+        if stats is not None:
+            stats.files_discovered += len(files)
+            if cache is not None:
+                stats.cache_lookups += len(files)
+                stats.files_cached += len(files) - len(pending) - quarantined
+            stats.files_parsed += parsed
+            stats.files_skipped += quarantined + len(pending) - parsed
+            stats.endpoints_found += len(result.api_endpoints)
+            stats.entities_found += len(result.entities)
+
+        return result
+
+    def iter_source_files(self, directory: Path) -> Iterator[Path]:
+        """Yield all parseable source files under a directory."""
         for ext in self.file_extensions:
             for file_path in directory.rglob(f"*{ext}"):
                 # Skip common non-source directories
                 if self._should_skip_path(file_path):
                     continue
+                yield file_path
+
+    def _parse_inline(
+        self,
+        files: list[Path],
+        result: CodeElements,
+        cache: "ParseCache | None",
+        stats: OperationStats | None = None,
+    ) -> int:
+        """Parse files in this process, enforcing the per-file time budget.
 
-                try:
+        Returns:
+            Number of files parsed successfully.
+        """
+        parsed = 0
+        for file_path in files:
+            if self.parse_time_budget:
+                self._deadline = time.monotonic() + self.parse_time_budget
+
+            outcome = "parsed"
+            start = time.perf_counter()
+            try:
+                with span("parse_file", file=self._display_path(file_path), parser=self.language):
                     file_elements = self.parse_file(file_path)
-                    result.api_endpoints.extend(file_elements.api_endpoints)
-                    result.entities.extend(file_elements.entities)
-                    if file_elements.source_files:
-                        result.source_files.extend(file_elements.source_files)
-                except Exception:
-                    # Log error but continue parsing other files
-                    pass
+                result.extend(file_elements)
+                parsed += 1
+                if cache is not None:
+                    cache.put(file_path, self.language, file_elements)
+            except ParseTimeoutError:
+                # A slow or busy machine can overrun the budget once, so the
+                # file is only quarantined after repeated timeouts
+                outcome = "timeout"
+                reason = f"parse time budget ({self.parse_time_budget:g}s) exceeded"
+                if cache is not None and cache.record_timeout(file_path, reason):
+                    reason += "; quarantined until it changes"
+                result.warnings.append(f"Skipped: {self._display_path(file_path)} ({reason})")
+            except Exception as e:
+                # Report the error but continue parsing other files
+                outcome = "failed"
+                result.warnings.append(
+                    f"Failed: {self._display_path(file_path)} ({type(e).__name__}: {e})"
+                )
+            finally:
+                self._deadline = None
+            if stats is not None:
+                self._record_timing(stats, file_path, time.perf_counter() - start, outcome)
+        return parsed
 
-        return result
+    def _parse_isolated(
+        self,
+        files: list[Path],
+        result: CodeElements,
+        cache: "ParseCache | None",
+        stats: OperationStats | None = None,
+    ) -> int:
+        """Parse files in supervised worker processes.
+
+        Returns:
+            Number of files parsed successfully.
+        """
+        if not files:
+            return 0
+
+        from .worker import ParseWorkerPool
+
+        parsed = 0
+        pool = ParseWorkerPool(self.language, self.project_root)
+        for outcome in pool.parse_files(files):
+            status = "parsed"
+            if outcome.elements is not None:
+                result.extend(outcome.elements)
+                parsed += 1
+                if cache is not None:
+                    cache.put(outcome.file_path, self.language, outcome.elements)
+            elif outcome.quarantine_reason:
+                status = "quarantined"
+                result.warnings.append(
+                    f"Skipped: {self._display_path(outcome.file_path)} "
+                    f"({outcome.quarantine_reason})"
+                )
+                if cache is not None:
+                    cache.quarantine(outcome.file_path, outcome.quarantine_reason)
+            elif outcome.error:
+                status = "failed"
+                result.warnings.append(
+                    f"Failed: {self._display_path(outcome.file_path)} ({outcome.error})"
+                )
+            if stats is not None:
+                self._record_timing(stats, outcome.file_path, outcome.seconds or 0.0, status)
+        return parsed
+
+    def _check_budget(self) -> None:
+        """Abandon the current file if its parse time budget is used up."""
+        if self._deadline is not None and time.monotonic() > self._deadline:
+            raise ParseTimeoutError
+
+    def _record_timing(
+        self, stats: OperationStats, file_path: Path, seconds: float, outcome: str
+    ) -> None:
+        """Record the parse time, size and parser of one file."""
+        try:
+            size = file_path.stat().st_size
+        except OSError:
+            size = 0
+        stats.record_file(
+            FileTiming(
+                file_path=self._display_path(file_path),
+                parser=type(self).__name__,
+                size=size,
+                seconds=seconds,
+                outcome=outcome,
+            )
+        )
+
+    def _display_path(self, file_path: Path) -> str:
+        """Get a project-relative path for messages, falling back to the full path."""
+        try:
+            return str(file_path.relative_to(self.project_root))
+        except ValueError:
+            return str(file_path)
 
     def _should_skip_path(self, path: Path) -> bool:
         """Check if a path should be skipped during parsing."""
@@ -86,9 +298,26 @@ class CodeParser(ABC):
 
 
 class ParserRegistry:
-    """Registry for code parsers."""
+    """Registry for code parsers.
+
+    Parsers are registered by module path and imported on first use, so tools
+    that never parse code don't pay for compiling the parser patterns.
+    Third-party parsers register through the ``byebye_docs.parsers`` entry
+    point group (name = language, value = ``module:ParserClass``); built-in
+    languages take precedence over plugins with the same name.
+    """
 
     _parsers: ClassVar[dict[str, type[CodeParser]]] = {}
+    # language -> ("module:Class", file suffixes, or None if unknown until loaded)
+    _lazy: ClassVar[dict[str, tuple[str, tuple[str, ...] | None]]] = {
+        "python": (f"{__package__}.python_parser:PythonParser", (".py",)),
+        "typescript": (
+            f"{__package__}.typescript_parser:TypeScriptParser",
+            (".ts", ".tsx", ".js", ".jsx", ".mjs"),
+        ),
+    }
+    _load_errors: ClassVar[dict[str, str]] = {}
+    _discovered: ClassVar[bool] = False
 
     @classmethod
     def register(cls, parser_class: type[CodeParser]) -> type[CodeParser]:
@@ -96,10 +325,23 @@ class ParserRegistry:
         cls._parsers[parser_class.language] = parser_class
         return parser_class
 
+    @classmethod
+    def register_lazy(
+        cls, language: str, target: str, suffixes: tuple[str, ...] | None = None
+    ) -> None:
+        """Register a parser by import path, to be loaded on first use.
+
+        Args:
+            language: Language name the parser handles.
+            target: Import target in ``module:ClassName`` form.
+            suffixes: File suffixes the parser handles, if known without importing it.
+        """
+        cls._lazy[language] = (target, suffixes)
+
     @classmethod
     def get_parser(cls, language: str, project_root: Path) -> CodeParser | None:
         """Get a parser instance for the given language."""
-        parser_class = cls._parsers.get(language)
+        parser_class = cls._load(language)
         if parser_class:
             return parser_class(project_root)
         return None
@@ -109,13 +351,11 @@ class ParserRegistry:
         """Detect the primary language in a directory."""
         extension_counts: dict[str, int] = {}
 
-        for parser_class in cls._parsers.values():
-            for ext in parser_class.file_extensions:
+        for language in cls.available_languages():
+            for ext in cls._suffixes(language):
                 count = len(list(directory.rglob(f"*{ext}")))
                 if count > 0:
-                    extension_counts[parser_class.language] = (
-                        extension_counts.get(parser_class.language, 0) + count
-                    )
+                    extension_counts[language] = extension_counts.get(language, 0) + count
 
         if extension_counts:
             return max(extension_counts, key=extension_counts.get)  # type: ignore
@@ -124,12 +364,72 @@ class ParserRegistry:
     @classmethod
     def get_parser_for_file(cls, file_path: Path, project_root: Path) -> CodeParser | None:
         """Get a parser instance for the given file based on extension."""
-        for parser_class in cls._parsers.values():
-            if parser_class.supports_file(file_path):
-                return parser_class(project_root)
+        for language in cls.available_languages():
+            if file_path.suffix in cls._suffixes(language):
+                return cls.get_parser(language, project_root)
         return None
 
     @classmethod
     def available_languages(cls) -> list[str]:
-        """Get list of available parser languages."""
-        return list(cls._parsers.keys())
+        """Get list of available parser languages (without importing them)."""
+        cls._discover()
+        return list(dict.fromkeys([*cls._lazy, *cls._parsers]))
+
+    @classmethod
+    def load_errors(cls) -> dict[str, str]:
+        """Get parsers that failed to import, keyed by language."""
+        return dict(cls._load_errors)
+
+    @classmethod
+    def _discover(cls) -> None:
+        """Register parsers advertised through entry points (once)."""
+        if cls._discovered:
+            return
+        cls._discovered = True
+
+        try:
+            from importlib.metadata import entry_points
+
+            plugins = entry_points(group=PARSER_ENTRY_POINT_GROUP)
+        except Exception:
+            return
+
+        for entry_point in plugins:
+            if entry_point.name not in cls._parsers and entry_point.name not in cls._lazy:
+                cls._lazy[entry_point.name] = (entry_point.value, None)
+
+    @classmethod
+    def _load(cls, language: str) -> type[CodeParser] | None:
+        """Get the parser class for a language, importing it if needed."""
+        if language in cls._parsers:
+            return cls._parsers[language]
+
+        cls._discover()
+        spec = cls._lazy.get(language)
+        if spec is None:
+            return None
+
+        module_name, _, class_name = spec[0].partition(":")
+        try:
+            from importlib import import_module
+
+            parser_class = getattr(import_module(module_name), class_name)
+        except Exception as e:
+            # A broken plugin must not take the other languages down with it
+            del cls._lazy[language]
+            cls._load_errors[language] = f"{type(e).__name__}: {e}"
+            return None
+
+        cls._parsers[language] = parser_class
+        return parser_class
+
+    @classmethod
+    def _suffixes(cls, language: str) -> tuple[str, ...]:
+        """Get the file suffixes a language handles."""
+        if language in cls._parsers:
+            return tuple(cls._parsers[language].file_extensions)
+        spec = cls._lazy.get(language)
+        if spec and spec[1] is not None:
+            return spec[1]
+        parser_class = cls._load(language)
+        return tuple(parser_class.file_extensions) if parser_class else ()
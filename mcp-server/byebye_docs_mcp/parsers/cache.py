@@ -0,0 +1,396 @@
+"""Persistent per-file parse cache with quarantine support."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from ..metrics import cache_counter
+from ..models.code_elements import CodeElements
+
+# Bump when parser output changes so stale entries are discarded
+CACHE_VERSION = 2
+
+# Inline parse timeouts in a row (file unchanged) before a file is quarantined
+QUARANTINE_AFTER_TIMEOUTS = 3
+
+# Hits and misses of per-file lookups, reported by metrics://server
+_lookups = cache_counter("parse_cache")
+
+
+def persistent_cache_enabled() -> bool:
+    """Check whether parse results may be written to the project (BYEBYE_DOCS_PARSE_CACHE=1)."""
+    return os.environ.get("BYEBYE_DOCS_PARSE_CACHE", "0") not in ("", "0")
+
+
+class ParseCache:
+    """Cache of parse results keyed by file path, size and mtime.
+
+    Stored as JSON under ``.agent/.cache/parse_cache.json`` when persistent;
+    otherwise it lives only in this process and nothing is written. Files that hung
+    or crashed a parser are quarantined so later runs skip them immediately;
+    a quarantine entry is dropped as soon as the file changes. Files that only
+    ran over the inline time budget are quarantined after repeated timeouts.
+    """
+
+    def __init__(
+        self, project_root: Path, cache_path: Path | None = None, persistent: bool = True
+    ):
+        """Initialize cache for a project."""
+        self.project_root = project_root
+        self.cache_path = cache_path or project_root / ".agent" / ".cache" / "parse_cache.json"
+        self.persistent = persistent
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._quarantine: dict[str, dict[str, Any]] = {}
+        self._timeouts: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+        self._file_mtime_ns: int | None = None
+
+    def load(self) -> None:
+        """Load cache contents from disk (once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.persistent:
+            return
+
+        try:
+            self._file_mtime_ns = self.cache_path.stat().st_mtime_ns
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return
+
+        self._entries = data.get("entries", {})
+        self._quarantine = data.get("quarantine", {})
+        self._timeouts = data.get("timeouts", {})
+
+    def save(self) -> None:
+        """Write cache contents to disk if anything changed."""
+        if not self._dirty or not self.persistent:
+            return
+
+        data = {
+            "version": CACHE_VERSION,
+            "entries": self._entries,
+            "quarantine": self._quarantine,
+            "timeouts": self._timeouts,
+        }
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+            self._file_mtime_ns = self.cache_path.stat().st_mtime_ns
+        except OSError:
+            return
+
+        self._dirty = False
+
+    def reload_if_changed(self) -> bool:
+        """Reload from disk if another process rewrote the cache file.
+
+        Unsaved changes are kept (nothing is reloaded while dirty).
+
+        Returns:
+            True if the cache was reloaded.
+        """
+        if not self._loaded:
+            self.load()
+            return True
+        if self._dirty or not self.persistent:
+            return False
+
+        try:
+            mtime_ns = self.cache_path.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns == self._file_mtime_ns:
+            return False
+
+        self._entries = {}
+        self._quarantine = {}
+        self._timeouts = {}
+        self._loaded = False
+        self.load()
+        return True
+
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Get the raw cache entries keyed by project-relative path (read-only)."""
+        self.load()
+        return self._entries
+
+    def get(self, file_path: Path, language: str) -> CodeElements | None:
+        """Get cached elements for a file if it has not changed."""
+        self.load()
+        entry = self._entries.get(self._key(file_path))
+        if (
+            not entry
+            or entry.get("language") != language
+            or entry.get("signature") != self._signature(file_path)
+        ):
+            _lookups.misses += 1
+            return None
+        _lookups.hits += 1
+        return CodeElements.from_dict(entry["elements"])
+
+    def put(self, file_path: Path, language: str, elements: CodeElements) -> None:
+        """Store parse results for a file."""
+        self.load()
+        signature = self._signature(file_path)
+        if signature is None:
+            return
+
+        self._entries[self._key(file_path)] = {
+            "language": language,
+            "signature": signature,
+            "elements": elements.to_cache_dict(),
+        }
+        self._timeouts.pop(self._key(file_path), None)
+        self._dirty = True
+
+    def quarantined(self, file_path: Path) -> str | None:
+        """Get the quarantine reason for a file, or None if not quarantined."""
+        self.load()
+        key = self._key(file_path)
+        entry = self._quarantine.get(key)
+        if not entry:
+            return None
+        if entry.get("signature") != self._signature(file_path):
+            # File changed since it was quarantined - give it another chance
+            del self._quarantine[key]
+            self._dirty = True
+            return None
+        return entry.get("reason", "quarantined")
+
+    def quarantine(self, file_path: Path, reason: str) -> None:
+        """Quarantine a file so later runs skip it until it changes."""
+        self.load()
+        key = self._key(file_path)
+        self._entries.pop(key, None)
+        self._quarantine[key] = {
+            "signature": self._signature(file_path),
+            "reason": reason,
+        }
+        self._dirty = True
+
+    def prune(self, directory: Path, language: str, files: list[Path]) -> int:
+        """Drop entries of a language under a directory that were not found in its walk.
+
+        Returns:
+            Number of entries removed (deleted or renamed files).
+        """
+        self.load()
+        directory_key = self._key(directory)
+        prefix = "" if directory_key == "." else directory_key.rstrip("/") + "/"
+        current = {self._key(file_path) for file_path in files}
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if key.startswith(prefix) and entry.get("language") == language and key not in current
+        ]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._dirty = True
+        return len(stale)
+
+    def record_timeout(self, file_path: Path, reason: str) -> bool:
+        """Count a parse timeout; quarantine the file after repeated ones.
+
+        The count restarts when the file changes or parses successfully.
+
+        Returns:
+            True if the file is now quarantined.
+        """
+        self.load()
+        key = self._key(file_path)
+        signature = self._signature(file_path)
+        entry = self._timeouts.get(key)
+        count = entry["count"] + 1 if entry and entry.get("signature") == signature else 1
+        self._dirty = True
+
+        if count < QUARANTINE_AFTER_TIMEOUTS:
+            self._timeouts[key] = {"signature": signature, "count": count}
+            return False
+        self._timeouts.pop(key, None)
+        self.quarantine(file_path, f"{reason}, {count} times in a row")
+        return True
+
+    def quarantined_files(self) -> dict[str, str]:
+        """Get all quarantined files and their reasons."""
+        self.load()
+        return {key: entry.get("reason", "") for key, entry in self._quarantine.items()}
+
+    def clear(self) -> None:
+        """Remove all cached entries and quarantine records."""
+        self.load()
+        self._entries.clear()
+        self._quarantine.clear()
+        self._timeouts.clear()
+        self._dirty = True
+
+    def _key(self, file_path: Path) -> str:
+        """Get the cache key for a file (project-relative path)."""
+        try:
+            return file_path.relative_to(self.project_root).as_posix()
+        except ValueError:
+            return file_path.as_posix()
+
+    def _signature(self, file_path: Path) -> list[int] | None:
+        """Get the [size, mtime_ns] signature of a file."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+
+class FileKeyIndex:
+    """Reverse index from source file to the element keys it contributes.
+
+    Endpoint keys are "METHOD /path" and entity keys are schema names, as in
+    ``unique_key()``. Stored next to the parse cache as
+    ``.agent/.cache/file_keys.json`` (when persistent) and kept up to date
+    from it, so impact queries can be answered without loading or
+    re-parsing any sources.
+    """
+
+    def __init__(
+        self, project_root: Path, index_path: Path | None = None, persistent: bool = True
+    ):
+        """Initialize index for a project."""
+        self.project_root = project_root
+        self.index_path = index_path or project_root / ".agent" / ".cache" / "file_keys.json"
+        self.persistent = persistent
+        self._files: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load index contents from disk (once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.persistent:
+            return
+
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+            self._files = data.get("files", {})
+
+    def save(self) -> None:
+        """Write index contents to disk if anything changed."""
+        if not self._dirty or not self.persistent:
+            return
+
+        data = {"version": CACHE_VERSION, "files": self._files}
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            return
+
+        self._dirty = False
+
+    def update(self, cache: ParseCache) -> None:
+        """Re-index files whose parse cache entry changed, then save.
+
+        Files that dropped out of the parse cache keep their last known keys,
+        so a deleted file still reports what it used to define.
+        """
+        self.load()
+        for key, entry in cache.entries().items():
+            signature = entry.get("signature")
+            known = self._files.get(key)
+            if known is not None and known.get("signature") == signature:
+                continue
+
+            elements = entry.get("elements", {})
+            self._files[key] = {
+                "signature": signature,
+                "endpoints": sorted({
+                    f"{str(e.get('method', '')).upper()} {e.get('path', '')}"
+                    for e in elements.get("api_endpoints", [])
+                }),
+                "entities": sorted({
+                    e["schema"] for e in elements.get("entities", []) if e.get("schema")
+                }),
+            }
+            self._dirty = True
+
+        self.save()
+
+    def lookup(self, files: list[str]) -> dict[str, Any]:
+        """Get the element keys contributed by a set of files.
+
+        Args:
+            files: Paths relative to the project root (or absolute).
+
+        Returns:
+            Dict with sorted "endpoints" and "entities" keys, the per-file
+            breakdown and the files that are not in the index.
+        """
+        self.load()
+        endpoints: set[str] = set()
+        entities: set[str] = set()
+        per_file: dict[str, dict[str, list[str]]] = {}
+        unindexed: list[str] = []
+
+        for file_name in files:
+            key = self._key(file_name)
+            known = self._files.get(key)
+            if known is None:
+                unindexed.append(file_name)
+                continue
+            endpoints.update(known["endpoints"])
+            entities.update(known["entities"])
+            per_file[key] = {"endpoints": known["endpoints"], "entities": known["entities"]}
+
+        return {
+            "endpoints": sorted(endpoints),
+            "entities": sorted(entities),
+            "files": per_file,
+            "unindexed": unindexed,
+        }
+
+    def _key(self, file_name: str) -> str:
+        """Get the index key for a file (project-relative POSIX path)."""
+        path = Path(file_name)
+        if path.is_absolute():
+            try:
+                return path.relative_to(self.project_root).as_posix()
+            except ValueError:
+                return path.as_posix()
+        return path.as_posix().removeprefix("./")
+
+
+_memory_caches: dict[Path, tuple[ParseCache, FileKeyIndex]] = {}
+
+
+def memory_caches(project_root: Path) -> tuple[ParseCache, FileKeyIndex]:
+    """Get the in-process parse cache and reverse index of a project.
+
+    Used when the persistent cache is off: a long-running server still
+    reuses parse results between calls, and nothing is written to the project.
+    """
+    shared = _memory_caches.get(project_root)
+    if shared is None:
+        shared = _memory_caches[project_root] = (
+            ParseCache(project_root, persistent=False),
+            FileKeyIndex(project_root, persistent=False),
+        )
+    return shared
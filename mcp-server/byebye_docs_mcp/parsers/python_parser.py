@@ -1,11 +1,13 @@
 """Python AST-based code parser."""
 
 import ast
+import re
 from pathlib import Path
 from typing import Any, ClassVar
 
 from ..models.code_elements import ApiEndpoint, CodeElements, Entity, EntityField
 from .base import CodeParser, ParserRegistry
+from .source import has_any_marker, open_source
 
 
 @ParserRegistry.register
@@ -55,20 +57,29 @@ class PythonParser(CodeParser):
         # dataclass (handled separately via decorator)
     }
 
+    # Bytes-level prefilter: endpoints need a decorator and entities a class,
+    # so files with neither are skipped without running ast.parse
+    PREFILTER_MARKERS = (b"@", b"class")
+
     def parse_file(self, file_path: Path) -> CodeElements:
         """Parse a Python file and extract code elements."""
         result = CodeElements(language=self.language)
         result.source_files = [str(file_path)]
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(content, filename=str(file_path))
-        except (SyntaxError, UnicodeDecodeError):
+            with open_source(file_path) as source:
+                if not has_any_marker(source, self.PREFILTER_MARKERS):
+                    return result
+                # ast.parse takes the buffer directly and honours PEP 263 encodings
+                tree = ast.parse(source, filename=str(file_path))
+        except (SyntaxError, ValueError, OSError):
             return result
 
         rel_path = str(file_path.relative_to(self.project_root))
 
         for node in ast.walk(tree):
+            self._check_budget()
+
             # Extract API endpoints from decorated functions
             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 endpoints = self._extract_api_endpoints(node, rel_path)
@@ -229,8 +240,6 @@ class PythonParser(CodeParser):
         parameters = []
 
         # Extract path parameters from the path string
-        import re
-
         path_params = re.findall(r"\{(\w+)\}", path)
 
         for param in path_params:
@@ -0,0 +1,58 @@
+"""Low-copy source file access shared by the parsers."""
+
+import mmap
+import os
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20  # 1 MiB
+
+Buffer = bytes | mmap.mmap
+
+
+@contextmanager
+def open_source(file_path: Path) -> Iterator[Buffer]:
+    """Open a source file as a read-only bytes buffer.
+
+    Large files are memory-mapped, so bytes-level prefilters can scan them
+    without copying; small files are read in a single call. The buffer is
+    only valid inside the ``with`` block.
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            yield f.read()
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+def has_any_marker(buffer: Buffer, markers: tuple[bytes, ...]) -> bool:
+    """Check whether any literal marker occurs in the buffer (fast substring scan)."""
+    return any(buffer.find(marker) != -1 for marker in markers)
+
+
+def decode_source(buffer: Buffer) -> str:
+    """Decode a source buffer as UTF-8 (a single copy, no intermediate bytes)."""
+    return str(buffer, "utf-8")
+
+
+class LineIndex:
+    """Map string offsets to 1-based line numbers in O(log n)."""
+
+    def __init__(self, content: str):
+        """Index newline positions of content."""
+        self.content = content
+        self._newlines: list[int] = []
+        pos = content.find("\n")
+        while pos != -1:
+            self._newlines.append(pos)
+            pos = content.find("\n", pos + 1)
+
+    def line_of(self, pos: int) -> int:
+        """Get the line number containing the given offset."""
+        return bisect_left(self._newlines, pos) + 1
@@ -6,6 +6,7 @@ from typing import Any, ClassVar
 
 from ..models.code_elements import ApiEndpoint, CodeElements, Entity, EntityField
 from .base import CodeParser, ParserRegistry
+from .source import LineIndex, decode_source, has_any_marker, open_source
 
 
 @ParserRegistry.register
@@ -26,16 +27,22 @@ class TypeScriptParser(CodeParser):
     # HTTP methods
     HTTP_METHODS = {"get", "post", "put", "patch", "delete", "head", "options"}
 
+    # All patterns below are written to match in linear time: adjacent
+    # quantifiers never share characters, unbounded scans stop at a delimiter
+    # and identifiers are anchored at a word start, so a failed match cannot
+    # backtrack over the same input more than once.
+
     # Express-style route patterns
     EXPRESS_ROUTE_PATTERN = re.compile(
         r"(?:app|router|route)\s*\.\s*(get|post|put|patch|delete|head|options)\s*\("
-        r"\s*['\"`]([^'\"`]+)['\"`]",
+        r"\s*['\"`]([^'\"`\n]+)['\"`]",
         re.IGNORECASE,
     )
 
     # NestJS decorator patterns
     NESTJS_ROUTE_PATTERN = re.compile(
-        r"@(Get|Post|Put|Patch|Delete|Head|Options)\s*\(\s*['\"`]?([^'\"`\)]*)['\"`]?\s*\)",
+        r"@(Get|Post|Put|Patch|Delete|Head|Options)\s*\("
+        r"\s*(?:(?:['\"`]?([^'\"`()\s]+)['\"`]?|['\"`]{2})\s*)?\)",
         re.IGNORECASE,
     )
 
@@ -47,68 +54,88 @@ class TypeScriptParser(CodeParser):
 
     # Function/method patterns (for endpoint names)
     FUNCTION_PATTERN = re.compile(
-        r"(?:async\s+)?(?:function\s+)?(\w+)\s*\([^)]*\)\s*(?::\s*[^{]+)?\s*\{",
+        r"(?<![\w$])(?:async\s+)?(?:function\s+)?(\w+)\s*\((?:[^()]|\([^()]*\))*\)"
+        r"\s*(?::[^{;=]*)?\{",
     )
 
     # Arrow function patterns
     ARROW_FUNCTION_PATTERN = re.compile(
-        r"(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\([^)]*\)\s*(?::\s*[^=]+)?\s*=>",
+        r"(?<![\w$])(?:const|let|var)\s+(\w+)\s*=\s*(?:async\s*)?\((?:[^()]|\([^()]*\))*\)"
+        r"\s*(?::[^=;{]*)?=>",
     )
 
+    # Method definition pattern (methodName() or async methodName())
+    METHOD_PATTERN = re.compile(r"(?<![\w$])(?:async\s+)?(\w+)\s*\((?:[^()]|\([^()]*\))*\)")
+
     # TypeORM Entity decorator
     TYPEORM_ENTITY_PATTERN = re.compile(
-        r"@Entity\s*\(\s*(?:['\"`]([^'\"`]*)['\"`])?\s*\)",
+        r"@Entity\s*\(\s*(?:['\"`]([^'\"`]*)['\"`]\s*)?\)",
         re.IGNORECASE,
     )
 
     # TypeORM Column patterns
     TYPEORM_COLUMN_PATTERN = re.compile(
         r"@(Column|PrimaryGeneratedColumn|PrimaryColumn|CreateDateColumn|UpdateDateColumn)"
-        r"\s*\(\s*(?:\{([^}]*)\}|['\"`]?([^'\"`\)]*)['\"`]?)?\s*\)\s*\n?\s*(\w+)\s*[!?]?\s*:\s*([^;=]+)",
+        r"\s*\(\s*(?:(?:\{([^{}]*)\}|['\"`]?([^'\"`(){},\s]+)['\"`]?|['\"`]{2})\s*)?\)"
+        r"\s*(\w+)\s*(?:[!?]\s*)?:[ \t]*([^;=\n]+)",
         re.IGNORECASE,
     )
 
     # TypeScript interface pattern
     INTERFACE_PATTERN = re.compile(
-        r"(?:export\s+)?interface\s+(\w+)\s*(?:extends\s+[^{]+)?\s*\{([^}]+)\}",
+        r"(?:export\s+)?\binterface\s+(\w+)\s*(?:extends\b[^{]*)?\{([^}]+)\}",
         re.MULTILINE | re.DOTALL,
     )
 
     # TypeScript type alias pattern
     TYPE_ALIAS_PATTERN = re.compile(
-        r"(?:export\s+)?type\s+(\w+)\s*=\s*\{([^}]+)\}",
+        r"(?:export\s+)?\btype\s+(\w+)\s*=\s*\{([^}]+)\}",
         re.MULTILINE | re.DOTALL,
     )
 
     # TypeScript class pattern
     CLASS_PATTERN = re.compile(
-        r"(?:export\s+)?(?:abstract\s+)?class\s+(\w+)\s*(?:extends\s+(\w+))?\s*"
-        r"(?:implements\s+[^{]+)?\s*\{",
+        r"(?:export\s+)?(?:abstract\s+)?\bclass\s+(\w+)\s*(?:extends\s+(\w+)\s*)?"
+        r"(?:implements\b[^{]*)?\{",
         re.MULTILINE,
     )
 
     # Property pattern (for interfaces, types, classes)
     PROPERTY_PATTERN = re.compile(
-        r"^\s*(?:readonly\s+)?(\w+)\s*[?!]?\s*:\s*([^;,\n]+)",
+        r"^[ \t]*(?:readonly\s+)?(\w+)[ \t]*(?:([?!])[ \t]*)?:[ \t]*([^;,\n]+)",
         re.MULTILINE,
     )
 
     # Prisma model pattern (for .prisma files)
     PRISMA_MODEL_PATTERN = re.compile(
-        r"model\s+(\w+)\s*\{([^}]+)\}",
+        r"\bmodel\s+(\w+)\s*\{([^}]+)\}",
         re.MULTILINE | re.DOTALL,
     )
 
+    # Tokens relevant to brace matching: braces, comments and string literals
+    # (unterminated quotes end at the line break, comments at end of input)
+    BRACE_SCAN_PATTERN = re.compile(
+        r"[{}]|//[^\n]*|/\*.*?(?:\*/|\Z)"
+        r"|'(?:[^'\\\n]|\\.)*'?|\"(?:[^\"\\\n]|\\.)*\"?|`(?:[^`\\]|\\.)*`?",
+        re.DOTALL,
+    )
+
+    # Bytes-level prefilter: files without any of these markers cannot contain
+    # routes, entities, interfaces or models and are skipped without decoding
+    PREFILTER_MARKERS = (b"@", b"app", b"route", b"interface", b"type", b"model")
+
     PRISMA_FIELD_PATTERN = re.compile(
-        r"^\s*(\w+)\s+(\w+)(\[\])?\s*(\?)?\s*(@[^\n]+)?",
+        r"^[ \t]*(\w+)[ \t]+(\w+)(\[\])?[ \t]*(?:(\?)[ \t]*)?(@[^\n]+)?",
         re.MULTILINE,
     )
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, parse_time_budget: float | None = None):
         """Initialize parser with project root path."""
-        super().__init__(project_root)
+        super().__init__(project_root, parse_time_budget)
         # Prisma schema file extension
         self.file_extensions = list(self.file_extensions) + [".prisma"]
+        self._line_index: LineIndex | None = None
+        self._brace_pairs: dict[int, int] | None = None
 
     def parse_file(self, file_path: Path) -> CodeElements:
         """Parse a TypeScript/JavaScript file and extract code elements."""
@@ -116,11 +143,17 @@ class TypeScriptParser(CodeParser):
         result.source_files = [str(file_path)]
 
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, OSError):
+            with open_source(file_path) as source:
+                if not has_any_marker(source, self.PREFILTER_MARKERS):
+                    return result
+                content = decode_source(source)
+        except (OSError, ValueError):
             return result
 
         rel_path = str(file_path.relative_to(self.project_root))
+        # Line and brace indexes are built lazily on the first match
+        self._line_index = None
+        self._brace_pairs = None
 
         # Handle Prisma schema files
         if file_path.suffix == ".prisma":
@@ -148,9 +181,10 @@ class TypeScriptParser(CodeParser):
 
         # Extract Express-style routes
         for match in self.EXPRESS_ROUTE_PATTERN.finditer(content):
+            self._check_budget()
             method = match.group(1).upper()
             path = match.group(2)
-            line_number = content[: match.start()].count("\n") + 1
+            line_number = self._line_number(content, match.start())
 
             # Try to find the function name
             function_name = self._find_function_name(content, match.end())
@@ -168,10 +202,11 @@ class TypeScriptParser(CodeParser):
 
         # Extract NestJS-style routes
         for match in self.NESTJS_ROUTE_PATTERN.finditer(content):
+            self._check_budget()
             method = match.group(1).upper()
             path = match.group(2) or ""
             full_path = f"/{base_path}/{path}".replace("//", "/").rstrip("/") or "/"
-            line_number = content[: match.start()].count("\n") + 1
+            line_number = self._line_number(content, match.start())
 
             # Try to find the method name (next function after decorator)
             function_name = self._find_function_name(content, match.end())
@@ -192,21 +227,20 @@ class TypeScriptParser(CodeParser):
     def _find_function_name(self, content: str, start_pos: int) -> str | None:
         """Find the function name after a given position."""
         # Look for function definition within next 500 characters
-        search_content = content[start_pos : start_pos + 500]
+        end_pos = start_pos + 500
 
         # Try regular function
-        func_match = self.FUNCTION_PATTERN.search(search_content)
+        func_match = self.FUNCTION_PATTERN.search(content, start_pos, end_pos)
         if func_match:
             return func_match.group(1)
 
         # Try arrow function
-        arrow_match = self.ARROW_FUNCTION_PATTERN.search(search_content)
+        arrow_match = self.ARROW_FUNCTION_PATTERN.search(content, start_pos, end_pos)
         if arrow_match:
             return arrow_match.group(1)
 
         # Try method definition (methodName() or async methodName())
-        method_pattern = re.compile(r"(?:async\s+)?(\w+)\s*\([^)]*\)")
-        method_match = method_pattern.search(search_content)
+        method_match = self.METHOD_PATTERN.search(content, start_pos, end_pos)
         if method_match:
             name = method_match.group(1)
             if name not in ("if", "for", "while", "switch", "catch", "function"):
@@ -266,30 +300,35 @@ class TypeScriptParser(CodeParser):
         # Find @Entity decorators and their associated classes
         entity_matches = list(self.TYPEORM_ENTITY_PATTERN.finditer(content))
 
-        for entity_match in entity_matches:
+        for i, entity_match in enumerate(entity_matches):
+            self._check_budget()
             table_name = entity_match.group(1) if entity_match.group(1) else None
             entity_start = entity_match.start()
-            line_number = content[:entity_start].count("\n") + 1
+            line_number = self._line_number(content, entity_start)
 
             # Find the class definition after the @Entity decorator
-            class_search = content[entity_match.end() :]
-            class_match = self.CLASS_PATTERN.search(class_search)
+            class_match = self.CLASS_PATTERN.search(content, entity_match.end())
 
             if not class_match:
-                continue
+                # No class follows this decorator, so none follows the later ones
+                break
 
             class_name = class_match.group(1)
-            class_start = entity_match.end() + class_match.start()
+            class_start = class_match.start()
 
             # Find class body (content between { and matching })
             class_body_start = content.find("{", class_start)
             if class_body_start == -1:
-                continue
+                break
 
-            class_body = self._extract_balanced_braces(content[class_body_start:])
+            # An unclosed body ends where the next entity begins
+            next_entity_start = (
+                entity_matches[i + 1].start() if i + 1 < len(entity_matches) else len(content)
+            )
+            class_body_end = self._closing_brace(content, class_body_start, next_entity_start)
 
             # Extract columns
-            fields = self._extract_typeorm_columns(class_body)
+            fields = self._extract_typeorm_columns(content, class_body_start + 1, class_body_end)
 
             if fields:
                 entities.append(
@@ -304,11 +343,12 @@ class TypeScriptParser(CodeParser):
 
         return entities
 
-    def _extract_typeorm_columns(self, class_body: str) -> list[EntityField]:
-        """Extract column definitions from TypeORM entity class body."""
+    def _extract_typeorm_columns(self, content: str, start: int, end: int) -> list[EntityField]:
+        """Extract column definitions from the class body at content[start:end]."""
         fields = []
 
-        for match in self.TYPEORM_COLUMN_PATTERN.finditer(class_body):
+        for match in self.TYPEORM_COLUMN_PATTERN.finditer(content, start, end):
+            self._check_budget()
             decorator_type = match.group(1)
             options_str = match.group(2) or ""
             type_arg = match.group(3) or ""
@@ -350,9 +390,10 @@ class TypeScriptParser(CodeParser):
         model_suffixes = ("Model", "Entity", "Schema", "Record", "Data", "Dto", "DTO")
 
         for match in self.INTERFACE_PATTERN.finditer(content):
+            self._check_budget()
             interface_name = match.group(1)
             interface_body = match.group(2)
-            line_number = content[: match.start()].count("\n") + 1
+            line_number = self._line_number(content, match.start())
 
             # Skip interfaces that don't look like data models
             if not any(interface_name.endswith(suffix) for suffix in model_suffixes):
@@ -382,20 +423,20 @@ class TypeScriptParser(CodeParser):
 
         for match in self.PROPERTY_PATTERN.finditer(body):
             field_name = match.group(1)
-            ts_type = match.group(2).strip()
+            optional = match.group(2) == "?"
+            ts_type = match.group(3).strip()
 
             # Skip methods
             if "(" in ts_type and "=>" in ts_type:
                 continue
 
-            nullable = "?" in body.split(field_name)[0][-5:] if field_name in body else False
             field_type = self._ts_type_to_field_type(ts_type)
 
             fields.append(
                 EntityField(
                     name=field_name,
                     field_type=field_type,
-                    nullable=nullable or "null" in ts_type.lower(),
+                    nullable=optional or "null" in ts_type.lower(),
                 )
             )
 
@@ -408,9 +449,10 @@ class TypeScriptParser(CodeParser):
         model_suffixes = ("Model", "Entity", "Schema", "Record", "Data", "Dto", "DTO")
 
         for match in self.TYPE_ALIAS_PATTERN.finditer(content):
+            self._check_budget()
             type_name = match.group(1)
             type_body = match.group(2)
-            line_number = content[: match.start()].count("\n") + 1
+            line_number = self._line_number(content, match.start())
 
             # Only include types that look like data models
             if not any(type_name.endswith(suffix) for suffix in model_suffixes):
@@ -437,9 +479,10 @@ class TypeScriptParser(CodeParser):
         entities = []
 
         for match in self.PRISMA_MODEL_PATTERN.finditer(content):
+            self._check_budget()
             model_name = match.group(1)
             model_body = match.group(2)
-            line_number = content[: match.start()].count("\n") + 1
+            line_number = self._line_number(content, match.start())
 
             fields = self._extract_prisma_fields(model_body)
 
@@ -578,24 +621,36 @@ class TypeScriptParser(CodeParser):
         }
         return type_map.get(prisma_type, "string")
 
+    def _line_number(self, content: str, pos: int) -> int:
+        """Get the 1-based line number of an offset without copying content."""
+        if self._line_index is None or self._line_index.content is not content:
+            self._line_index = LineIndex(content)
+        return self._line_index.line_of(pos)
+
     def _to_snake_case(self, name: str) -> str:
         """Convert CamelCase to snake_case."""
         result = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
         result = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", result)
         return result.lower()
 
-    def _extract_balanced_braces(self, content: str) -> str:
-        """Extract content within balanced braces."""
-        if not content or content[0] != "{":
-            return ""
-
-        depth = 0
-        for i, char in enumerate(content):
-            if char == "{":
-                depth += 1
-            elif char == "}":
-                depth -= 1
-                if depth == 0:
-                    return content[1:i]
-
-        return content[1:]
+    def _closing_brace(self, content: str, open_pos: int, default: int) -> int:
+        """Get the index of the brace closing the one at open_pos, or default."""
+        if self._brace_pairs is None:
+            self._brace_pairs = self._match_braces(content)
+        return self._brace_pairs.get(open_pos, default)
+
+    def _match_braces(self, content: str) -> dict[int, int]:
+        """Pair every opening brace with its closing brace in a single pass.
+
+        Braces inside strings, template literals and comments are ignored;
+        unclosed braces are left out of the result.
+        """
+        pairs: dict[int, int] = {}
+        stack: list[int] = []
+        for match in self.BRACE_SCAN_PATTERN.finditer(content):
+            token = match.group()
+            if token == "{":
+                stack.append(match.start())
+            elif token == "}" and stack:
+                pairs[stack.pop()] = match.start()
+        return pairs
@@ -0,0 +1,270 @@
+"""Supervised worker processes for parsing untrusted or pathological inputs."""
+
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from pathlib import Path
+from typing import Any
+
+from ..models.code_elements import CodeElements
+from ..tracing import span
+
+# Wall-clock limit (seconds) for a single file in a worker
+DEFAULT_WORKER_TIMEOUT = 30.0
+
+# Resident memory limit (MB) for a worker process
+DEFAULT_WORKER_MAX_RSS_MB = 1024
+
+# Time allowed for a worker process to start and import the parsers (seconds)
+WORKER_STARTUP_TIMEOUT = 60.0
+
+# How often the supervisor checks deadlines and memory (seconds)
+POLL_INTERVAL = 0.05
+
+
+@dataclass
+class WorkerOutcome:
+    """Result of parsing one file in a worker."""
+
+    file_path: Path
+    elements: CodeElements | None = None
+    error: str | None = None
+    quarantine_reason: str | None = None
+    seconds: float | None = None  # wall time from hand-off to result
+
+
+def _worker_main(conn: Connection, language: str, project_root: str) -> None:
+    """Worker loop: receive file paths, send back parse results."""
+    from .base import ParserRegistry
+
+    parser = ParserRegistry.get_parser(language, Path(project_root))
+    if parser is None:
+        conn.close()
+        return
+
+    # The supervisor enforces the wall-clock limit
+    parser.parse_time_budget = None
+    conn.send(("ready", None))
+
+    while True:
+        try:
+            file_path = conn.recv()
+        except (EOFError, OSError):
+            break
+        if file_path is None:
+            break
+
+        try:
+            with span("parse_file", file=file_path, parser=language):
+                elements = parser.parse_file(Path(file_path))
+            conn.send(("ok", elements.to_cache_dict()))
+        except MemoryError:
+            conn.send(("quarantine", "memory limit exceeded"))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+    conn.close()
+
+
+def _env_limit(name: str, default: float) -> float:
+    """Read a positive numeric limit from the environment, warning on bad values."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        limit = float(value)
+    except ValueError:
+        limit = 0.0
+    if limit > 0:
+        return limit
+    print(f"byebye-docs: ignoring {name}={value!r}, using {default:g}", file=sys.stderr)
+    return default
+
+
+def _read_rss_mb(pid: int) -> float | None:
+    """Read resident set size of a process in MB (Linux /proc only)."""
+    try:
+        with open(f"/proc/{pid}/statm", encoding="ascii") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class _Worker:
+    """A single supervised worker process."""
+
+    def __init__(self, context: Any, language: str, project_root: Path):
+        parent_conn, child_conn = context.Pipe()
+        self.conn: Connection = parent_conn
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, language, str(project_root)),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.file_path = Path()
+        self.started = time.monotonic()
+
+    def assign(self, file_path: Path) -> None:
+        """Send a file to the worker."""
+        self.file_path = file_path
+        if self.ready:
+            self.started = time.monotonic()
+        self.conn.send(str(file_path))
+
+    def elapsed_limit(self, timeout: float) -> float:
+        """Get the wall-clock limit for the current state of the worker."""
+        return timeout if self.ready else WORKER_STARTUP_TIMEOUT + timeout
+
+    def kill(self) -> None:
+        """Terminate the worker immediately."""
+        self.process.kill()
+        self.process.join(timeout=1.0)
+        self.conn.close()
+
+    def stop(self) -> None:
+        """Ask the worker to exit and wait for it."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+        self.conn.close()
+
+
+class ParseWorkerPool:
+    """Pool of worker processes with per-file wall-clock and RSS limits.
+
+    Stuck or oversized workers are killed and replaced; the file they were
+    working on is reported with a quarantine reason.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        project_root: Path,
+        workers: int | None = None,
+        timeout: float | None = None,
+        max_rss_mb: float | None = None,
+    ):
+        """Initialize worker pool settings (processes start lazily)."""
+        self.language = language
+        self.project_root = project_root
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.timeout = timeout or _env_limit("BYEBYE_DOCS_WORKER_TIMEOUT", DEFAULT_WORKER_TIMEOUT)
+        self.max_rss_mb = max_rss_mb or _env_limit(
+            "BYEBYE_DOCS_WORKER_MAX_RSS_MB", DEFAULT_WORKER_MAX_RSS_MB
+        )
+        self._context = multiprocessing.get_context("spawn")
+
+    def parse_files(self, files: list[Path]) -> Iterator[WorkerOutcome]:
+        """Parse files in worker processes, yielding outcomes as they finish."""
+        pending = deque(files)
+        idle: list[_Worker] = []
+        busy: dict[Connection, _Worker] = {}
+        started = 0
+
+        try:
+            while pending or busy:
+                # Hand out work, starting workers as needed
+                while pending and (idle or started < self.workers):
+                    if idle:
+                        worker = idle.pop()
+                    else:
+                        worker = _Worker(self._context, self.language, self.project_root)
+                        started += 1
+                    worker.assign(pending.popleft())
+                    busy[worker.conn] = worker
+
+                for conn in wait(list(busy), timeout=POLL_INTERVAL):
+                    worker = busy[conn]  # type: ignore[index]
+                    if not worker.ready:
+                        if self._receive_ready(worker):
+                            continue
+                        # Start-up failure is not the file's fault: report, don't quarantine
+                        del busy[conn]  # type: ignore[arg-type]
+                        worker.kill()
+                        started -= 1
+                        yield WorkerOutcome(
+                            file_path=worker.file_path,
+                            error=f"worker failed to start (exit code {worker.process.exitcode})",
+                        )
+                        continue
+                    del busy[conn]  # type: ignore[arg-type]
+                    outcome, alive = self._receive(worker)
+                    outcome.seconds = time.monotonic() - worker.started
+                    if alive:
+                        idle.append(worker)
+                    else:
+                        worker.kill()
+                        started -= 1
+                    yield outcome
+
+                now = time.monotonic()
+                for conn, worker in list(busy.items()):
+                    reason = None
+                    if now - worker.started > worker.elapsed_limit(self.timeout):
+                        reason = f"timeout after {self.timeout:g}s"
+                    else:
+                        rss = _read_rss_mb(worker.process.pid)
+                        if rss is not None and rss > self.max_rss_mb:
+                            reason = f"memory limit exceeded ({rss:.0f}MB > {self.max_rss_mb:g}MB)"
+
+                    if reason:
+                        del busy[conn]
+                        worker.kill()
+                        started -= 1
+                        yield WorkerOutcome(
+                            file_path=worker.file_path,
+                            quarantine_reason=reason,
+                            seconds=now - worker.started,
+                        )
+        finally:
+            for worker in idle:
+                worker.stop()
+            for worker in busy.values():
+                worker.kill()
+
+    def _receive_ready(self, worker: _Worker) -> bool:
+        """Consume the worker's start-up message, if that is what arrived."""
+        try:
+            status, _ = worker.conn.recv()
+        except (EOFError, OSError):
+            return False
+        if status != "ready":
+            return False
+        worker.ready = True
+        worker.started = time.monotonic()
+        return True
+
+    def _receive(self, worker: _Worker) -> tuple[WorkerOutcome, bool]:
+        """Receive a message from a worker that became readable.
+
+        Returns:
+            Tuple of (outcome, whether the worker is still usable).
+        """
+        file_path = worker.file_path
+        try:
+            status, payload = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(timeout=1.0)
+            reason = f"worker crashed (exit code {worker.process.exitcode})"
+            return WorkerOutcome(file_path=file_path, quarantine_reason=reason), False
+
+        if status == "ok":
+            elements = CodeElements.from_dict(payload)
+            return WorkerOutcome(file_path=file_path, elements=elements), True
+        if status == "quarantine":
+            # A MemoryError may leave the worker in a bad state - replace it
+            return WorkerOutcome(file_path=file_path, quarantine_reason=payload), False
+        return WorkerOutcome(file_path=file_path, error=payload), True
@@ -0,0 +1,181 @@
+"""On-demand cProfile runs of tool calls.
+
+Any tool accepts ``profile: true`` (or every call is profiled when
+``BYEBYE_DOCS_PROFILE`` is set): the handler runs under cProfile and the
+top cumulative hotspots are returned as an extra content block after the
+normal result. The handler runs on its own thread, so only that call is
+measured. With ``profile_save: true`` (or ``BYEBYE_DOCS_PROFILE=save``)
+the raw ``.prof`` file is written to ``.agent/.cache/profiles`` for
+``snakeviz``/``pstats``.
+"""
+
+import asyncio
+import cProfile
+import functools
+import json
+import os
+import pstats
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Tool arguments consumed here and not passed on to the tool
+PROFILE_ARGUMENTS = {
+    "profile": {
+        "type": "boolean",
+        "description": "cProfileで実行してホットスポット上位を結果に付ける",
+        "default": False,
+    },
+    "profile_top": {
+        "type": "integer",
+        "description": "返すホットスポットの件数",
+        "default": 20,
+        "minimum": 1,
+    },
+    "profile_save": {
+        "type": "boolean",
+        "description": ".prof を .agent/.cache/profiles に保存する",
+        "default": False,
+    },
+}
+
+DEFAULT_TOP = 20
+
+# Only one cProfile profiler can be active per process
+_profiler_lock = threading.Lock()
+
+
+def hotspots(profiler: cProfile.Profile, top: int) -> list[dict[str, Any]]:
+    """Get the functions with the highest cumulative time."""
+    stats = pstats.Stats(profiler)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    rows = []
+    table = stats.stats  # type: ignore[attr-defined]
+    for func in stats.fcn_list[:top]:  # type: ignore[attr-defined]
+        primitive_calls, calls, own_time, cumulative_time, _ = table[func]
+        file_name, line, function_name = func
+        rows.append(
+            {
+                "function": function_name,
+                "location": f"{_short_path(file_name)}:{line}" if line else file_name,
+                "calls": calls if calls == primitive_calls else f"{calls}/{primitive_calls}",
+                "own_ms": round(own_time * 1000, 3),
+                "cumulative_ms": round(cumulative_time * 1000, 3),
+            }
+        )
+    return rows
+
+
+def save_profile(profiler: cProfile.Profile, project_root: Path, tool_name: str) -> Path:
+    """Write raw profile data under .agent/.cache/profiles."""
+    profile_dir = project_root / ".agent" / ".cache" / "profiles"
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    path = profile_dir / f"{stamp}_{tool_name}.prof"
+    profiler.dump_stats(path)
+    return path
+
+
+def profile_tool(
+    func: Callable[[str, dict[str, Any]], Coroutine[Any, Any, Any]],
+) -> Callable[[str, dict[str, Any]], Awaitable[Any]]:
+    """Wrap a call_tool handler so calls can be run under cProfile on request."""
+
+    @functools.wraps(func)
+    async def wrapper(name: str, arguments: dict[str, Any]) -> Any:
+        env_setting = os.environ.get("BYEBYE_DOCS_PROFILE", "")
+        wanted = bool(arguments.get("profile")) or env_setting not in ("", "0")
+        tool_arguments = {k: v for k, v in arguments.items() if k not in PROFILE_ARGUMENTS}
+        if not wanted:
+            return await func(name, tool_arguments)
+
+        top = profile_top(arguments)
+        if top is None:
+            value = arguments["profile_top"]
+            error = f"Invalid profile_top: {value!r} (expected a positive integer)"
+            return [_text({"error": error})]
+
+        if not _profiler_lock.acquire(blocking=False):
+            # Another call is being profiled; run this one normally
+            results = await func(name, tool_arguments)
+            return _with_report(results, {"error": "another call is being profiled"})
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            results = _run_profiled(profiler, func(name, tool_arguments))
+        finally:
+            _profiler_lock.release()
+
+        report: dict[str, Any] = {
+            "tool": name,
+            "profiler": "cProfile",
+            "wall_ms": round((time.perf_counter() - start) * 1000, 3),
+            "hotspots": hotspots(profiler, top),
+        }
+        if arguments.get("profile_save") or env_setting == "save":
+            from .server import get_project_root
+
+            report["saved"] = str(save_profile(profiler, get_project_root(), name))
+        return _with_report(results, report)
+
+    return wrapper
+
+
+def profile_top(arguments: dict[str, Any]) -> int | None:
+    """Get the requested number of hotspots, or None if it is not a positive integer."""
+    value = arguments.get("profile_top", DEFAULT_TOP)
+    if isinstance(value, bool):
+        return None
+    try:
+        top = int(value)
+    except (TypeError, ValueError):
+        return None
+    return top if top > 0 else None
+
+
+def _run_profiled(profiler: cProfile.Profile, coroutine: Coroutine[Any, Any, Any]) -> Any:
+    """Run a tool coroutine to completion on its own thread under the profiler.
+
+    The thread has its own event loop with nothing else on it, and cProfile
+    only records the thread that enabled it, so other calls never show up in
+    the report. The server's loop waits for the thread, as it does for the
+    synchronous tool handlers, so calls never overlap.
+    """
+
+    async def run() -> Any:
+        profiler.enable()
+        try:
+            return await coroutine
+        finally:
+            profiler.disable()
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile") as executor:
+        return executor.submit(asyncio.run, run()).result()
+
+
+def _text(data: dict[str, Any]) -> Any:
+    """Wrap a JSON payload in a text content block."""
+    from mcp.types import TextContent
+
+    return TextContent(type="text", text=json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def _with_report(results: Any, report: dict[str, Any]) -> Any:
+    """Append the profile report to a tool's content list."""
+    return [*results, _text({"profile": report})]
+
+
+def _short_path(file_name: str) -> str:
+    """Shorten a source path to start at its package (site-packages, stdlib, ...)."""
+    parts = Path(file_name).parts
+    for marker in ("site-packages", "byebye_docs_mcp", "lib"):
+        if marker in parts:
+            index = len(parts) - 1 - parts[::-1].index(marker)
+            start = index if marker == "byebye_docs_mcp" else index + 1
+            return "/".join(parts[start:])
+    return file_name
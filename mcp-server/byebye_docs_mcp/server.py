@@ -4,94 +4,43 @@ import json
 import os
 import re
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
+from urllib.parse import parse_qsl, unquote
 
-import yaml
 from mcp.server import Server
-from mcp.server.stdio import stdio_server
 from mcp.types import (
     GetPromptResult,
     Prompt,
     PromptArgument,
     PromptMessage,
     Resource,
+    ResourceTemplate,
     TextContent,
     Tool,
 )
 
-from .core import DiffEngine, SyncManager
-from .extractors import ApiExtractor, EntityExtractor
-from .parsers import ParserRegistry
-
-# Template structure definition (AI-optimized flat structure)
-TEMPLATE_STRUCTURE = {
-    ".agent": {
-        "manifest.yaml": {"required": True, "description": "ファイルインデックス・タスクルーティング"},
-        "context.yaml": {"required": True, "description": "プロダクト情報（ビジョン、要件、KPI）"},
-        "architecture.yaml": {"required": True, "description": "システム設計（コンポーネント、ドメインモデル）"},
-        "constraints.yaml": {"required": True, "description": "制約・禁止事項・セキュリティポリシー"},
-        "codegen.yaml": {"required": True, "description": "コード生成ルール（言語規約、テスト、コミット）"},
-        "schemas": {
-            "api.yaml": {"required": False, "description": "OpenAPI仕様"},
-            "entities.yaml": {"required": False, "description": "エンティティ定義"},
-        },
-    },
-}
-
-# Document schemas for validation (AI-optimized structure)
-DOCUMENT_SCHEMAS = {
-    "manifest.yaml": {
-        "type": "object",
-        "required": ["version", "files"],
-        "properties": {
-            "version": {"type": "string"},
-            "files": {"type": "object"},
-            "task_routing": {"type": "object"},
-        },
-    },
-    "context.yaml": {
-        "type": "object",
-        "required": ["version", "product"],
-        "properties": {
-            "version": {"type": "string"},
-            "product": {"type": "object"},
-            "requirements": {"type": "array"},
-            "kpis": {"type": "array"},
-        },
-    },
-    "architecture.yaml": {
-        "type": "object",
-        "required": ["version", "system"],
-        "properties": {
-            "version": {"type": "string"},
-            "system": {"type": "object"},
-            "components": {"type": "object"},
-            "domain_model": {"type": "object"},
-        },
-    },
-    "constraints.yaml": {
-        "type": "object",
-        "required": ["version", "security"],
-        "properties": {
-            "version": {"type": "string"},
-            "security": {"type": "object"},
-            "file_policy": {"type": "object"},
-            "escalation": {"type": "object"},
-            "roles": {"type": "object"},
-        },
-    },
-    "codegen.yaml": {
-        "type": "object",
-        "required": ["version", "languages"],
-        "properties": {
-            "version": {"type": "string"},
-            "languages": {"type": "object"},
-            "testing": {"type": "object"},
-            "commit": {"type": "object"},
-        },
-    },
-}
+from .metrics import cache_counter, instrument_resource, instrument_tool, metrics
+from .profiling import PROFILE_ARGUMENTS, profile_tool
+from .tracing import span
+from .validation import (
+    DOCUMENT_SCHEMAS,
+    template_structure,
+    validate_all_documents,
+    validate_document_file,
+)
+
+# The core, extractor and parser modules (and yaml) are imported inside the
+# tools that use them, so starting the server only pays for the MCP stack.
+
+# `version: "..."` field rewritten by fill_metadata
+VERSION_FIELD_PATTERN = re.compile(r'version:\s*"[^"]*"')
+
+# Serialized docs://list and project://current responses: uri -> (version, json)
+RESOURCE_JSON_CACHE_SIZE = 64
+_resource_json_cache: dict[str, tuple[Any, str]] = {}
+_resource_json_lookups = cache_counter("resource_json")
 
 
 def get_project_root() -> Path:
@@ -102,39 +51,23 @@ def get_project_root() -> Path:
     return Path.cwd()
 
 
-def flatten_structure(
-    structure: dict[str, Any], prefix: str = ""
-) -> list[dict[str, Any]]:
-    """Flatten nested structure into a list of file entries."""
-    result = []
-    for key, value in structure.items():
-        path = f"{prefix}/{key}" if prefix else key
-        if isinstance(value, dict) and "required" in value:
-            result.append({"path": path, **value})
-        elif isinstance(value, dict):
-            result.extend(flatten_structure(value, path))
-    return result
+@cache
+def template_structure_json() -> str:
+    """Get the template structure serialized as JSON (computed once)."""
+    return json.dumps(list(template_structure()), indent=2, ensure_ascii=False)
 
 
-def list_existing_docs(project_root: Path) -> list[dict[str, Any]]:
-    """List all existing documentation files in the project."""
-    docs = []
-    agent_dir = project_root / ".agent"
+@cache
+def document_schemas_json() -> str:
+    """Get the document schemas serialized as JSON (computed once)."""
+    return json.dumps(DOCUMENT_SCHEMAS, indent=2, ensure_ascii=False)
 
-    if not agent_dir.exists():
-        return docs
 
-    for file_path in agent_dir.rglob("*"):
-        if file_path.is_file() and file_path.suffix in (".yaml", ".yml"):
-            rel_path = file_path.relative_to(project_root)
-            stat = file_path.stat()
-            docs.append({
-                "path": str(rel_path),
-                "size": stat.st_size,
-                "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            })
+def list_existing_docs(project_root: Path) -> list[dict[str, Any]]:
+    """List all existing documentation files in the project (cached listing)."""
+    from .core.documents import get_docs_listing
 
-    return sorted(docs, key=lambda x: x["path"])
+    return get_docs_listing(project_root).entries()
 
 
 def get_project_info(project_root: Path) -> dict[str, Any]:
@@ -158,101 +91,175 @@ def get_project_info(project_root: Path) -> dict[str, Any]:
     agent_dir = project_root / ".agent"
     if agent_dir.exists():
         info["has_agent_dir"] = True
-        agent_files = []
-        for item in agent_dir.rglob("*.yaml"):
-            if item.is_file():
-                agent_files.append(str(item.relative_to(project_root)))
-        info["agent_files"] = sorted(agent_files)
+        agent_files = [
+            doc["path"] for doc in list_existing_docs(project_root)
+            if doc["path"].endswith(".yaml")
+        ]
+        info["agent_files"] = agent_files
         info["docs_count"] = len(agent_files)
 
     return info
 
 
-def read_document_content(project_root: Path, doc_path: str) -> str | None:
-    """Read content of a document file."""
-    full_path = project_root / doc_path
-    if full_path.exists() and full_path.is_file():
-        return full_path.read_text(encoding="utf-8")
-    return None
+def query_int(params: dict[str, str], name: str) -> int | None:
+    """Parse a non-negative integer query parameter.
 
+    Raises:
+        ValueError: If the value is not a non-negative integer.
+    """
+    if name not in params:
+        return None
+    value = params[name]
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise ValueError(f"Invalid {name}: {value!r} (expected a non-negative integer)")
+    return number
+
+
+def paginate(items: list[Any], params: dict[str, str], key: str | None = None) -> dict[str, Any]:
+    """Filter and slice a list using resource query parameters.
+
+    Args:
+        items: Items to paginate (dicts if key is given, else strings).
+        params: Query parameters: ``glob`` (fnmatch on the path), ``offset``, ``limit``.
+        key: Dict key holding the path to filter on.
+
+    Returns:
+        Page with total, offset, limit, next_offset and items.
+
+    Raises:
+        ValueError: If offset or limit is not a non-negative integer.
+    """
+    from fnmatch import fnmatchcase
+
+    pattern = params.get("glob")
+    if pattern:
+        items = [i for i in items if fnmatchcase(i[key] if key else i, pattern)]
+
+    offset = query_int(params, "offset") or 0
+    limit = query_int(params, "limit")
+    end = len(items) if limit is None else offset + limit
+
+    return {
+        "total": len(items),
+        "offset": offset,
+        "limit": limit,
+        "next_offset": end if end < len(items) else None,
+        "items": items[offset:end],
+    }
 
-def extract_section(content: str, section_name: str) -> str | None:
-    """Extract a specific section from markdown content."""
-    # Pattern to match markdown headers
-    pattern = rf"^##\s+{re.escape(section_name)}\s*$"
-    lines = content.split("\n")
 
-    in_section = False
-    section_lines = []
+def cached_resource_json(uri: str, version: Any, build: Any) -> str:
+    """Serialize a resource only when its version changed since the last read."""
+    cached = _resource_json_cache.get(uri)
+    if cached is not None and cached[0] == version:
+        _resource_json_lookups.hits += 1
+        return cached[1]
+    _resource_json_lookups.misses += 1
 
-    for line in lines:
-        if re.match(pattern, line, re.IGNORECASE):
-            in_section = True
-            section_lines.append(line)
-        elif in_section:
-            if re.match(r"^##\s+", line):
-                break
-            section_lines.append(line)
+    if len(_resource_json_cache) >= RESOURCE_JSON_CACHE_SIZE:
+        _resource_json_cache.clear()
+    text = json.dumps(build(), indent=2, ensure_ascii=False)
+    _resource_json_cache[uri] = (version, text)
+    return text
 
-    if section_lines:
-        return "\n".join(section_lines).strip()
-    return None
 
+def dump_json(data: Any, indent: int | None = 2) -> str:
+    """Serialize a tool result to JSON inside a trace span."""
+    with span("serialize"):
+        return json.dumps(data, indent=indent, ensure_ascii=False)
 
-def validate_yaml_document(
-    content: str, schema_name: str
-) -> dict[str, Any]:
-    """Validate a YAML document against its schema."""
-    result = {"valid": True, "errors": [], "warnings": []}
 
-    try:
-        data = yaml.safe_load(content)
-    except yaml.YAMLError as e:
-        result["valid"] = False
-        result["errors"].append(f"YAML parse error: {e}")
-        return result
+def fill_document_metadata(
+    content: str, metadata: dict[str, Any], today: str | None = None
+) -> str:
+    """Fill metadata placeholders (date, author, version) in document content."""
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    content = content.replace("YYYY-MM-DD", metadata.get("date", today))
 
-    if schema_name not in DOCUMENT_SCHEMAS:
-        result["warnings"].append(f"No schema defined for {schema_name}")
-        return result
+    if "author" in metadata:
+        content = content.replace("[担当者/AIエージェント名]", metadata["author"])
 
-    schema = DOCUMENT_SCHEMAS[schema_name]
+    if "version" in metadata:
+        version_line = f'version: "{metadata["version"]}"'
+        content = VERSION_FIELD_PATTERN.sub(lambda _: version_line, content)
 
-    # Basic validation
-    if schema.get("type") == "object" and not isinstance(data, dict):
-        result["valid"] = False
-        result["errors"].append("Document must be an object")
-        return result
+    return content
 
-    for required_field in schema.get("required", []):
-        if required_field not in data:
-            result["valid"] = False
-            result["errors"].append(f"Missing required field: {required_field}")
 
-    return result
+def fill_metadata_files(
+    project_root: Path, pattern: str, metadata: dict[str, Any]
+) -> dict[str, Any]:
+    """Fill metadata in every document matching a glob pattern.
 
+    Only files inside the project's ``.agent`` directory are touched; matches
+    elsewhere are skipped and counted. Only files whose content actually
+    changes are written.
 
-def validate_markdown_document(content: str, doc_type: str) -> dict[str, Any]:
-    """Validate a markdown document structure."""
-    result = {"valid": True, "errors": [], "warnings": []}
+    Args:
+        project_root: Project root directory.
+        pattern: Glob pattern relative to the project root (e.g. ".agent/**/*.yaml").
+        metadata: Metadata to fill in.
 
-    # Check for required sections based on doc type
-    required_sections = {
-        "vision.md": ["プロダクトの目的", "解決したい課題", "ターゲットユーザー"],
-        "system_overview.md": ["システム全体図", "コンポーネント構成"],
-        "coding_standards.md": ["言語別の基準"],
-    }
+    Returns:
+        Report with per-file status ("updated", "unchanged" or "error").
 
-    if doc_type in required_sections:
-        for section in required_sections[doc_type]:
-            if section not in content:
-                result["warnings"].append(f"Missing section: {section}")
+    Raises:
+        ValueError: If the pattern is empty, absolute, climbs out with ".." or
+            is not a valid glob.
+    """
+    from .core.documents import document_store, write_text_atomic
 
-    # Check for update metadata
-    if "_最終更新日:" not in content:
-        result["warnings"].append("Missing update date metadata")
+    if not pattern or Path(pattern).is_absolute() or ".." in Path(pattern).parts:
+        raise ValueError(f"Pattern must be relative to the project root: {pattern!r}")
 
-    return result
+    root = project_root.resolve()
+    agent_dir = root / ".agent"
+    try:
+        matches = sorted(root.glob(pattern))
+    except (ValueError, NotImplementedError) as e:
+        raise ValueError(f"Invalid pattern {pattern!r}: {e}") from None
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    files = []
+    outside = 0
+
+    for match in matches:
+        resolved = match.resolve()
+        if not resolved.is_relative_to(agent_dir):
+            outside += 1
+            continue
+        if not resolved.is_file():
+            continue
+        rel_path = resolved.relative_to(root).as_posix()
+        # Same path the document store is keyed by
+        file_path = project_root / rel_path
+        try:
+            content = file_path.read_text(encoding="utf-8")
+            new_content = fill_document_metadata(content, metadata, today)
+            if new_content == content:
+                files.append({"path": rel_path, "status": "unchanged"})
+                continue
+            write_text_atomic(file_path, new_content)
+            document_store.invalidate(file_path)
+        except (OSError, UnicodeDecodeError) as e:
+            files.append({"path": rel_path, "status": "error", "error": str(e)})
+            continue
+        files.append({"path": rel_path, "status": "updated"})
+
+    counts = {
+        status: sum(1 for f in files if f["status"] == status)
+        for status in ("updated", "unchanged", "error")
+    }
+    return {
+        "success": counts["error"] == 0,
+        "pattern": pattern,
+        "summary": {"matched": len(files), **counts, "skipped_outside_agent": outside},
+        "files": files,
+    }
 
 
 def get_template_for_doc(doc_type: str) -> str | None:
@@ -478,37 +485,131 @@ async def list_resources() -> list[Resource]:
         Resource(
             uri="project://current",
             name="Current Project",
-            description="現在のプロジェクト情報",
+            description="現在のプロジェクト情報（?limit=&offset=&glob= 対応）",
             mimeType="application/json",
         ),
         Resource(
             uri="docs://list",
             name="Document List",
-            description="プロジェクト内の既存ドキュメント一覧",
+            description="プロジェクト内の既存ドキュメント一覧（?limit=&offset=&glob= 対応）",
+            mimeType="application/json",
+        ),
+        Resource(
+            uri="metrics://server",
+            name="Server Metrics",
+            description="サーバー計測値（レイテンシ・キャッシュ・RSS、?format=prometheus 対応）",
             mimeType="application/json",
         ),
     ]
 
 
+@server.list_resource_templates()
+async def list_resource_templates() -> list[ResourceTemplate]:
+    """List available resource templates."""
+    return list(resource_template_definitions())
+
+
+@cache
+def resource_template_definitions() -> tuple[ResourceTemplate, ...]:
+    """Build the resource template definitions (once per process)."""
+    return (
+        ResourceTemplate(
+            uriTemplate="docs://api/{method}/{path}",
+            name="API Endpoint",
+            description="api.yaml の1エンドポイントだけ取得（例: docs://api/GET/users/{id}）",
+            mimeType="application/json",
+        ),
+        ResourceTemplate(
+            uriTemplate="docs://entities/{name}",
+            name="Entity",
+            description="entities.yaml の1エンティティだけ取得（例: docs://entities/User）",
+            mimeType="application/json",
+        ),
+    )
+
+
+def read_spec_element(project_root: Path, uri: str) -> str:
+    """Read one endpoint or entity from the spec index by resource URI."""
+    from .core.spec_index import get_spec_index
+
+    index = get_spec_index(project_root)
+
+    if uri.startswith("docs://api/"):
+        method, _, path = uri.removeprefix("docs://api/").partition("/")
+        path = unquote(path)
+        if not path.startswith("/"):
+            path = f"/{path}"
+        text = index.endpoint(method, path)
+        if text is None:
+            raise ValueError(f"Endpoint not found in api.yaml: {method.upper()} {path}")
+        return text
+
+    name = unquote(uri.removeprefix("docs://entities/"))
+    text = index.entity(name)
+    if text is None:
+        raise ValueError(f"Entity not found in entities.yaml: {name}")
+    return text
+
+
 @server.read_resource()
+@instrument_resource
 async def read_resource(uri: str) -> str:
     """Read a specific resource."""
+    # The MCP SDK passes a pydantic AnyUrl, which never compares equal to a str
+    uri = str(uri)
     project_root = get_project_root()
 
     if uri == "template://structure":
-        flat_structure = flatten_structure(TEMPLATE_STRUCTURE)
-        return json.dumps(flat_structure, indent=2, ensure_ascii=False)
+        return template_structure_json()
 
     elif uri == "template://schema":
-        return json.dumps(DOCUMENT_SCHEMAS, indent=2, ensure_ascii=False)
+        return document_schemas_json()
+
+    elif uri.startswith(("docs://api/", "docs://entities/")):
+        return read_spec_element(project_root, uri)
+
+    base_uri, _, query = uri.partition("?")
+    params = dict(parse_qsl(query))
+
+    if base_uri == "metrics://server":
+        if params.get("format") == "prometheus":
+            return metrics.prometheus()
+        return json.dumps(metrics.snapshot(), indent=2)
+
+    if base_uri == "project://current":
+        from .core.documents import get_docs_listing
 
-    elif uri == "project://current":
         info = get_project_info(project_root)
-        return json.dumps(info, indent=2, ensure_ascii=False)
+        version = (
+            str(project_root),
+            get_docs_listing(project_root).version,
+            info["exists"],
+            info["has_claude_md"],
+            info["has_agent_dir"],
+        )
+
+        def build_info() -> dict[str, Any]:
+            if not params:
+                return info
+            page = paginate(info["agent_files"], params)
+            return {
+                **info,
+                "agent_files": page["items"],
+                "agent_files_total": page["total"],
+                "next_offset": page["next_offset"],
+            }
+
+        return cached_resource_json(uri, version, build_info)
+
+    elif base_uri == "docs://list":
+        from .core.documents import get_docs_listing
 
-    elif uri == "docs://list":
         docs = list_existing_docs(project_root)
-        return json.dumps(docs, indent=2, ensure_ascii=False)
+        return cached_resource_json(
+            uri,
+            (str(project_root), get_docs_listing(project_root).version),
+            lambda: paginate(docs, params, key="path") if params else docs,
+        )
 
     else:
         raise ValueError(f"Unknown resource: {uri}")
@@ -517,7 +618,13 @@ async def read_resource(uri: str) -> str:
 @server.list_tools()
 async def list_tools() -> list[Tool]:
     """List available tools."""
-    return [
+    return list(tool_definitions())
+
+
+@cache
+def tool_definitions() -> tuple[Tool, ...]:
+    """Build the tool definitions (once per process)."""
+    tools = (
         Tool(
             name="list_templates",
             description="利用可能なテンプレート一覧を取得",
@@ -576,6 +683,25 @@ async def list_tools() -> list[Tool]:
                 "required": ["document_path", "section_name"],
             },
         ),
+        Tool(
+            name="get_sections",
+            description="ドキュメントの複数セクションを1回で取得",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "document_path": {
+                        "type": "string",
+                        "description": "ドキュメントのパス",
+                    },
+                    "section_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "取得するセクション名（markdownのヘッダー名）のリスト",
+                    },
+                },
+                "required": ["document_path", "section_names"],
+            },
+        ),
         Tool(
             name="update_section",
             description="ドキュメントの特定セクションを更新（マーカーベース）",
@@ -594,8 +720,13 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "新しいセクション内容",
                     },
+                    "sections": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "一括更新用: セクション名→新しい内容（書き込みは1回）",
+                    },
                 },
-                "required": ["document_path", "section_name", "new_content"],
+                "required": ["document_path"],
             },
         ),
         Tool(
@@ -612,6 +743,20 @@ async def list_tools() -> list[Tool]:
                 "required": ["document_path"],
             },
         ),
+        Tool(
+            name="validate_all",
+            description="ディレクトリ配下の全ドキュメントをまとめて検証（集計レポート）",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "directory": {
+                        "type": "string",
+                        "description": "検証するディレクトリ（プロジェクトルートからの相対パス）",
+                        "default": ".agent",
+                    },
+                },
+            },
+        ),
         Tool(
             name="fill_metadata",
             description="プロジェクト情報からメタデータを自動入力",
@@ -622,6 +767,10 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "メタデータを入力するドキュメントのパス",
                     },
+                    "pattern": {
+                        "type": "string",
+                        "description": "一括入力用のglob（例: .agent/**/*.yaml）",
+                    },
                     "metadata": {
                         "type": "object",
                         "description": "入力するメタデータ",
@@ -632,7 +781,6 @@ async def list_tools() -> list[Tool]:
                         },
                     },
                 },
-                "required": ["document_path"],
             },
         ),
         Tool(
@@ -657,6 +805,22 @@ async def list_tools() -> list[Tool]:
                         "description": "コードの言語（autoで自動検出）",
                         "default": "auto",
                     },
+                    "parse_mode": {
+                        "type": "string",
+                        "enum": ["inline", "isolated"],
+                        "description": "解析モード（isolatedは監視付きワーカーで解析）",
+                        "default": "inline",
+                    },
+                    "include_stats": {
+                        "type": "boolean",
+                        "description": "ファイル数・キャッシュヒット率・ステージ別時間を含める",
+                        "default": False,
+                    },
+                    "slowest_files": {
+                        "type": "integer",
+                        "description": "解析が遅かったファイル上位N件をstatsに含める",
+                        "default": 0,
+                    },
                 },
                 "required": ["code_path"],
             },
@@ -688,6 +852,12 @@ async def list_tools() -> list[Tool]:
                         "description": "既存ドキュメントとマージするか",
                         "default": False,
                     },
+                    "parse_mode": {
+                        "type": "string",
+                        "enum": ["inline", "isolated"],
+                        "description": "解析モード（isolatedは監視付きワーカーで解析）",
+                        "default": "inline",
+                    },
                 },
                 "required": ["code_path"],
             },
@@ -720,28 +890,110 @@ async def list_tools() -> list[Tool]:
                         "description": "コードの言語",
                         "default": "auto",
                     },
+                    "parse_mode": {
+                        "type": "string",
+                        "enum": ["inline", "isolated"],
+                        "description": "解析モード（isolatedは監視付きワーカーで解析）",
+                        "default": "inline",
+                    },
+                    "include_stats": {
+                        "type": "boolean",
+                        "description": "ファイル数・キャッシュヒット率・ステージ別時間を含める",
+                        "default": False,
+                    },
+                    "slowest_files": {
+                        "type": "integer",
+                        "description": "解析が遅かったファイル上位N件をstatsに含める",
+                        "default": 0,
+                    },
                 },
                 "required": ["mode"],
             },
         ),
-    ]
+        Tool(
+            name="search_elements",
+            description="抽出済みのエンドポイント・エンティティ・フィールドを検索",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "検索語（空白区切りでAND。パス・名前・型など）",
+                    },
+                    "kind": {
+                        "type": "string",
+                        "enum": ["endpoint", "entity", "field", "all"],
+                        "description": "検索対象の種類",
+                        "default": "all",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "最大件数",
+                        "default": 50,
+                    },
+                    "code_path": {
+                        "type": "string",
+                        "description": "指定すると検索前にこのパスを解析してインデックスを更新",
+                    },
+                },
+                "required": ["query"],
+            },
+        ),
+        Tool(
+            name="impact",
+            description="変更ファイルから影響を受けるAPI/エンティティを特定（キー限定の差分付き）",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "files": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "変更されたファイル（プロジェクトルートからの相対パス）",
+                    },
+                    "code_path": {
+                        "type": "string",
+                        "description": "指定すると解析して影響キーだけの差分を実行",
+                    },
+                    "doc_type": {
+                        "type": "string",
+                        "enum": ["api", "entities", "all"],
+                        "description": "比較対象のドキュメントタイプ",
+                        "default": "all",
+                    },
+                    "language": {
+                        "type": "string",
+                        "enum": ["python", "typescript", "auto"],
+                        "description": "コードの言語（autoで自動検出）",
+                        "default": "auto",
+                    },
+                },
+                "required": ["files"],
+            },
+        ),
+    )
+    # Every tool can be run under the profiler
+    for tool in tools:
+        tool.inputSchema.setdefault("properties", {}).update(PROFILE_ARGUMENTS)
+    return tools
 
 
 @server.call_tool()
+@instrument_tool
+@profile_tool
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
     project_root = get_project_root()
 
     if name == "list_templates":
         category = arguments.get("category")
-        flat_structure = flatten_structure(TEMPLATE_STRUCTURE)
+        if not category:
+            return [TextContent(type="text", text=template_structure_json())]
 
-        if category:
-            flat_structure = [
-                item for item in flat_structure
-                if item["path"].startswith(f"docs/{category}/") or
-                   item["path"].startswith(f"{category}/")
-            ]
+        flat_structure = [
+            item for item in template_structure()
+            if item["path"].startswith(f"docs/{category}/") or
+               item["path"].startswith(f"{category}/")
+        ]
 
         return [TextContent(
             type="text",
@@ -787,8 +1039,10 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         doc_path = arguments["document_path"]
         section_name = arguments["section_name"]
 
-        content = read_document_content(project_root, doc_path)
-        if content is None:
+        from .core.documents import document_store
+
+        document = document_store.get(project_root / doc_path)
+        if document is None:
             return [TextContent(
                 type="text",
                 text=json.dumps({
@@ -797,7 +1051,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 }),
             )]
 
-        section = extract_section(content, section_name)
+        section = document.section(section_name)
         return [TextContent(
             type="text",
             text=json.dumps({
@@ -806,13 +1060,14 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             }, ensure_ascii=False),
         )]
 
-    elif name == "update_section":
+    elif name == "get_sections":
         doc_path = arguments["document_path"]
-        section_name = arguments["section_name"]
-        new_content = arguments["new_content"]
+        section_names = arguments["section_names"]
 
-        full_path = project_root / doc_path
-        if not full_path.exists():
+        from .core.documents import document_store
+
+        document = document_store.get(project_root / doc_path)
+        if document is None:
             return [TextContent(
                 type="text",
                 text=json.dumps({
@@ -821,43 +1076,81 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 }),
             )]
 
-        content = full_path.read_text(encoding="utf-8")
+        sections = {section_name: document.section(section_name) for section_name in section_names}
+        missing = [section_name for section_name, text in sections.items() if text is None]
+        result = {"success": True, "sections": sections}
+        if missing:
+            result["missing"] = missing
+            result["available"] = document.heading_names()
 
-        # Look for AI_EDITABLE markers
-        marker_start = f"<!-- AI_EDITABLE_START: {section_name} -->"
-        marker_end = f"<!-- AI_EDITABLE_END: {section_name} -->"
+        return [TextContent(
+            type="text",
+            text=dump_json(result, indent=None),
+        )]
 
-        if marker_start in content and marker_end in content:
-            # Replace content between markers
-            pattern = re.compile(
-                rf"{re.escape(marker_start)}.*?{re.escape(marker_end)}",
-                re.DOTALL,
-            )
-            replacement = f"{marker_start}\n{new_content}\n{marker_end}"
-            new_full_content = pattern.sub(replacement, content)
-            full_path.write_text(new_full_content, encoding="utf-8")
+    elif name == "update_section":
+        doc_path = arguments["document_path"]
+        updates = dict(arguments.get("sections") or {})
+        if "section_name" in arguments:
+            updates[arguments["section_name"]] = arguments.get("new_content", "")
 
+        if not updates:
             return [TextContent(
                 type="text",
                 text=json.dumps({
-                    "success": True,
-                    "message": f"Section '{section_name}' updated successfully",
-                }, ensure_ascii=False),
+                    "success": False,
+                    "error": "Specify section_name/new_content or sections",
+                }),
             )]
-        else:
+
+        full_path = project_root / doc_path
+        if not full_path.exists():
             return [TextContent(
                 type="text",
                 text=json.dumps({
                     "success": False,
-                    "error": f"AI_EDITABLE markers not found for section: {section_name}",
+                    "error": f"Document not found: {doc_path}",
                 }),
             )]
 
+        from .core.documents import document_store, replace_editable_sections, write_text_atomic
+
+        content = full_path.read_text(encoding="utf-8")
+        new_full_content, updated, missing = replace_editable_sections(content, updates)
+
+        if missing:
+            # Nothing is written unless every section can be updated
+            return [TextContent(
+                type="text",
+                text=json.dumps({
+                    "success": False,
+                    "error": f"AI_EDITABLE markers not found for section: {', '.join(missing)}",
+                    "missing": missing,
+                }, ensure_ascii=False),
+            )]
+
+        if new_full_content != content:
+            write_text_atomic(full_path, new_full_content)
+            document_store.invalidate(full_path)
+
+        message = (
+            f"Section '{updated[0]}' updated successfully" if len(updated) == 1
+            else f"{len(updated)} sections updated successfully"
+        )
+        return [TextContent(
+            type="text",
+            text=json.dumps({
+                "success": True,
+                "message": message,
+                "updated": updated,
+            }, ensure_ascii=False),
+        )]
+
     elif name == "validate_document":
         doc_path = arguments["document_path"]
 
-        content = read_document_content(project_root, doc_path)
-        if content is None:
+        result = validate_document_file(project_root, doc_path)
+        if result is None:
             return [TextContent(
                 type="text",
                 text=json.dumps({
@@ -866,22 +1159,53 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 }),
             )]
 
-        doc_name = Path(doc_path).name
+        return [TextContent(
+            type="text",
+            text=dump_json(result),
+        )]
 
-        if doc_path.endswith((".yaml", ".yml")):
-            result = validate_yaml_document(content, doc_name)
-        else:
-            result = validate_markdown_document(content, doc_name)
+    elif name == "validate_all":
+        directory = arguments.get("directory", ".agent")
+        try:
+            report = validate_all_documents(project_root, directory)
+        except ValueError as e:
+            return [TextContent(
+                type="text",
+                text=json.dumps({"success": False, "error": str(e)}),
+            )]
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2, ensure_ascii=False),
+            text=dump_json(report),
         )]
 
     elif name == "fill_metadata":
-        doc_path = arguments["document_path"]
+        doc_path = arguments.get("document_path")
+        pattern = arguments.get("pattern")
         metadata = arguments.get("metadata", {})
 
+        if pattern:
+            try:
+                report = fill_metadata_files(project_root, pattern, metadata)
+            except ValueError as e:
+                return [TextContent(
+                    type="text",
+                    text=json.dumps({"success": False, "error": str(e)}, ensure_ascii=False),
+                )]
+            return [TextContent(
+                type="text",
+                text=dump_json(report),
+            )]
+
+        if not doc_path:
+            return [TextContent(
+                type="text",
+                text=json.dumps({
+                    "success": False,
+                    "error": "Specify document_path or pattern",
+                }),
+            )]
+
         full_path = project_root / doc_path
         if not full_path.exists():
             return [TextContent(
@@ -892,23 +1216,13 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 }),
             )]
 
-        content = full_path.read_text(encoding="utf-8")
-
-        # Fill in metadata fields
-        today = datetime.now().strftime("%Y-%m-%d")
-        content = content.replace("YYYY-MM-DD", metadata.get("date", today))
-
-        if "author" in metadata:
-            content = content.replace("[担当者/AIエージェント名]", metadata["author"])
-
-        if "version" in metadata:
-            content = re.sub(
-                r'version:\s*"[^"]*"',
-                f'version: "{metadata["version"]}"',
-                content,
-            )
+        from .core.documents import document_store, write_text_atomic
 
-        full_path.write_text(content, encoding="utf-8")
+        content = full_path.read_text(encoding="utf-8")
+        new_content = fill_document_metadata(content, metadata)
+        if new_content != content:
+            write_text_atomic(full_path, new_content)
+            document_store.invalidate(full_path)
 
         return [TextContent(
             type="text",
@@ -922,13 +1236,23 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         code_path = arguments["code_path"]
         doc_type = arguments.get("doc_type", "all")
         language = arguments.get("language", "auto")
-
-        diff_engine = DiffEngine(project_root)
-        result = diff_engine.diff(code_path, doc_type, language)
+        parse_mode = arguments.get("parse_mode")
+
+        from .core import DiffEngine
+        from .models.diff_result import result_payload
+
+        diff_engine = DiffEngine(project_root, parse_mode=parse_mode)
+        result = diff_engine.diff(
+            code_path,
+            doc_type,
+            language,
+            arguments.get("include_stats", False),
+            arguments.get("slowest_files", 0),
+        )
 
         return [TextContent(
             type="text",
-            text=json.dumps(result.to_dict(), indent=2, ensure_ascii=False),
+            text=dump_json(result_payload(result)),
         )]
 
     elif name == "extract_from_code":
@@ -936,8 +1260,12 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         extract_type = arguments.get("extract_type", "all")
         output_format = arguments.get("output_format", "yaml")
         merge_with_existing = arguments.get("merge_with_existing", False)
+        parse_mode = arguments.get("parse_mode")
 
-        diff_engine = DiffEngine(project_root)
+        from .core import DiffEngine
+        from .extractors import ApiExtractor, EntityExtractor
+
+        diff_engine = DiffEngine(project_root, parse_mode=parse_mode)
         code_elements, errors = diff_engine.get_code_elements(code_path)
 
         if errors:
@@ -959,6 +1287,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             )]
 
         result: dict[str, Any] = {"success": True, "extracted": {}}
+        if code_elements.warnings:
+            result["warnings"] = code_elements.warnings
 
         # Extract API endpoints
         if extract_type in ("api", "all"):
@@ -982,7 +1312,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         return [TextContent(
             type="text",
-            text=json.dumps(result, indent=2, ensure_ascii=False),
+            text=dump_json(result),
         )]
 
     elif name == "auto_sync":
@@ -990,13 +1320,65 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
         target_docs = arguments.get("target_docs")
         mode = arguments.get("mode", "preview")
         language = arguments.get("language", "auto")
+        parse_mode = arguments.get("parse_mode")
+
+        from .core import SyncManager
+        from .models.diff_result import result_payload
+
+        sync_manager = SyncManager(project_root, parse_mode=parse_mode)
+        result = sync_manager.sync(
+            code_path,
+            target_docs,
+            mode,
+            language,
+            arguments.get("include_stats", False),
+            arguments.get("slowest_files", 0),
+        )
+
+        return [TextContent(
+            type="text",
+            text=dump_json(result_payload(result)),
+        )]
+
+    elif name == "search_elements":
+        query = arguments["query"]
+        kind = arguments.get("kind", "all")
+        limit = arguments.get("limit", 50)
+        code_path = arguments.get("code_path")
+
+        from .core import DiffEngine
+        from .core.element_index import get_element_index
 
-        sync_manager = SyncManager(project_root)
-        result = sync_manager.sync(code_path, target_docs, mode, language)
+        errors: list[str] = []
+        if code_path:
+            # Parse first so the cache (and so the index) reflects the current code
+            _, errors = DiffEngine(project_root).get_code_elements(code_path)
+
+        index = get_element_index(project_root)
+        result = index.search(query, None if kind == "all" else kind, limit)
+        result["indexed"] = len(index)
+        if errors:
+            result["errors"] = errors
 
         return [TextContent(
             type="text",
-            text=json.dumps(result.to_dict(), indent=2, ensure_ascii=False),
+            text=dump_json(result),
+        )]
+
+    elif name == "impact":
+        files = arguments["files"]
+        code_path = arguments.get("code_path")
+        doc_type = arguments.get("doc_type", "all")
+        language = arguments.get("language", "auto")
+
+        from .core import DiffEngine
+
+        diff_engine = DiffEngine(project_root)
+        result = diff_engine.impact(files, code_path, doc_type, language)
+
+        return [TextContent(
+            type="text",
+            text=dump_json(result),
         )]
 
     else:
@@ -1121,7 +1503,10 @@ async def get_prompt(name: str, arguments: dict[str, str] | None) -> GetPromptRe
 
 async def run_server():
     """Run the MCP server."""
+    from mcp.server.stdio import stdio_server
+
     async with stdio_server() as (read_stream, write_stream):
+        metrics.watch_queue(read_stream)
         await server.run(
             read_stream,
             write_stream,
@@ -0,0 +1,162 @@
+"""Lightweight tracing spans for profiling real agent sessions.
+
+Spans wrap file discovery, each ``parse_file``, YAML loads, the API/entity
+diffs, extractor merges and JSON serialization of tool results. Tracing is
+off by default (``span`` returns a shared no-op context manager); set
+``BYEBYE_DOCS_TRACE`` to turn it on:
+
+- a file path: append one Chrome trace event per span as JSON lines (worker
+  processes append to the same file under their own pid);
+- ``otel``: forward spans to OpenTelemetry (the ``opentelemetry-api``
+  package must be installed and an SDK configured by the host).
+
+Convert a JSON-lines trace for chrome://tracing, Perfetto or speedscope:
+    python -m byebye_docs_mcp.tracing trace.jsonl -o trace.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, TextIO
+
+_NOOP = nullcontext()
+
+
+class JsonLinesTracer:
+    """Writes each finished span as a Chrome trace "complete" event (one JSON per line)."""
+
+    def __init__(self, path: Path):
+        """Initialize a tracer appending to a file (opened on the first span)."""
+        self.path = path
+        # Kept open for the life of the process; every event is flushed
+        self._file: TextIO | None = None
+        self._failed = False
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, Any]) -> Iterator[None]:
+        """Time a block and write it as a trace event."""
+        start_us = time.time_ns() // 1000
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": start_us,
+                "dur": round((time.perf_counter() - start) * 1_000_000, 1),
+                "pid": self._pid,
+                "tid": threading.get_ident(),
+                "args": attributes,
+            }
+            self._write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+
+    def _write(self, line: str) -> None:
+        """Append a line, turning tracing off with a warning if the file can't be written."""
+        with self._lock:
+            if self._failed:
+                return
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, "a", encoding="utf-8")
+                self._file.write(line)
+                self._file.flush()
+            except OSError as e:
+                self._failed = True
+                print(f"byebye-docs: cannot write trace ({e}), tracing off", file=sys.stderr)
+
+
+class OpenTelemetryTracer:
+    """Forwards spans to the OpenTelemetry API."""
+
+    def __init__(self):
+        """Initialize the bridge (raises ImportError without opentelemetry-api)."""
+        from opentelemetry import trace
+
+        self._tracer = trace.get_tracer("byebye-docs")
+
+    def span(self, name: str, attributes: dict[str, Any]) -> AbstractContextManager[Any]:
+        """Start an OpenTelemetry span as the current span."""
+        return self._tracer.start_as_current_span(
+            name,
+            attributes={
+                key: value if isinstance(value, (str, bool, int, float)) else str(value)
+                for key, value in attributes.items()
+            },
+        )
+
+
+_tracer: JsonLinesTracer | OpenTelemetryTracer | None = None
+
+
+def configure(target: str | None) -> None:
+    """Set the trace target: None or "" (off), "otel", or a JSON-lines file path."""
+    global _tracer
+    if not target:
+        _tracer = None
+    elif target == "otel":
+        try:
+            _tracer = OpenTelemetryTracer()
+        except ImportError:
+            print("byebye-docs: opentelemetry-api not installed, tracing off", file=sys.stderr)
+            _tracer = None
+    else:
+        _tracer = JsonLinesTracer(Path(target))
+
+
+def enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _tracer is not None
+
+
+def span(name: str, **attributes: Any) -> AbstractContextManager[Any]:
+    """Trace a block as a named span (a no-op unless tracing is configured)."""
+    if _tracer is None:
+        return _NOOP
+    return _tracer.span(name, attributes)
+
+
+def to_chrome_trace(lines: list[str]) -> dict[str, Any]:
+    """Wrap JSON-lines events in the Chrome trace JSON object format.
+
+    A line cut short by a killed process is skipped.
+    """
+    events = []
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            continue
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Convert a JSON-lines trace to a Chrome trace file."""
+    arg_parser = argparse.ArgumentParser(description="Convert a JSON-lines trace to Chrome format")
+    arg_parser.add_argument("trace", type=Path, help="JSON-lines trace written by the server")
+    arg_parser.add_argument("-o", "--output", type=Path, help="output file (default: stdout)")
+    args = arg_parser.parse_args(argv)
+
+    lines = args.trace.read_text(encoding="utf-8").splitlines()
+    text = json.dumps(to_chrome_trace(lines))
+    if args.output:
+        args.output.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+configure(os.environ.get("BYEBYE_DOCS_TRACE"))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""Document schemas and validation, shared by the MCP server and the CLI.
+
+Only depends on the standard library (jsonschema and yaml are imported when
+a document is validated), so the CLI can validate without loading the MCP stack.
+"""
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+# Template structure definition (AI-optimized flat structure)
+TEMPLATE_STRUCTURE = {
+    ".agent": {
+        "manifest.yaml": {
+            "required": True,
+            "description": "ファイルインデックス・タスクルーティング",
+        },
+        "context.yaml": {
+            "required": True,
+            "description": "プロダクト情報（ビジョン、要件、KPI）",
+        },
+        "architecture.yaml": {
+            "required": True,
+            "description": "システム設計（コンポーネント、ドメインモデル）",
+        },
+        "constraints.yaml": {
+            "required": True,
+            "description": "制約・禁止事項・セキュリティポリシー",
+        },
+        "codegen.yaml": {
+            "required": True,
+            "description": "コード生成ルール（言語規約、テスト、コミット）",
+        },
+        "schemas": {
+            "api.yaml": {"required": False, "description": "OpenAPI仕様"},
+            "entities.yaml": {"required": False, "description": "エンティティ定義"},
+        },
+    },
+}
+
+# Document schemas for validation (AI-optimized structure)
+DOCUMENT_SCHEMAS = {
+    "manifest.yaml": {
+        "type": "object",
+        "required": ["version", "files"],
+        "properties": {
+            "version": {"type": "string"},
+            "files": {"type": "object"},
+            "task_routing": {"type": "object"},
+        },
+    },
+    "context.yaml": {
+        "type": "object",
+        "required": ["version", "product"],
+        "properties": {
+            "version": {"type": "string"},
+            "product": {"type": "object"},
+            "requirements": {"type": "array"},
+            "kpis": {"type": "array"},
+        },
+    },
+    "architecture.yaml": {
+        "type": "object",
+        "required": ["version", "system"],
+        "properties": {
+            "version": {"type": "string"},
+            "system": {"type": "object"},
+            "components": {"type": "object"},
+            "domain_model": {"type": "object"},
+        },
+    },
+    "constraints.yaml": {
+        "type": "object",
+        "required": ["version", "security"],
+        "properties": {
+            "version": {"type": "string"},
+            "security": {"type": "object"},
+            "file_policy": {"type": "object"},
+            "escalation": {"type": "object"},
+            "roles": {"type": "object"},
+        },
+    },
+    "codegen.yaml": {
+        "type": "object",
+        "required": ["version", "languages"],
+        "properties": {
+            "version": {"type": "string"},
+            "languages": {"type": "object"},
+            "testing": {"type": "object"},
+            "commit": {"type": "object"},
+        },
+    },
+}
+
+
+def flatten_structure(
+    structure: dict[str, Any], prefix: str = ""
+) -> list[dict[str, Any]]:
+    """Flatten nested structure into a list of file entries."""
+    result = []
+    for key, value in structure.items():
+        path = f"{prefix}/{key}" if prefix else key
+        if isinstance(value, dict) and "required" in value:
+            result.append({"path": path, **value})
+        elif isinstance(value, dict):
+            result.extend(flatten_structure(value, path))
+    return result
+
+
+@cache
+def template_structure() -> tuple[dict[str, Any], ...]:
+    """Get the flattened template structure (computed once)."""
+    return tuple(flatten_structure(TEMPLATE_STRUCTURE))
+
+
+def read_document_content(project_root: Path, doc_path: str) -> str | None:
+    """Read content of a document file."""
+    full_path = project_root / doc_path
+    if full_path.exists() and full_path.is_file():
+        return full_path.read_text(encoding="utf-8")
+    return None
+
+
+@cache
+def get_schema_validator(schema_name: str) -> Any:
+    """Get a compiled validator for a document schema (built once per schema).
+
+    Returns:
+        A jsonschema validator, or None if no schema is defined.
+    """
+    schema = DOCUMENT_SCHEMAS.get(schema_name)
+    if schema is None:
+        return None
+
+    from jsonschema.validators import validator_for
+
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def validate_yaml_document(
+    content: str, schema_name: str
+) -> dict[str, Any]:
+    """Validate a YAML document against its schema."""
+    import yaml
+
+    result = {"valid": True, "errors": [], "warnings": []}
+
+    try:
+        data = yaml.safe_load(content)
+    except yaml.YAMLError as e:
+        result["valid"] = False
+        result["errors"].append(f"YAML parse error: {e}")
+        return result
+
+    validator = get_schema_validator(schema_name)
+    if validator is None:
+        result["warnings"].append(f"No schema defined for {schema_name}")
+        return result
+
+    if not isinstance(data, dict):
+        result["valid"] = False
+        result["errors"].append("Document must be an object")
+        return result
+
+    for error in sorted(
+        validator.iter_errors(data), key=lambda e: [str(p) for p in e.absolute_path]
+    ):
+        result["valid"] = False
+        if error.validator == "required" and not error.absolute_path:
+            missing = [f for f in error.validator_value if f not in data]
+            result["errors"].extend(f"Missing required field: {f}" for f in missing)
+            continue
+        location = ".".join(str(p) for p in error.absolute_path) or "(root)"
+        result["errors"].append(f"{location}: {error.message}")
+
+    # Several required errors can report the same missing fields
+    result["errors"] = list(dict.fromkeys(result["errors"]))
+    return result
+
+
+def validate_markdown_document(content: str, doc_type: str) -> dict[str, Any]:
+    """Validate a markdown document structure."""
+    result = {"valid": True, "errors": [], "warnings": []}
+
+    # Check for required sections based on doc type
+    required_sections = {
+        "vision.md": ["プロダクトの目的", "解決したい課題", "ターゲットユーザー"],
+        "system_overview.md": ["システム全体図", "コンポーネント構成"],
+        "coding_standards.md": ["言語別の基準"],
+    }
+
+    if doc_type in required_sections:
+        for section in required_sections[doc_type]:
+            if section not in content:
+                result["warnings"].append(f"Missing section: {section}")
+
+    # Check for update metadata
+    if "_最終更新日:" not in content:
+        result["warnings"].append("Missing update date metadata")
+
+    return result
+
+
+def validate_document_file(project_root: Path, doc_path: str) -> dict[str, Any] | None:
+    """Validate a document by path.
+
+    Returns:
+        Validation result (invalid if the file cannot be read or decoded),
+        or None if the document does not exist.
+    """
+    try:
+        content = read_document_content(project_root, doc_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return {"valid": False, "errors": [f"Could not read document: {e}"], "warnings": []}
+    if content is None:
+        return None
+
+    doc_name = Path(doc_path).name
+    if doc_path.endswith((".yaml", ".yml")):
+        return validate_yaml_document(content, doc_name)
+    return validate_markdown_document(content, doc_name)
+
+
+def validate_all_documents(project_root: Path, directory: str = ".agent") -> dict[str, Any]:
+    """Validate every document under a directory and aggregate the results.
+
+    Required template files that are missing are reported as well.
+
+    Raises:
+        ValueError: If the directory is outside the project root.
+    """
+    # ".agent/", "./.agent" and absolute paths all name the same directory
+    root = project_root.resolve()
+    base_dir = (root / directory).resolve()
+    try:
+        directory = base_dir.relative_to(root).as_posix()
+    except ValueError:
+        raise ValueError(f"Directory is outside the project: {directory}") from None
+    prefix = "" if directory == "." else f"{directory}/"
+
+    doc_paths = []
+    if base_dir.is_dir():
+        for file_path in base_dir.rglob("*"):
+            if file_path.is_file() and file_path.suffix in (".yaml", ".yml", ".md"):
+                doc_paths.append(file_path.relative_to(root).as_posix())
+    doc_paths.sort()
+
+    documents = []
+    for doc_path in doc_paths:
+        result = validate_document_file(project_root, doc_path)
+        if result is not None:
+            documents.append({"path": doc_path, **result})
+
+    existing = set(doc_paths)
+    missing_required = [
+        item["path"] for item in template_structure()
+        if item["required"] and item["path"].startswith(prefix)
+        and item["path"] not in existing
+    ]
+
+    invalid = [d for d in documents if not d["valid"]]
+    return {
+        "valid": not invalid and not missing_required,
+        "summary": {
+            "documents": len(documents),
+            "valid": len(documents) - len(invalid),
+            "invalid": len(invalid),
+            "errors": sum(len(d["errors"]) for d in documents),
+            "warnings": sum(len(d["warnings"]) for d in documents),
+        },
+        "missing_required": missing_required,
+        "documents": documents,
+    }
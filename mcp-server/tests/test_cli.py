@@ -0,0 +1,66 @@
+"""Tests for the command line exit codes."""
+
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.cli import EXIT_DRIFT, EXIT_ERROR, EXIT_OK, main
+from byebye_docs_mcp.core import SyncManager
+
+ROUTES = """
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/orders")
+def list_orders():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    """A project with one route and no docs yet."""
+    monkeypatch.delenv("BYEBYE_DOCS_PARSE_CACHE", raising=False)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "routes.py").write_text(ROUTES, encoding="utf-8")
+    return tmp_path
+
+
+def test_drift_exits_with_1(project, capsys):
+    assert main(["diff", "src", "--project", str(project)]) == EXIT_DRIFT
+    assert '"drift_detected"' in capsys.readouterr().out
+
+
+def test_in_sync_exits_with_0(project):
+    assert SyncManager(project).sync("src", mode="apply").success
+
+    assert main(["diff", "src", "--project", str(project)]) == EXIT_OK
+
+
+def test_missing_project_exits_with_2(tmp_path: Path):
+    assert main(["diff", "src", "--project", str(tmp_path / "missing")]) == EXIT_ERROR
+
+
+def test_negative_slowest_files_is_a_usage_error(project, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["diff", "src", "--project", str(project), "--slowest-files", "-1"])
+
+    assert exc.value.code == EXIT_ERROR
+    assert "non-negative integer" in capsys.readouterr().err
+
+
+def test_version_is_printed(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(["--version"])
+
+    assert exc.value.code == EXIT_OK
+    assert capsys.readouterr().out.startswith("byebye-docs ")
+
+
+def test_unknown_parse_mode_exits_with_2(project, monkeypatch, capsys):
+    monkeypatch.setenv("BYEBYE_DOCS_PARSE_MODE", "isloated")
+
+    assert main(["diff", "src", "--project", str(project)]) == EXIT_ERROR
+    assert "Unknown parse mode" in capsys.readouterr().out
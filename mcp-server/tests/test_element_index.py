@@ -0,0 +1,80 @@
+"""Tests for searching extracted elements."""
+
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.core import DiffEngine
+from byebye_docs_mcp.core.element_index import get_element_index
+
+ORDERS = """
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/orders")
+def list_orders():
+    pass
+
+
+@router.get("/orders/{order_id}")
+def get_order(order_id: int):
+    pass
+
+
+@router.get("/customers/{cid}/orders")
+def customer_orders(cid: int):
+    pass
+
+
+@router.get("/invoices")
+def list_invoices():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    """A parsed project with order and invoice routes."""
+    monkeypatch.delenv("BYEBYE_DOCS_PARSE_CACHE", raising=False)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "orders.py").write_text(ORDERS, encoding="utf-8")
+    DiffEngine(tmp_path).get_code_elements("src")
+    return tmp_path
+
+
+def keys(project: Path, query: str, kind: str | None = None) -> list[str]:
+    """Search the project's index and return the result keys in order."""
+    return [r["key"] for r in get_element_index(project).search(query, kind)["results"]]
+
+
+@pytest.mark.parametrize("query", ["/orders", "orders"])
+def test_path_segment_matches_every_endpoint_using_it(project, query):
+    assert sorted(keys(project, query)) == [
+        "GET /customers/{cid}/orders",
+        "GET /orders",
+        "GET /orders/{order_id}",
+    ]
+
+
+def test_exact_path_is_ranked_first(project):
+    assert keys(project, "/orders")[0] == "GET /orders"
+
+
+def test_multi_segment_path_intersects_segments(project):
+    assert keys(project, "/customers/{cid}/orders") == ["GET /customers/{cid}/orders"]
+
+
+def test_terms_are_intersected(project):
+    assert keys(project, "orders order_id") == ["GET /orders/{order_id}"]
+    assert keys(project, "orders invoices") == []
+
+
+def test_deleted_file_leaves_the_index(project):
+    assert keys(project, "invoices") == ["GET /invoices"]
+
+    (project / "src" / "orders.py").unlink()
+    (project / "src" / "other.py").write_text("x = 1\n", encoding="utf-8")
+    DiffEngine(project).get_code_elements("src")
+    assert keys(project, "invoices") == []
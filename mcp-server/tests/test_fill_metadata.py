@@ -0,0 +1,57 @@
+"""Tests for bulk metadata filling."""
+
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.server import fill_metadata_files
+
+TEMPLATE = "updated: YYYY-MM-DD\nowner: [担当者/AIエージェント名]\n"
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with placeholders both inside and outside .agent."""
+    (tmp_path / ".agent" / "schemas").mkdir(parents=True)
+    (tmp_path / ".agent" / "context.yaml").write_text(TEMPLATE, encoding="utf-8")
+    (tmp_path / ".agent" / "schemas" / "api.yaml").write_text(TEMPLATE, encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "notes.yaml").write_text(TEMPLATE, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("pattern", ["../*", ".agent/../../*", "/tmp/*", ""])
+def test_patterns_outside_the_project_are_rejected(project, pattern):
+    with pytest.raises(ValueError, match="relative to the project root"):
+        fill_metadata_files(project, pattern, {"author": "bot"})
+
+
+def test_absolute_glob_of_the_agent_dir_is_rejected(project):
+    with pytest.raises(ValueError):
+        fill_metadata_files(project, f"{project}/.agent/*.yaml", {"author": "bot"})
+
+    assert "bot" not in (project / ".agent" / "context.yaml").read_text(encoding="utf-8")
+
+
+def test_only_files_under_agent_are_rewritten(project):
+    report = fill_metadata_files(project, "**/*.yaml", {"author": "bot", "date": "2026-01-01"})
+
+    assert [f["path"] for f in report["files"]] == [
+        ".agent/context.yaml",
+        ".agent/schemas/api.yaml",
+    ]
+    assert report["summary"]["updated"] == 2
+    assert report["summary"]["skipped_outside_agent"] == 1
+    assert (project / ".agent" / "schemas" / "api.yaml").read_text(encoding="utf-8") == (
+        "updated: 2026-01-01\nowner: bot\n"
+    )
+    assert (project / "src" / "notes.yaml").read_text(encoding="utf-8") == TEMPLATE
+
+
+def test_symlink_out_of_agent_is_skipped(project):
+    (project / ".agent" / "link.yaml").symlink_to(project / "src" / "notes.yaml")
+
+    report = fill_metadata_files(project, ".agent/*.yaml", {"author": "bot"})
+
+    assert report["summary"]["skipped_outside_agent"] == 1
+    assert (project / "src" / "notes.yaml").read_text(encoding="utf-8") == TEMPLATE
@@ -0,0 +1,68 @@
+"""Tests for change-impact queries."""
+
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.core import DiffEngine, SyncManager
+
+ORDERS = """
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/orders")
+def list_orders():
+    pass
+
+
+@router.get("/orders/{order_id}")
+def get_order(order_id: int):
+    pass
+"""
+
+INVOICES = """
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/invoices")
+def list_invoices():
+    pass
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    """A project whose API spec was synced from two route files."""
+    monkeypatch.delenv("BYEBYE_DOCS_PARSE_CACHE", raising=False)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "orders.py").write_text(ORDERS, encoding="utf-8")
+    (tmp_path / "src" / "invoices.py").write_text(INVOICES, encoding="utf-8")
+    assert SyncManager(tmp_path).sync("src", mode="apply").success
+    return tmp_path
+
+
+def test_impact_without_code_path_uses_the_index(project):
+    impact = DiffEngine(project).impact(["src/orders.py"])
+
+    assert impact["endpoints"] == ["GET /orders", "GET /orders/{order_id}"]
+    assert impact["unindexed"] == []
+
+
+def test_scoped_diff_reports_only_the_changed_file(project):
+    # Both files lose a route, but only orders.py is asked about
+    (project / "src" / "orders.py").write_text(
+        ORDERS.split('@router.get("/orders/{order_id}")')[0], encoding="utf-8"
+    )
+    (project / "src" / "invoices.py").write_text("", encoding="utf-8")
+
+    impact = DiffEngine(project).impact(["src/orders.py"], code_path="src", doc_type="api")
+
+    assert impact["endpoints"] == ["GET /orders", "GET /orders/{order_id}"]
+    details = impact["diff"]["details"]
+    assert [(d["identifier"], d["drift_type"]) for d in details] == [
+        ("GET /orders/{order_id}", "removed_from_code")
+    ]
@@ -0,0 +1,28 @@
+"""Tests for resource query pagination."""
+
+import pytest
+
+from byebye_docs_mcp.server import paginate
+
+ITEMS = [".agent/a.yaml", ".agent/b.yaml", ".agent/schemas/api.yaml"]
+
+
+def test_limit_and_offset_slice_the_items():
+    page = paginate(ITEMS, {"limit": "1", "offset": "1"})
+
+    assert page["items"] == [".agent/b.yaml"]
+    assert page["next_offset"] == 2
+    assert page["total"] == 3
+
+
+def test_glob_filters_before_slicing():
+    page = paginate(ITEMS, {"glob": ".agent/schemas/*"})
+
+    assert page["items"] == [".agent/schemas/api.yaml"]
+    assert page["next_offset"] is None
+
+
+@pytest.mark.parametrize("params", [{"limit": "abc"}, {"offset": "-1"}, {"limit": "1.5"}])
+def test_invalid_paging_values_are_rejected(params):
+    with pytest.raises(ValueError, match="expected a non-negative integer"):
+        paginate(ITEMS, params)
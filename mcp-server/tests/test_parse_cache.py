@@ -0,0 +1,137 @@
+"""Tests for the parse cache: invalidation, quarantine and persistence."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.models.code_elements import CodeElements
+from byebye_docs_mcp.parsers import PythonParser
+from byebye_docs_mcp.parsers.base import ParseTimeoutError
+from byebye_docs_mcp.parsers.cache import QUARANTINE_AFTER_TIMEOUTS, ParseCache
+
+ROUTES = """
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/orders")
+def list_orders():
+    pass
+"""
+
+
+@pytest.fixture
+def source(tmp_path: Path) -> Path:
+    """A project with one FastAPI route file."""
+    (tmp_path / "src").mkdir()
+    file_path = tmp_path / "src" / "routes.py"
+    file_path.write_text(ROUTES, encoding="utf-8")
+    return file_path
+
+
+def touch_changed(file_path: Path) -> None:
+    """Change a file's size and mtime so its cache signature no longer matches."""
+    file_path.write_text(file_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    stat = file_path.stat()
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def timing_out_parser(project_root: Path, monkeypatch) -> PythonParser:
+    """A parser whose every file runs over the time budget."""
+    parser = PythonParser(project_root, parse_time_budget=1.0)
+
+    def parse_file(file_path: Path) -> CodeElements:
+        raise ParseTimeoutError
+
+    monkeypatch.setattr(parser, "parse_file", parse_file)
+    return parser
+
+
+def test_changed_file_is_not_served_from_cache(tmp_path, source):
+    cache = ParseCache(tmp_path)
+    cache.put(source, "python", CodeElements(language="python"))
+    assert cache.get(source, "python") is not None
+
+    touch_changed(source)
+    assert cache.get(source, "python") is None
+
+
+def test_cache_round_trips_through_disk(tmp_path, source):
+    cache = ParseCache(tmp_path)
+    PythonParser(tmp_path).parse_directory(tmp_path / "src", cache=cache)
+
+    reloaded = ParseCache(tmp_path)
+    cached = reloaded.get(source, "python")
+    assert cached is not None
+    assert [e.path for e in cached.api_endpoints] == ["/orders"]
+
+
+def test_memory_cache_writes_nothing(tmp_path, source):
+    cache = ParseCache(tmp_path, persistent=False)
+    PythonParser(tmp_path).parse_directory(tmp_path / "src", cache=cache)
+
+    assert cache.get(source, "python") is not None
+    assert not (tmp_path / ".agent").exists()
+
+
+def test_deleted_files_are_pruned(tmp_path, source):
+    cache = ParseCache(tmp_path, persistent=False)
+    parser = PythonParser(tmp_path)
+    parser.parse_directory(tmp_path / "src", cache=cache)
+    assert "src/routes.py" in cache.entries()
+
+    source.unlink()
+    parser.parse_directory(tmp_path / "src", cache=cache)
+    assert "src/routes.py" not in cache.entries()
+
+
+def test_inline_timeout_quarantines_only_after_repeats(tmp_path, source, monkeypatch):
+    cache = ParseCache(tmp_path, persistent=False)
+    parser = timing_out_parser(tmp_path, monkeypatch)
+
+    for _ in range(QUARANTINE_AFTER_TIMEOUTS - 1):
+        result = parser.parse_directory(tmp_path / "src", cache=cache)
+        assert cache.quarantined(source) is None
+        assert "budget" in result.warnings[0]
+
+    parser.parse_directory(tmp_path / "src", cache=cache)
+    assert cache.quarantined(source) is not None
+
+    result = parser.parse_directory(tmp_path / "src", cache=cache)
+    assert result.warnings[0].startswith("Quarantined, skipped: src/routes.py")
+
+
+def test_quarantine_is_lifted_when_file_changes(tmp_path, source):
+    cache = ParseCache(tmp_path)
+    cache.quarantine(source, "worker killed")
+    assert cache.quarantined(source) == "worker killed"
+
+    touch_changed(source)
+    assert cache.quarantined(source) is None
+
+    result = PythonParser(tmp_path).parse_directory(tmp_path / "src", cache=cache)
+    assert [e.path for e in result.api_endpoints] == ["/orders"]
+
+
+def test_successful_parse_resets_timeout_count(tmp_path, source):
+    cache = ParseCache(tmp_path, persistent=False)
+    for _ in range(QUARANTINE_AFTER_TIMEOUTS - 1):
+        assert not cache.record_timeout(source, "slow")
+
+    cache.put(source, "python", CodeElements(language="python"))
+    for _ in range(QUARANTINE_AFTER_TIMEOUTS - 1):
+        assert not cache.record_timeout(source, "slow")
+    assert cache.quarantined(source) is None
+
+
+def test_inline_parse_failure_is_reported(tmp_path, source, monkeypatch):
+    parser = PythonParser(tmp_path)
+
+    def parse_file(file_path: Path) -> CodeElements:
+        raise SyntaxError("unexpected token")
+
+    monkeypatch.setattr(parser, "parse_file", parse_file)
+    result = parser.parse_directory(tmp_path / "src")
+    assert result.warnings == ["Failed: src/routes.py (SyntaxError: unexpected token)"]
@@ -0,0 +1,61 @@
+"""Tests for on-demand profiling of tool calls."""
+
+import asyncio
+import json
+
+import pytest
+
+from byebye_docs_mcp.profiling import DEFAULT_TOP, profile_tool, profile_top
+
+
+def other_task_work() -> int:
+    return sum(i * i for i in range(20000))
+
+
+def tool_work() -> int:
+    return sum(range(1000))
+
+
+@profile_tool
+async def handler(name: str, arguments: dict) -> list:
+    tool_work()
+    return []
+
+
+@pytest.mark.parametrize(
+    ("arguments", "expected"),
+    [({}, DEFAULT_TOP), ({"profile_top": 5}, 5), ({"profile_top": "7"}, 7)],
+)
+def test_profile_top_accepts_positive_integers(arguments, expected):
+    assert profile_top(arguments) == expected
+
+
+@pytest.mark.parametrize("value", ["x", 0, -3, True, None])
+def test_profile_top_rejects_other_values(value):
+    assert profile_top({"profile_top": value}) is None
+
+
+def test_invalid_profile_top_returns_an_error():
+    results = asyncio.run(handler("demo", {"profile": True, "profile_top": "x"}))
+
+    assert "Invalid profile_top" in json.loads(results[0].text)["error"]
+
+
+def test_report_only_covers_the_profiled_call():
+    async def other_task() -> None:
+        for _ in range(20):
+            other_task_work()
+            await asyncio.sleep(0)
+
+    async def main() -> list:
+        task = asyncio.create_task(other_task())
+        await asyncio.sleep(0)
+        results = await handler("demo", {"profile": True, "profile_top": 100})
+        await task
+        return results
+
+    report = json.loads(asyncio.run(main())[-1].text)["profile"]
+
+    functions = {h["function"] for h in report["hotspots"]}
+    assert "tool_work" in functions
+    assert "other_task_work" not in functions
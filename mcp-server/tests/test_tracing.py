@@ -0,0 +1,30 @@
+"""Tests for tracing spans."""
+
+import json
+from pathlib import Path
+
+from byebye_docs_mcp.tracing import JsonLinesTracer
+
+
+def test_trace_file_is_written_on_the_first_span(tmp_path: Path):
+    path = tmp_path / "traces" / "trace.jsonl"
+    tracer = JsonLinesTracer(path)
+    assert not path.exists()
+
+    with tracer.span("parse_file", {"file": "a.ts"}):
+        pass
+
+    event = json.loads(path.read_text(encoding="utf-8"))
+    assert event["name"] == "parse_file"
+    assert event["args"] == {"file": "a.ts"}
+
+
+def test_unwritable_trace_file_turns_tracing_off(tmp_path: Path, capsys):
+    (tmp_path / "not_a_dir").write_text("", encoding="utf-8")
+    tracer = JsonLinesTracer(tmp_path / "not_a_dir" / "trace.jsonl")
+
+    for _ in range(2):
+        with tracer.span("parse_file", {}):
+            pass
+
+    assert capsys.readouterr().err.count("tracing off") == 1
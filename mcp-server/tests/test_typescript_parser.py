@@ -0,0 +1,87 @@
+"""Tests for the TypeScript parser, including pathological inputs."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.bench.parse_fuzz import adversarial_prisma, adversarial_typescript
+from byebye_docs_mcp.parsers import TypeScriptParser
+
+# The backtracking patterns these inputs were built against took minutes
+PARSE_BOUND_SECONDS = 2.0
+CORPUS = {**adversarial_typescript(20_000), **adversarial_prisma(20_000)}
+
+CONTROLLER = """
+@Controller('users')
+export class UsersController {
+  @Get(':id')
+  async findOne(@Param('id') id: string): Promise<User> {
+    return { id };
+  }
+}
+"""
+
+ENTITIES = """
+@Entity('users')
+export class User {
+  @PrimaryGeneratedColumn('uuid')
+  id: string;
+
+  @Column({ nullable: true })
+  email: string;
+
+  helper() {
+    if (this.email) { return { a: { b: 1 } }; }
+  }
+}
+
+@Entity()
+export class Order {
+  @Column()
+  total: number;
+}
+
+export interface UserDto {
+  name: string;
+  nickname?: string;
+}
+"""
+
+
+def parse(tmp_path: Path, name: str, content: str):
+    """Write a source file and parse it without a time budget."""
+    file_path = tmp_path / name
+    file_path.write_text(content, encoding="utf-8")
+    return TypeScriptParser(tmp_path, parse_time_budget=None).parse_file(file_path)
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_pathological_input_parses_in_bounded_time(tmp_path, name):
+    start = time.perf_counter()
+    parse(tmp_path, name, CORPUS[name])
+    assert time.perf_counter() - start < PARSE_BOUND_SECONDS
+
+
+def test_nest_controller_route(tmp_path):
+    result = parse(tmp_path, "users.controller.ts", CONTROLLER)
+    assert [(e.method, e.path, e.function_name) for e in result.api_endpoints] == [
+        ("GET", "/users/:id", "findOne")
+    ]
+
+
+def test_typeorm_entities_with_nested_braces(tmp_path):
+    result = parse(tmp_path, "entities.ts", ENTITIES)
+    entities = {e.name: e for e in result.entities}
+
+    assert [f.name for f in entities["User"].fields] == ["id", "email"]
+    assert entities["User"].table_name == "users"
+    assert [f.name for f in entities["Order"].fields] == ["total"]
+
+
+def test_interface_optional_fields_are_nullable(tmp_path):
+    result = parse(tmp_path, "dto.ts", ENTITIES)
+    fields = {f.name: f for e in result.entities if e.name == "UserDto" for f in e.fields}
+
+    assert fields["name"].nullable is False
+    assert fields["nickname"].nullable is True
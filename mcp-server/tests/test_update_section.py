@@ -0,0 +1,94 @@
+"""Tests for batched AI_EDITABLE section updates."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.core import documents
+from byebye_docs_mcp.core.documents import replace_editable_sections, write_text_atomic
+from byebye_docs_mcp.server import call_tool
+
+DOCUMENT = """# Design
+
+<!-- AI_EDITABLE_START: overview -->
+old overview
+<!-- AI_EDITABLE_END: overview -->
+
+<!-- AI_EDITABLE_START: decisions -->
+old decisions
+<!-- AI_EDITABLE_END: decisions -->
+"""
+
+NESTED = """<!-- AI_EDITABLE_START: outer -->
+<!-- AI_EDITABLE_START: inner -->
+text
+<!-- AI_EDITABLE_END: inner -->
+<!-- AI_EDITABLE_END: outer -->
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path, monkeypatch) -> Path:
+    """A project with one document holding two editable sections."""
+    (tmp_path / ".agent").mkdir()
+    (tmp_path / ".agent" / "design.md").write_text(DOCUMENT, encoding="utf-8")
+    monkeypatch.setenv("BYEBYE_DOCS_PROJECT_PATH", str(tmp_path))
+    return tmp_path
+
+
+def update_section(arguments: dict) -> dict:
+    results = asyncio.run(call_tool("update_section", arguments))
+    return json.loads(results[0].text)
+
+
+def test_batch_updates_every_section(project):
+    result = update_section(
+        {
+            "document_path": ".agent/design.md",
+            "sections": {"overview": "new overview", "decisions": "new decisions"},
+        }
+    )
+
+    content = (project / ".agent" / "design.md").read_text(encoding="utf-8")
+    assert result["success"] is True
+    assert result["updated"] == ["overview", "decisions"]
+    assert "new overview" in content and "new decisions" in content
+    assert "old" not in content
+
+
+def test_missing_section_rejects_the_whole_batch(project):
+    result = update_section(
+        {
+            "document_path": ".agent/design.md",
+            "sections": {"overview": "new overview", "nope": "x"},
+        }
+    )
+
+    assert result["success"] is False
+    assert result["missing"] == ["nope"]
+    assert (project / ".agent" / "design.md").read_text(encoding="utf-8") == DOCUMENT
+
+
+def test_overlapping_sections_are_rejected():
+    content, updated, missing = replace_editable_sections(NESTED, {"outer": "a", "inner": "b"})
+
+    assert content == NESTED
+    assert updated == []
+    assert sorted(missing) == ["inner", "outer"]
+
+
+def test_failed_write_keeps_the_original_file(tmp_path: Path, monkeypatch):
+    path = tmp_path / "design.md"
+    path.write_text(DOCUMENT, encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(documents.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        write_text_atomic(path, "partial")
+
+    assert path.read_text(encoding="utf-8") == DOCUMENT
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,49 @@
+"""Tests for document validation."""
+
+from pathlib import Path
+
+import pytest
+
+from byebye_docs_mcp.validation import validate_all_documents, validate_document_file
+
+ARCHITECTURE = 'version: "1.0"\nsystem:\n  name: demo\n'
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """A project with one valid and one undecodable document."""
+    agent = tmp_path / ".agent"
+    agent.mkdir()
+    (agent / "architecture.yaml").write_text(ARCHITECTURE, encoding="utf-8")
+    (agent / "context.yaml").write_bytes(b"\xff\xfe not utf-8")
+    return tmp_path
+
+
+def test_undecodable_document_is_reported_not_raised(project):
+    report = validate_all_documents(project)
+
+    documents = {d["path"]: d for d in report["documents"]}
+    assert documents[".agent/architecture.yaml"]["valid"] is True
+    assert documents[".agent/context.yaml"]["valid"] is False
+    assert "Could not read document" in documents[".agent/context.yaml"]["errors"][0]
+    assert report["valid"] is False
+
+
+def test_missing_document_returns_none(project):
+    assert validate_document_file(project, ".agent/nope.yaml") is None
+
+
+@pytest.mark.parametrize("directory", [".agent", ".agent/", "./.agent", "{root}/.agent"])
+def test_directory_spellings_report_the_same_missing_files(project, directory):
+    report = validate_all_documents(project, directory.format(root=project))
+
+    assert report["missing_required"] == [
+        ".agent/manifest.yaml",
+        ".agent/constraints.yaml",
+        ".agent/codegen.yaml",
+    ]
+
+
+def test_directory_outside_project_is_rejected(project):
+    with pytest.raises(ValueError, match="outside the project"):
+        validate_all_documents(project, "..")